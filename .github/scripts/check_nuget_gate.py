@@ -34,28 +34,143 @@ That only works if nobody ever changes a pin without bumping the define. This sc
 Usage:
     python .github/scripts/check_nuget_gate.py           # verify (CI)
     python .github/scripts/check_nuget_gate.py --write   # re-bless after a deliberate bump
+    python .github/scripts/check_nuget_gate.py --timings -   # per-phase timing JSON on stderr
+    python .github/scripts/check_nuget_gate.py --no-cache    # re-parse every file
+    python .github/scripts/check_nuget_gate.py --git         # only files tracked by git
+    python .github/scripts/check_nuget_gate.py --staged      # pre-commit: staged changes only
+    python .github/scripts/check_nuget_gate.py --since origin/main   # PR: changes since the base
+    python .github/scripts/check_nuget_gate.py --list-checks # the registered checks
+    python .github/scripts/check_nuget_gate.py --check asmdef_generation -v   # one check, timed
+
+--staged and --since re-check only the asmdefs and ProjectSettings.asset files that changed
+(the lock digest is always verified). They fall back to a full scan of the tracked files
+when NuGetConfig.cs, the lock file or this script changed, and to a plain tree walk when
+git is not available.
+
+What was extracted from each asmdef and ProjectSettings.asset is cached in
+.github/scripts/.cache/, keyed by path + mtime + size, so a warm run only stats the files.
+The whole cache is dropped when the defines in NuGetConfig.cs change.
+
+Each invariant is a check registered with @register_check, declaring the file kinds it reads.
+The tree is walked once for the kinds of all selected checks, and the checks then run
+concurrently on a thread pool over that shared index; their problems are reported in
+registration order and each check's time is recorded as a "check:<name>" phase. A new
+invariant is one more decorated function, not another walk of the tree.
 """
 
 import argparse
+import contextlib
+import cProfile
 import hashlib
 import json
+import mmap
 import os
+import pstats
 import re
+import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 NUGET_CONFIG = os.path.join(
     REPO_ROOT, "Unity-MCP-Plugin", "Packages", "com.ivanmurzak.unity.mcp",
     "Editor", "DependencyResolver", "NuGetConfig.cs")
 LOCK_PATH = os.path.join(REPO_ROOT, ".github", "nuget-gate.lock")
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache",
+                          "check_nuget_gate.json")
+# Bump whenever what the extractors store changes shape or meaning.
+CACHE_FORMAT_VERSION = 2
+# Same shape as the --timings summary of the tools in commands/tools.
+TIMING_FORMAT_VERSION = 1
+# Number of functions listed on stderr after a --profile run.
+PROFILE_TOP_FUNCTIONS = 25
 
 # Directories that hold a Unity project whose ProjectSettings must carry the gate defines.
 SCAN_ROOTS = ["Unity-MCP-Plugin", "Unity-Tests"]
+# Directory names never descended into: VCS metadata and Unity/.NET build output.
+SKIP_DIRS = frozenset((".git", "Library", "Temp", "obj"))
 
 PIN_RE = re.compile(r'new\s+NuGetPackage\(\s*"([^"]+)"\s*,\s*"([^"]+)"')
 READY_RE = re.compile(r'ReadyDefine\s*=\s*"([^"]+)"')
 GEN_PREFIX_RE = re.compile(r'DependencyGenerationDefinePrefix\s*=\s*"([^"]+)"')
 GEN_SUFFIX_RE = re.compile(r'DependencyGenerationDefine\s*=\s*DependencyGenerationDefinePrefix\s*\+\s*"([^"]+)"')
+# The `scriptingDefineSymbols:` key of ProjectSettings.asset (an empty map is written inline as {}).
+DEFINES_KEY_RE = re.compile(rb"^([ \t]*)scriptingDefineSymbols:[ \t]*(\{[ \t]*\})?[ \t]*\r?$", re.M)
+
+
+class PhaseTimer:
+    """
+    Wall-clock and CPU time per named phase, for --timings.
+
+    Kept local so the gate depends on nothing outside .github/scripts; phases may be
+    timed from the check threads at once.
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add(self, name, wall, cpu):
+        with self._lock:
+            entry = self.phases.setdefault(name, {"wall": 0.0, "cpu": 0.0, "calls": 0})
+            entry["wall"] += wall
+            entry["cpu"] += cpu
+            entry["calls"] += 1
+
+    def summary(self, tool):
+        return {
+            "version": TIMING_FORMAT_VERSION,
+            "tool": tool,
+            "pid": os.getpid(),
+            "totalWallSeconds": round(time.perf_counter() - self.started, 6),
+            "totalCpuSeconds": round(time.process_time(), 6),
+            "phases": [
+                {"name": name, "calls": entry["calls"], "wallSeconds": round(entry["wall"], 6),
+                 "cpuSeconds": round(entry["cpu"], 6)}
+                for name, entry in self.phases.items()
+            ],
+        }
+
+
+TIMER = PhaseTimer()
+
+
+@contextlib.contextmanager
+def phase(name):
+    """Time the enclosed block as one call of phase `name`."""
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    try:
+        yield
+    finally:
+        TIMER.add(name, time.perf_counter() - wall, time.process_time() - cpu)
+
+
+@contextlib.contextmanager
+def instrumented(args, tool):
+    """Run the enclosed block under --profile; write the --timings summary even on sys.exit()."""
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+            pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(
+                PROFILE_TOP_FUNCTIONS)
+            sys.stderr.write("Profile written to %s\n" % args.profile)
+        if args.timings:
+            text = json.dumps(TIMER.summary(tool), indent=2) + "\n"
+            if args.timings == "-":
+                sys.stderr.write(text)
+            else:
+                with open(args.timings, "w", encoding="utf-8", newline="\n") as handle:
+                    handle.write(text)
 
 
 def read(path):
@@ -88,65 +203,501 @@ def pins_digest(pins):
     return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
 
-def iter_files(suffixes):
-    for scan_root in SCAN_ROOTS:
-        root = os.path.join(REPO_ROOT, scan_root)
-        if not os.path.isdir(root):
-            continue
-        for dirpath, dirnames, filenames in os.walk(root):
-            dirnames[:] = [d for d in dirnames if d not in (".git", "Library", "Temp", "obj")]
-            for name in filenames:
-                if name.endswith(suffixes):
-                    yield os.path.join(dirpath, name)
+class FileIndex:
+    """
+    Every file under SCAN_ROOTS that a check may need, bucketed by suffix.
+
+    The trees are walked once, with os.scandir, no matter how many checks read the index;
+    a check asks for `index.files(".asmdef")` instead of walking the tree itself.
+    from_paths() builds the same index from a list of paths (e.g. from git) instead.
+    The suffixes default to the file kinds of all registered checks; each file lands in
+    the bucket of the first suffix it ends with.
+    """
+
+    def __init__(self, roots=SCAN_ROOTS, suffixes=None, walk=True):
+        self.suffixes = index_suffixes(CHECKS) if suffixes is None else tuple(suffixes)
+        self.buckets = {suffix: [] for suffix in self.suffixes}
+        self.directories = 0
+        if walk:
+            for scan_root in roots:
+                root = os.path.join(REPO_ROOT, scan_root)
+                if os.path.isdir(root):
+                    self._walk(root)
+        for paths in self.buckets.values():
+            paths.sort()
+
+    @classmethod
+    def from_paths(cls, paths, roots=SCAN_ROOTS, suffixes=None):
+        """Index repo-relative paths ('/'-separated, as git prints them) that exist on disk."""
+        index = cls(roots, suffixes, walk=False)
+        prefixes = tuple(root.rstrip("/") + "/" for root in roots)
+        for path in paths:
+            if not path.startswith(prefixes) or not path.endswith(index.suffixes):
+                continue
+            if SKIP_DIRS.intersection(path.split("/")[:-1]):
+                continue
+            full_path = os.path.join(REPO_ROOT, *path.split("/"))
+            if not os.path.isfile(full_path):
+                continue  # deleted in the working tree
+            for suffix in index.suffixes:
+                if path.endswith(suffix):
+                    index.buckets[suffix].append(full_path)
+                    break
+        for bucket in index.buckets.values():
+            bucket.sort()
+        return index
+
+    def _walk(self, root):
+        suffixes = self.suffixes
+        buckets = self.buckets
+        pending = [root]
+        while pending:
+            directory = pending.pop()
+            self.directories += 1
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue  # vanished or unreadable; nothing of ours lives there
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in SKIP_DIRS:
+                            pending.append(entry.path)
+                    elif name.endswith(suffixes):
+                        for suffix in suffixes:
+                            if name.endswith(suffix):
+                                buckets[suffix].append(entry.path)
+                                break
+
+    def files(self, suffix):
+        """Sorted paths of the indexed files ending with suffix (one of the index suffixes)."""
+        return self.buckets[suffix]
+
+    def __len__(self):
+        return sum(len(paths) for paths in self.buckets.values())
+
+
+def git(*args):
+    """Run a git command in the repository; returns stdout. Raises OSError or
+    subprocess.CalledProcessError if git is missing or fails."""
+    return subprocess.run(["git", "-C", REPO_ROOT] + list(args), check=True,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE).stdout.decode("utf-8")
+
+
+def git_paths(*args):
+    """Repo-relative paths printed NUL-separated by a git command (which must pass -z)."""
+    return [path for path in git(*args).split("\0") if path]
+
+
+def changed_paths(since=None, staged=False):
+    """
+    Repo-relative paths changed in the commit being made (staged) or since the merge base
+    of HEAD and `since`, including uncommitted changes.
+    """
+    if staged:
+        return git_paths("diff", "--cached", "--name-only", "-z", "--no-renames")
+    base = git("merge-base", since, "HEAD").strip()
+    return git_paths("diff", "--name-only", "-z", "--no-renames", base)
+
+
+# Changing any of these can change the verdict for files that did not change themselves.
+FULL_SCAN_TRIGGERS = (NUGET_CONFIG, LOCK_PATH, os.path.abspath(__file__))
+
+
+def build_index(args, suffixes=None):
+    """
+    Build the file index for the selected scan mode, holding the given file kinds.
+
+    Returns:
+        (FileIndex, description of what was scanned), where the description is None for a
+        full scan
+    """
+    if not (args.git or args.staged or args.since):
+        return FileIndex(suffixes=suffixes), None
+    try:
+        tracked = git_paths("ls-files", "-z", "--", *SCAN_ROOTS)
+        if not (args.staged or args.since):
+            return FileIndex.from_paths(tracked, suffixes=suffixes), None
+        changed = changed_paths(args.since, args.staged)
+    except (OSError, subprocess.CalledProcessError) as e:
+        detail = e.stderr.decode("utf-8", "replace").strip() if getattr(e, "stderr", None) else e
+        print("warning: git failed (%s); scanning the whole tree" % detail, file=sys.stderr)
+        return FileIndex(suffixes=suffixes), None
+
+    triggers = {os.path.relpath(path, REPO_ROOT).replace(os.sep, "/")
+                for path in FULL_SCAN_TRIGGERS}
+    if triggers.intersection(changed):
+        return FileIndex.from_paths(tracked, suffixes=suffixes), None
+    index = FileIndex.from_paths(changed, suffixes=suffixes)
+    return index, "%d changed file(s)" % len(index)
+
+
+class ParseCache:
+    """
+    Persistent cache of what was extracted from each file, keyed by path + mtime + size.
+
+    Extracted values must be JSON-serializable. The cache belongs to one pair of gate defines:
+    when NuGetConfig.cs changes them it starts empty, and entries of files that were not looked
+    up in a run (deleted or moved files) are dropped on save. lookup() may be called from
+    several checks at once; the files are parsed outside the lock.
+    """
+
+    def __init__(self, path, defines):
+        self.path = path
+        self.defines = list(defines)
+        self.entries = {}
+        self.seen = set()
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+        self._lock = threading.Lock()
+        try:
+            with open(path, encoding="utf-8") as handle:
+                data = json.load(handle)
+            if data.get("version") == CACHE_FORMAT_VERSION and data.get("defines") == self.defines:
+                self.entries = data.get("entries", {})
+            else:
+                self.dirty = True
+        except (OSError, ValueError, AttributeError):
+            self.entries = {}  # missing or corrupt cache - start from scratch
+
+    def lookup(self, path, extract):
+        """Return extract(path), reusing the cached value while the file is unchanged."""
+        key = os.path.relpath(path, REPO_ROOT)
+        stat = os.stat(path)
+        with self._lock:
+            self.seen.add(key)
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+        value = extract(path)
+        with self._lock:
+            self.entries[key] = [stat.st_mtime_ns, stat.st_size, value]
+            self.dirty = True
+        return value
+
+    def save(self, prune=True):
+        """Write the cache; with prune, first drop the entries not looked up in this run."""
+        stale = [key for key in self.entries if key not in self.seen] if prune else []
+        for key in stale:
+            del self.entries[key]
+        if not (self.dirty or stale):
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8", newline="\n") as handle:
+            json.dump({"version": CACHE_FORMAT_VERSION, "defines": self.defines,
+                       "entries": self.entries}, handle)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+
+def extract_define_constraints(path):
+    """An asmdef's defineConstraints, or None if the asmdef is not valid JSON."""
+    with phase("parse_asmdef"):
+        try:
+            data = json.loads(read(path))
+        except ValueError:
+            return None
+    constraints = data.get("defineConstraints") if isinstance(data, dict) else None
+    return constraints or []
 
 
-def check_propagation(ready_define, generation_define):
-    """Every place gated on the ready define must also carry the current generation define."""
-    problems = []
+def read_scripting_defines(path):
+    """
+    Per-platform scripting define symbols of a ProjectSettings.asset.
+
+    The file is memory-mapped and searched for the `scriptingDefineSymbols:` key; only the
+    entries of that block are decoded, e.g.
 
-    for path in iter_files((".asmdef",)):
+        scriptingDefineSymbols:
+          Standalone: FOO;UNITY_MCP_READY
+          Android: FOO
+
+    Returns:
+        {platform: (line number, set of symbols)} in file order; empty if there is no block
+    """
+    with open(path, "rb") as handle:
         try:
-            data = json.loads(read(path))
+            data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
         except ValueError:
+            return {}  # empty file
+        with data:
+            match = DEFINES_KEY_RE.search(data)
+            if match is None or match.group(2):
+                return {}
+            key_indent = len(match.group(1))
+            lineno = data[:match.start()].count(b"\n") + 1
+            defines = {}
+            pos = match.end() + 1
+            while pos < len(data):
+                end = data.find(b"\n", pos)
+                if end == -1:
+                    end = len(data)
+                line = data[pos:end].rstrip(b"\r").decode("utf-8")
+                pos = end + 1
+                lineno += 1
+                entry = line.lstrip(" ")
+                if not entry or len(line) - len(entry) <= key_indent:
+                    break  # dedent: the block is over
+                platform, _, value = entry.partition(":")
+                defines[platform.strip()] = (lineno, {symbol for symbol in value.strip().split(";")
+                                                      if symbol})
+    return defines
+
+
+def extract_scripting_defines(path):
+    """read_scripting_defines() in the JSON form stored by ParseCache:
+    {platform: [line number, sorted symbols]}."""
+    with phase("read_project_settings"):
+        defines = read_scripting_defines(path)
+    return {platform: [lineno, sorted(symbols)] for platform, (lineno, symbols) in defines.items()}
+
+
+class Check:
+    """A registered invariant: a function of a GateContext returning a list of problem strings."""
+
+    def __init__(self, name, func, kinds, on_write):
+        self.name = name
+        self.func = func
+        self.kinds = tuple(kinds)
+        self.on_write = on_write
+        self.description = (func.__doc__ or "").strip().split("\n")[0]
+
+
+# Registered checks, in the order their problems are reported.
+CHECKS = []
+
+
+def register_check(name, kinds=(), on_write=True):
+    """
+    Register the decorated function as a gate check.
+
+    Args:
+        name: Unique check name, as used by --check and in the "check:<name>" timing phase
+        kinds: File suffixes the check reads with context.index.files(); the index collects
+            the kinds of all selected checks in a single walk
+        on_write: Whether the check must also pass before --write re-blesses the lock
+    """
+    def decorator(func):
+        if any(check.name == name for check in CHECKS):
+            raise ValueError("gate check %r is registered twice" % name)
+        CHECKS.append(Check(name, func, kinds, on_write))
+        return func
+    return decorator
+
+
+def index_suffixes(checks):
+    """The file kinds the checks read, each once, in registration order."""
+    suffixes = []
+    for check in checks:
+        suffixes.extend(kind for kind in check.kinds if kind not in suffixes)
+    return tuple(suffixes)
+
+
+class GateContext:
+    """What every check runs on: the NuGetConfig values, the lock, the file index and the cache."""
+
+    def __init__(self, ready_define, generation_define, pins, digest, lock, index, cache=None):
+        self.ready_define = ready_define
+        self.generation_define = generation_define
+        self.pins = pins
+        self.digest = digest
+        self.lock = lock
+        self.index = index
+        self.cache = cache
+
+    def extracted(self, path, extract):
+        """extract(path), through the parse cache when there is one."""
+        return self.cache.lookup(path, extract) if self.cache is not None else extract(path)
+
+
+def run_check(check, context):
+    """Run one check; returns (problems, wall seconds, thread CPU seconds)."""
+    wall = time.perf_counter()
+    cpu = time.thread_time()
+    try:
+        problems = list(check.func(context))
+    except Exception as e:  # a broken check must not hide what the others found
+        problems = ["%s: check crashed: %s: %s" % (check.name, type(e).__name__, e)]
+    return problems, time.perf_counter() - wall, time.thread_time() - cpu
+
+
+def run_checks(checks, context, jobs=None):
+    """
+    Run the checks concurrently on a thread pool over the shared context.
+
+    Each check's time is added to the phase timer as "check:<name>".
+
+    Returns:
+        [(check, problems, wall seconds)] in registration order
+    """
+    if jobs == 1 or len(checks) < 2:
+        outcomes = [run_check(check, context) for check in checks]
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            outcomes = list(pool.map(run_check, checks, [context] * len(checks)))
+    results = []
+    for check, (problems, wall, cpu) in zip(checks, outcomes):
+        TIMER.add("check:" + check.name, wall, cpu)
+        results.append((check, problems, wall))
+    return results
+
+
+@register_check("lock_digest", on_write=False)
+def check_lock_digest(context):
+    """The pinned NuGet set and generation define match the blessed pair in the lock."""
+    lock = context.lock
+    if lock.get("pinsSha256") != context.digest and \
+            lock.get("dependencyGenerationDefine") == context.generation_define:
+        return [
+            "The pinned NuGet set changed but NuGetConfig.DependencyGenerationDefine is still %r.\n"
+            "      A consumer upgrading from the previous release still has the OLD DLLs on disk and\n"
+            "      the gate defines already set, so Unity would compile the new sources against them\n"
+            "      and dead-lock in Safe Mode (issue #957).\n"
+            "      Fix: bump DependencyGenerationDefine, propagate it to every asmdef +\n"
+            "      ProjectSettings.asset, then run: python .github/scripts/check_nuget_gate.py --write"
+            % context.generation_define]
+    if lock.get("pinsSha256") != context.digest or \
+            lock.get("dependencyGenerationDefine") != context.generation_define:
+        return [
+            "%s is stale (pins and/or generation define changed).\n"
+            "      Re-bless with: python .github/scripts/check_nuget_gate.py --write"
+            % os.path.relpath(LOCK_PATH, REPO_ROOT)]
+    return []
+
+
+@register_check("asmdef_generation", kinds=(".asmdef",))
+def check_asmdef_generation(context):
+    """Every asmdef gated on the ready define is also gated on the generation define."""
+    problems = []
+    for path in context.index.files(".asmdef"):
+        constraints = context.extracted(path, extract_define_constraints)
+        if constraints is None:
             continue  # not our business to police unrelated malformed asmdefs
-        constraints = data.get("defineConstraints") or []
-        if ready_define not in constraints:
+        if context.ready_define not in constraints:
             continue
-        if generation_define not in constraints:
+        if context.generation_define not in constraints:
             problems.append("%s: defineConstraints has %r but not %r"
-                            % (os.path.relpath(path, REPO_ROOT), ready_define, generation_define))
+                            % (os.path.relpath(path, REPO_ROOT), context.ready_define,
+                               context.generation_define))
+    return problems
 
-    for path in iter_files(("ProjectSettings.asset",)):
-        for lineno, line in enumerate(read(path).splitlines(), 1):
-            # scriptingDefineSymbols entries look like:  `    Standalone: FOO;UNITY_MCP_READY`
-            if ready_define not in line:
-                continue
-            symbols = line.split(":", 1)[-1].strip().split(";")
-            if ready_define not in symbols:
+
+@register_check("project_settings_generation", kinds=("ProjectSettings.asset",))
+def check_project_settings_generation(context):
+    """Every scripting-define entry carrying the ready define carries the generation define."""
+    problems = []
+    for path in context.index.files("ProjectSettings.asset"):
+        for lineno, symbols in context.extracted(path, extract_scripting_defines).values():
+            if context.ready_define not in symbols:
                 continue
-            if generation_define not in symbols:
+            if context.generation_define not in symbols:
                 problems.append("%s:%d: scripting defines carry %r but not %r"
                                 % (os.path.relpath(path, REPO_ROOT), lineno,
-                                   ready_define, generation_define))
-
+                                   context.ready_define, context.generation_define))
     return problems
 
 
+def print_check_results(results):
+    """One line per check: name, verdict and time."""
+    width = max(len(check.name) for check, _, _ in results)
+    for check, problems, wall in results:
+        verdict = "%d problem(s)" % len(problems) if problems else "ok"
+        print("  %-*s  %-12s %8.1f ms" % (width, check.name, verdict, wall * 1000))
+
+
 def main():
     parser = argparse.ArgumentParser(description=__doc__,
                                      formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument("--write", action="store_true",
                         help="re-bless the lock after a deliberate pin + generation bump")
+    parser.add_argument("--git", action="store_true",
+                        help="take the candidate files from the git index instead of walking "
+                             "the tree (ignores untracked files)")
+    scope = parser.add_mutually_exclusive_group()
+    scope.add_argument("--staged", action="store_true",
+                       help="pre-commit mode: only re-check staged files (implies --git)")
+    scope.add_argument("--since", metavar="REF", default=None,
+                       help="PR mode: only re-check files changed since the merge base with REF "
+                            "(implies --git)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="re-parse every file, ignoring and not updating the parse cache")
+    parser.add_argument("--cache-file", default=CACHE_PATH, metavar="PATH",
+                        help="parse cache location (default: .github/scripts/.cache/"
+                             "check_nuget_gate.json)")
+    parser.add_argument("--check", action="append", metavar="NAME",
+                        choices=[check.name for check in CHECKS],
+                        help="run only this check (repeatable; see --list-checks)")
+    parser.add_argument("--list-checks", action="store_true",
+                        help="list the registered checks and the file kinds they read, then exit")
+    parser.add_argument("-j", "--jobs", type=int, default=None, metavar="N",
+                        help="threads to run the checks on (default: one per check, "
+                             "bounded by the CPU count + 4)")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="print each check's verdict and time")
+    parser.add_argument("--timings", metavar="PATH", default=None,
+                        help="write a JSON summary of per-phase wall/CPU time to PATH "
+                             "('-' for stderr)")
+    parser.add_argument("--profile", metavar="PATH", default=None,
+                        help="run under cProfile and dump the stats to PATH (pstats format); "
+                             "the slowest functions are listed on stderr")
     args = parser.parse_args()
 
-    ready_define, generation_define, pins = parse_config()
-    digest = pins_digest(pins)
+    if args.list_checks:
+        for check in CHECKS:
+            kinds = ", ".join(check.kinds) or "-"
+            print("%-30s %-30s %s" % (check.name, kinds, check.description))
+        return 0
+
+    with instrumented(args, "check_nuget_gate"):
+        return run(args)
+
 
-    failures = list(check_propagation(ready_define, generation_define))
+def run(args):
+    """Verify (or with --write, re-bless) the gate; returns the process exit code."""
+    with phase("parse_config"):
+        ready_define, generation_define, pins = parse_config()
+        digest = pins_digest(pins)
 
     lock = None
     if os.path.exists(LOCK_PATH):
         lock = json.loads(read(LOCK_PATH))
+    if lock is None and not args.write:
+        print("FAIL: %s is missing. Create it with:\n"
+              "  python .github/scripts/check_nuget_gate.py --write"
+              % os.path.relpath(LOCK_PATH, REPO_ROOT))
+        return 1
+
+    checks = [check for check in CHECKS
+              if (not args.check or check.name in args.check)
+              and (check.on_write or not args.write)]
+
+    with phase("index_files"):
+        index, scope = build_index(args, index_suffixes(checks))
+
+    cache = None
+    if not args.no_cache:
+        with phase("cache_load"):
+            cache = ParseCache(args.cache_file, (ready_define, generation_define))
+
+    context = GateContext(ready_define, generation_define, pins, digest, lock, index, cache)
+    with phase("checks"):
+        results = run_checks(checks, context, args.jobs)
+    failures = [problem for _, problems, _ in results for problem in problems]
+
+    if cache is not None:
+        with phase("cache_save"):
+            try:
+                cache.save(prune=scope is None and not args.check)
+            except OSError as e:
+                print("warning: could not write the parse cache: %s" % e, file=sys.stderr)
+
+    if args.verbose:
+        print_check_results(results)
 
     if args.write:
         if failures:
@@ -175,37 +726,14 @@ def main():
         print("Blessed %s with %d pins (%s)." % (generation_define, len(pins), digest[:12]))
         return 0
 
-    if lock is None:
-        print("FAIL: %s is missing. Create it with:\n"
-              "  python .github/scripts/check_nuget_gate.py --write"
-              % os.path.relpath(LOCK_PATH, REPO_ROOT))
-        return 1
-
-    if lock.get("pinsSha256") != digest and \
-            lock.get("dependencyGenerationDefine") == generation_define:
-        failures.insert(0,
-            "The pinned NuGet set changed but NuGetConfig.DependencyGenerationDefine is still %r.\n"
-            "      A consumer upgrading from the previous release still has the OLD DLLs on disk and\n"
-            "      the gate defines already set, so Unity would compile the new sources against them\n"
-            "      and dead-lock in Safe Mode (issue #957).\n"
-            "      Fix: bump DependencyGenerationDefine, propagate it to every asmdef +\n"
-            "      ProjectSettings.asset, then run: python .github/scripts/check_nuget_gate.py --write"
-            % generation_define)
-    elif lock.get("pinsSha256") != digest or \
-            lock.get("dependencyGenerationDefine") != generation_define:
-        failures.insert(0,
-            "%s is stale (pins and/or generation define changed).\n"
-            "      Re-bless with: python .github/scripts/check_nuget_gate.py --write"
-            % os.path.relpath(LOCK_PATH, REPO_ROOT))
-
     if failures:
         print("NuGet gate check FAILED:")
         for problem in failures:
             print("  - " + problem)
         return 1
 
-    print("NuGet gate OK: %d pins, generation %s, propagation consistent."
-          % (len(pins), generation_define))
+    print("NuGet gate OK: %d pins, generation %s, %d check(s) passed%s."
+          % (len(pins), generation_define, len(results), " in %s" % scope if scope else ""))
     return 0
 
 
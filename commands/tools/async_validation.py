@@ -0,0 +1,232 @@
+"""
+Async Validation Engine
+Submits chunks of OpenAI-format tools concurrently through one shared AsyncOpenAI client
+(and therefore one pooled HTTP connection pool). Requests are limited by a concurrency
+cap and a token-bucket rate limiter, and 429/5xx/connection errors are retried with
+Retry-After aware exponential backoff, so large catalogs are bound by the rate limit
+instead of per-request latency.
+"""
+
+import asyncio
+import random
+import time
+
+try:
+    from openai import APIConnectionError, APIStatusError
+except ImportError:
+    APIConnectionError = APIStatusError = None
+
+# HTTP status codes meaning "the request itself is invalid" rather than a transient failure
+REJECTION_STATUS_CODES = (400, 422)
+# Status codes worth retrying besides 5xx
+RETRY_STATUS_CODES = (408, 409, 429)
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_CHUNK_SIZE = 16
+DEFAULT_MAX_RETRIES = 5
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter for asyncio.
+
+    Tokens are refilled continuously at `rate` per second up to `burst`; each
+    acquire() takes one token, sleeping until one is available.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds):
+        """Drain the bucket so no request starts for `seconds` (e.g. after a 429)."""
+        self._tokens = min(self._tokens, -seconds * self.rate)
+        self._updated = time.monotonic()
+
+
+def retry_after_seconds(error):
+    """Return the server-requested delay from Retry-After(-ms) headers, or None."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    for name, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return max(0.0, float(value) * scale)
+        except ValueError:
+            continue  # HTTP-date form; fall back to exponential backoff
+    return None
+
+
+def rejection_message(error):
+    """Return the API's message if `error` rejects the request itself (400/422), else None."""
+    if APIStatusError is None or not isinstance(error, APIStatusError):
+        return None
+    if error.status_code not in REJECTION_STATUS_CODES:
+        return None
+    body = error.body if isinstance(error.body, dict) else {}
+    return body.get("message") or str(error)
+
+
+def is_retryable(error):
+    """True for rate limits, server errors and connection failures."""
+    if APIStatusError is not None and isinstance(error, APIStatusError):
+        return error.status_code in RETRY_STATUS_CODES or error.status_code >= 500
+    return APIConnectionError is not None and isinstance(error, APIConnectionError)
+
+
+class AsyncToolValidator:
+    """
+    Concurrent tool submission with rate limiting and retries.
+
+    Args:
+        client: AsyncOpenAI client shared by every request
+        model: Model to validate against
+        concurrency: Maximum number of requests in flight
+        rate: Maximum requests per second (None for no limit)
+        max_retries: Retries per request for retryable errors
+    """
+
+    def __init__(self, client, model, concurrency=DEFAULT_CONCURRENCY, rate=None,
+                 max_retries=DEFAULT_MAX_RETRIES):
+        self.client = client
+        self.model = model
+        self.max_retries = max_retries
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._bucket = TokenBucket(rate) if rate else None
+        self.requests = 0
+        self.retries = 0
+
+    async def submit(self, tools_list):
+        """
+        Send tools in a single request, retrying transient failures.
+
+        Returns:
+            None if the tools were accepted, otherwise the API's rejection message
+
+        Raises:
+            Non-retryable errors, or the last error once retries are exhausted
+        """
+        attempt = 0
+        while True:
+            if self._bucket:
+                await self._bucket.acquire()
+            try:
+                async with self._semaphore:
+                    self.requests += 1
+                    await self.client.chat.completions.create(
+                        model=self.model,
+                        messages=[{"role": "user", "content": "Hello"}],
+                        tools=tools_list,
+                        tool_choice="none"
+                    )
+                return None
+            except Exception as e:
+                message = rejection_message(e)
+                if message is not None:
+                    return message
+                if not is_retryable(e) or attempt >= self.max_retries:
+                    raise
+                delay = retry_after_seconds(e)
+                if delay is None:
+                    delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.0)
+                if self._bucket:
+                    self._bucket.pause(delay)
+                attempt += 1
+                self.retries += 1
+                await asyncio.sleep(delay)
+
+    async def bisect(self, tools_list, positions, error_message):
+        """
+        Isolate the rejected tools among `positions`, submitting both halves concurrently.
+
+        Returns:
+            List of (tool positions, rejection message)
+        """
+        if len(positions) == 1:
+            return [(positions, error_message)]
+        middle = len(positions) // 2
+        halves = (positions[:middle], positions[middle:])
+        errors = await asyncio.gather(
+            *(self.submit([tools_list[i] for i in half]) for half in halves))
+        rejected = [(half, error) for half, error in zip(halves, errors) if error is not None]
+        if not rejected:
+            return [(positions, error_message)]
+        nested = await asyncio.gather(*(self.bisect(tools_list, half, error)
+                                        for half, error in rejected))
+        return [rejection for group in nested for rejection in group]
+
+    async def validate_chunk(self, tools_list, positions, bisect):
+        error_message = await self.submit([tools_list[i] for i in positions])
+        if error_message is None:
+            return []
+        if bisect:
+            return await self.bisect(tools_list, positions, error_message)
+        return [(positions, error_message)]
+
+    async def validate(self, tools_list, chunk_size=DEFAULT_CHUNK_SIZE, bisect=False):
+        """
+        Validate tools in chunks of `chunk_size`, all chunks scheduled concurrently.
+
+        Args:
+            tools_list: Tools in OpenAI function-calling format
+            chunk_size: Tools per request
+            bisect: Bisect rejected chunks down to the offending tool(s)
+
+        Returns:
+            Sorted list of (tool positions, rejection message)
+        """
+        chunk_size = max(1, chunk_size)
+        chunks = [list(range(start, min(start + chunk_size, len(tools_list))))
+                  for start in range(0, len(tools_list), chunk_size)]
+        results = await asyncio.gather(
+            *(self.validate_chunk(tools_list, chunk, bisect) for chunk in chunks))
+        return sorted(rejection for result in results for rejection in result)
+
+
+def validate_tools_concurrently(client, tools_list, model, chunk_size=DEFAULT_CHUNK_SIZE,
+                                concurrency=DEFAULT_CONCURRENCY, rate=None, bisect=False,
+                                max_retries=DEFAULT_MAX_RETRIES):
+    """
+    Synchronous entry point: run AsyncToolValidator.validate on a fresh event loop.
+
+    Args:
+        client: AsyncOpenAI client (closed when done)
+        tools_list: Tools in OpenAI function-calling format
+        model: Model to validate against
+        chunk_size: Tools per request
+        concurrency: Maximum number of requests in flight
+        rate: Maximum requests per second (None for no limit)
+        bisect: Bisect rejected chunks down to the offending tool(s)
+        max_retries: Retries per request for retryable errors
+
+    Returns:
+        Tuple of (sorted list of (tool positions, rejection message), validator with
+        request/retry counters)
+    """
+    async def run():
+        async with client:
+            validator = AsyncToolValidator(client, model, concurrency, rate, max_retries)
+            rejections = await validator.validate(tools_list, chunk_size, bisect)
+            return rejections, validator
+
+    return asyncio.run(run())
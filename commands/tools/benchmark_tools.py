@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Python Tooling Benchmarks
+Times the hot paths of the tool validators on synthetic tool catalogs.
+
+Catalogs of increasing size and depth are generated from the shapes in mcpTool.json
+(a tools/list dump) and 1.json (a standalone schema), using a fixed seed so every run
+measures exactly the same input. Each case times:
+    json_load     - json.loads of the serialized catalog
+    json_dump     - json.dumps of the catalog
+    convert       - convert_mcp_to_openai_tool over every tool
+    check_schema  - get_validator_for_schema + check_schema over every inputSchema
+
+Results are written as JSON so runs can be compared across releases.
+
+Usage:
+    python benchmark_tools.py                                # quick run, printed table
+    python benchmark_tools.py --iterations 20 -o bench.json  # fixed iterations, saved
+    python benchmark_tools.py --compare bench.json           # flag regressions vs a saved run
+"""
+
+import argparse
+import copy
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from mcp_catalog import convert_mcp_to_openai_tool, extract_mcp_tools
+from validate_json_schema import Colors, JSONSCHEMA_VERSION, get_validator_for_schema
+
+SCRIPT_DIR = Path(__file__).parent
+SEED_FILES = (SCRIPT_DIR / "mcpTool.json", SCRIPT_DIR / "1.json")
+
+# (tool count, extra nesting depth) combinations benchmarked by default
+DEFAULT_CASES = ((1, 0), (10, 2), (50, 2), (50, 6), (200, 4))
+DEFAULT_ITERATIONS = 3
+DEFAULT_SEED = 1234
+# A case is a regression when its median is this much slower than the baseline
+DEFAULT_REGRESSION_THRESHOLD = 0.20
+
+WORDS = ("asset", "scene", "object", "component", "prefab", "material", "path", "value",
+         "name", "type", "reference", "instance", "field", "property", "transform")
+
+
+def load_seed_schemas():
+    """Load the inputSchema shapes used to seed the synthetic catalogs."""
+    seeds = []
+    for path in SEED_FILES:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = json.load(f)
+        tools = extract_mcp_tools(content)
+        schemas = [t["inputSchema"] for t in tools if isinstance(t, dict) and "inputSchema" in t]
+        seeds.extend(schemas or [content])
+    return seeds
+
+
+def nest_schema(schema, depth, rng):
+    """Wrap the schema's properties in `depth` extra levels of nested objects."""
+    for _ in range(depth):
+        name = rng.choice(WORDS) + str(rng.randrange(100))
+        schema = {
+            **{k: v for k, v in schema.items() if k in ("$schema", "$defs", "definitions")},
+            "type": "object",
+            "properties": {
+                name: {
+                    "type": "object",
+                    "properties": schema.get("properties", {}),
+                    "required": schema.get("required", []),
+                    "description": " ".join(rng.choice(WORDS) for _ in range(rng.randrange(4, 16))),
+                },
+            },
+            "required": [name],
+        }
+    return schema
+
+
+def generate_catalog(tool_count, depth, seed, seeds):
+    """
+    Generate a deterministic tools/list response.
+
+    Args:
+        tool_count: Number of tools
+        depth: Extra nesting depth added to every inputSchema
+        seed: Random seed
+        seeds: inputSchema shapes to start from
+
+    Returns:
+        Parsed tools/list response
+    """
+    rng = random.Random(seed * 1000003 + tool_count * 31 + depth)
+    tools = []
+    for i in range(tool_count):
+        schema = nest_schema(copy.deepcopy(seeds[i % len(seeds)]), depth, rng)
+        schema.pop("$schema", None)
+        tools.append({
+            "name": f"{rng.choice(WORDS).title()}_{rng.choice(WORDS).title()}_{i}",
+            "description": " ".join(rng.choice(WORDS) for _ in range(rng.randrange(8, 40))),
+            "inputSchema": schema,
+        })
+    return {"result": {"tools": tools}, "id": 1, "jsonrpc": "2.0"}
+
+
+def time_operation(operation, iterations):
+    """Run operation `iterations` times with GC disabled and return per-run seconds."""
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            operation()
+            timings.append(time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return timings
+
+
+def check_all_schemas(tools):
+    for tool in tools:
+        schema = tool["inputSchema"]
+        get_validator_for_schema(schema).check_schema(schema)
+
+
+def run_case(tool_count, depth, seed, seeds, iterations):
+    """Benchmark every operation on one synthetic catalog."""
+    catalog = generate_catalog(tool_count, depth, seed, seeds)
+    text = json.dumps(catalog)
+    tools = catalog["result"]["tools"]
+
+    operations = {
+        "json_load": lambda: json.loads(text),
+        "json_dump": lambda: json.dumps(catalog),
+        "convert": lambda: [convert_mcp_to_openai_tool(tool) for tool in tools],
+        "check_schema": lambda: check_all_schemas(tools),
+    }
+
+    results = {}
+    for name, operation in operations.items():
+        operation()  # warm-up, not recorded
+        timings = time_operation(operation, iterations)
+        results[name] = {
+            "min_ms": min(timings) * 1000,
+            "median_ms": statistics.median(timings) * 1000,
+            "mean_ms": statistics.fmean(timings) * 1000,
+        }
+    return {
+        "case": f"tools={tool_count},depth={depth}",
+        "tools": tool_count,
+        "depth": depth,
+        "catalogBytes": len(text.encode('utf-8')),
+        "operations": results,
+    }
+
+
+def environment_info():
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "jsonschema": JSONSCHEMA_VERSION,
+    }
+
+
+def print_results(cases):
+    print(f"{'Case':<22} {'Bytes':>11} {'Operation':<14} {'min ms':>10} {'median ms':>10} {'mean ms':>10}")
+    print("-" * 82)
+    for case in cases:
+        first = True
+        for name, timing in case["operations"].items():
+            label = case["case"] if first else ""
+            size = f"{case['catalogBytes']:,}" if first else ""
+            print(f"{label:<22} {size:>11} {name:<14} {timing['min_ms']:>10.3f} "
+                  f"{timing['median_ms']:>10.3f} {timing['mean_ms']:>10.3f}")
+            first = False
+
+
+def compare_results(cases, baseline, threshold):
+    """
+    Compare medians against a baseline run.
+
+    Returns:
+        List of regression messages
+    """
+    previous = {case["case"]: case for case in baseline.get("cases", [])}
+    regressions = []
+    for case in cases:
+        old = previous.get(case["case"])
+        if old is None:
+            continue
+        for name, timing in case["operations"].items():
+            old_timing = old["operations"].get(name)
+            if not old_timing or old_timing["median_ms"] <= 0:
+                continue
+            ratio = timing["median_ms"] / old_timing["median_ms"] - 1
+            if ratio > threshold:
+                regressions.append(f"{case['case']} {name}: {old_timing['median_ms']:.3f} ms -> "
+                                   f"{timing['median_ms']:.3f} ms (+{ratio:.0%})")
+    return regressions
+
+
+def parse_case(text):
+    tools, _, depth = text.partition("x")
+    return int(tools), int(depth or 0)
+
+
+def main():
+    """Main function to handle command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark the Python tool validators.")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS,
+                        help="timed runs per operation (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED,
+                        help="seed for the synthetic catalogs (default: %(default)s)")
+    parser.add_argument("--case", action="append", type=parse_case, metavar="TOOLSxDEPTH",
+                        help="benchmark case such as 100x4 (repeatable; default: "
+                             + ", ".join(f"{t}x{d}" for t, d in DEFAULT_CASES) + ")")
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="baseline results JSON to check for regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help="relative median slowdown that counts as a regression "
+                             "(default: %(default)s)")
+    args = parser.parse_args()
+
+    seeds = load_seed_schemas()
+    cases = [run_case(tools, depth, args.seed, seeds, args.iterations)
+             for tools, depth in (args.case or DEFAULT_CASES)]
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "seed": args.seed,
+        "iterations": args.iterations,
+        "environment": environment_info(),
+        "cases": cases,
+    }
+
+    print_results(cases)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8', newline='\n') as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_results(cases, baseline, args.threshold)
+        if regressions:
+            print(f"\n{Colors.RED}✗ {len(regressions)} regression(s) vs {args.compare}:{Colors.RESET}")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"\n{Colors.GREEN}✓ No regressions vs {args.compare}{Colors.RESET}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+MCP Tool Catalog Diff
+Structural diff between two tools/list dumps (for example two plugin versions).
+
+Each catalog is turned into a Merkle tree: every JSON node of every tool carries a hash of
+its own content and its children's hashes, and the catalog root hashes the tools by name.
+The trees are compared top-down, descending only where hashes differ, so the comparison
+costs O(changed nodes) and identical tools or subschemas are skipped after one hash
+comparison. The result lists added, removed and changed tools with the exact JSON
+pointers (relative to the tool) that changed.
+
+The changed-subtree set can be written out as a catalog of just the added and changed
+tools (--emit-delta), so the validators can be run on the delta only.
+
+Usage:
+    python diff_catalogs.py 1.json mcpTool.json
+    python diff_catalogs.py old.json new.json --json
+    python diff_catalogs.py old.json new.json --emit-delta delta.json
+    python validate_mcp_openai.py delta.json --offline
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from mcp_catalog import load_mcp_tools
+from schema_refs import escape_pointer_token
+from validate_json_schema import Colors
+
+# Change kinds, as used in the diff result and the report
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+_SYMBOLS = {ADDED: "+", REMOVED: "-", CHANGED: "~"}
+
+
+class MerkleNode:
+    """
+    Hash of one JSON value plus the hashed children of objects and arrays.
+
+    `children` maps object keys (or array indices) to MerkleNodes and is None
+    for scalars.
+    """
+
+    __slots__ = ("digest", "kind", "children")
+
+    def __init__(self, digest, kind, children=None):
+        self.digest = digest
+        self.kind = kind
+        self.children = children
+
+
+def build_merkle_tree(value):
+    """
+    Build the Merkle tree of a JSON value.
+
+    Object members are hashed in key order, so the digest does not depend on
+    how the keys happen to be ordered in the file.
+    """
+    if isinstance(value, dict):
+        children = {key: build_merkle_tree(item) for key, item in value.items()}
+        h = hashlib.sha256(b"o")
+        for key in sorted(children):
+            h.update(key.encode("utf-8") + b"\0" + children[key].digest)
+        return MerkleNode(h.digest(), "object", children)
+    if isinstance(value, list):
+        children = {index: build_merkle_tree(item) for index, item in enumerate(value)}
+        h = hashlib.sha256(b"a")
+        for index in range(len(value)):
+            h.update(children[index].digest)
+        return MerkleNode(h.digest(), "array", children)
+    text = json.dumps(value, ensure_ascii=False)
+    return MerkleNode(hashlib.sha256(b"s" + text.encode("utf-8")).digest(), "scalar")
+
+
+def tool_key(mcp_tool, seen):
+    """Name a tool uniquely within its catalog (repeated names get a #N suffix)."""
+    name = mcp_tool.get("name", "unknown") if isinstance(mcp_tool, dict) else "unknown"
+    count = seen.get(name, 0)
+    seen[name] = count + 1
+    return name if count == 0 else f"{name}#{count + 1}"
+
+
+class CatalogTree:
+    """Merkle tree of a whole catalog: one tree per tool plus a root digest."""
+
+    def __init__(self, mcp_tools):
+        self.tools = {}
+        self.nodes = {}
+        seen = {}
+        for mcp_tool in mcp_tools:
+            key = tool_key(mcp_tool, seen)
+            self.tools[key] = mcp_tool
+            self.nodes[key] = build_merkle_tree(mcp_tool)
+        h = hashlib.sha256(b"catalog")
+        for key in sorted(self.nodes):
+            h.update(key.encode("utf-8") + b"\0" + self.nodes[key].digest)
+        self.digest = h.digest()
+
+    @classmethod
+    def from_file(cls, path):
+        return cls(load_mcp_tools(path))
+
+
+def diff_nodes(old, new, pointer="", changes=None):
+    """
+    Collect the minimal changed subtrees between two Merkle trees.
+
+    Only children whose digests differ are descended into.
+
+    Returns:
+        List of (kind, json_pointer) tuples
+    """
+    if changes is None:
+        changes = []
+    if old.digest == new.digest:
+        return changes
+    if old.kind != new.kind or old.kind == "scalar":
+        changes.append((CHANGED, pointer))
+        return changes
+
+    for key, old_child in old.children.items():
+        child_pointer = f"{pointer}/{escape_pointer_token(key)}"
+        new_child = new.children.get(key)
+        if new_child is None:
+            changes.append((REMOVED, child_pointer))
+        else:
+            diff_nodes(old_child, new_child, child_pointer, changes)
+    for key in new.children:
+        if key not in old.children:
+            changes.append((ADDED, f"{pointer}/{escape_pointer_token(key)}"))
+    return changes
+
+
+def diff_catalogs(old_tree, new_tree):
+    """
+    Compare two catalog trees.
+
+    Args:
+        old_tree: CatalogTree of the old catalog
+        new_tree: CatalogTree of the new catalog
+
+    Returns:
+        Dictionary with the names of added and removed tools, the changed tools
+        mapped to their (kind, json_pointer) changes, and "identical"
+    """
+    result = {"identical": old_tree.digest == new_tree.digest, "added": [], "removed": [],
+              "changed": {}}
+    if result["identical"]:
+        return result
+    for name, old_node in old_tree.nodes.items():
+        new_node = new_tree.nodes.get(name)
+        if new_node is None:
+            result["removed"].append(name)
+        elif new_node.digest != old_node.digest:
+            result["changed"][name] = diff_nodes(old_node, new_node)
+    result["added"] = [name for name in new_tree.nodes if name not in old_tree.nodes]
+    return result
+
+
+def changed_subtrees(diff):
+    """
+    The changed-subtree set of a diff: {tool name: set of JSON pointers}.
+
+    Added tools map to {""} (the whole tool). Removed tools and removed members
+    are left out, since there is nothing left in the new catalog to re-check.
+    """
+    subtrees = {name: {""} for name in diff["added"]}
+    for name, changes in diff["changed"].items():
+        subtrees[name] = {pointer for kind, pointer in changes if kind != REMOVED}
+    return subtrees
+
+
+def delta_catalog(diff, new_tree):
+    """A tools/list-shaped document with just the added and changed tools of the new catalog."""
+    names = set(diff["added"]) | set(diff["changed"])
+    return {"tools": [new_tree.tools[name] for name in new_tree.nodes if name in names]}
+
+
+def print_diff(diff, old_path, new_path):
+    """Print the diff in a human-readable form."""
+    print(f"Comparing {old_path} -> {new_path}")
+    if diff["identical"]:
+        print(f"{Colors.GREEN}✓ Catalogs are identical{Colors.RESET}")
+        return
+    for name in diff["added"]:
+        print(f"{Colors.GREEN}+ {name}{Colors.RESET}")
+    for name in diff["removed"]:
+        print(f"{Colors.RED}- {name}{Colors.RESET}")
+    for name, changes in diff["changed"].items():
+        print(f"{Colors.ORANGE}~ {name}{Colors.RESET}")
+        for kind, pointer in changes:
+            print(f"    {_SYMBOLS[kind]} {pointer or '(root)'}")
+    print("-" * 70)
+    pointers = sum(len(changes) for changes in diff["changed"].values())
+    print(f"Added: {len(diff['added'])}, removed: {len(diff['removed'])}, "
+          f"changed: {len(diff['changed'])} ({pointers} changed location(s))")
+
+
+def diff_to_json(diff):
+    """JSON-serializable form of a diff, including the changed-subtree set."""
+    return {
+        "identical": diff["identical"],
+        "added": diff["added"],
+        "removed": diff["removed"],
+        "changed": {name: [{"kind": kind, "pointer": pointer} for kind, pointer in changes]
+                    for name, changes in diff["changed"].items()},
+        "changedSubtrees": {name: sorted(pointers)
+                            for name, pointers in changed_subtrees(diff).items()},
+    }
+
+
+def main():
+    """Main function to handle command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Structural diff between two tools/list dumps.")
+    parser.add_argument("old", help="old tools/list dump")
+    parser.add_argument("new", help="new tools/list dump")
+    parser.add_argument("--json", action="store_true",
+                        help="print the diff (and the changed-subtree set) as JSON")
+    parser.add_argument("--emit-delta", metavar="PATH", default=None,
+                        help="write a catalog of just the added and changed tools to PATH")
+    args = parser.parse_args()
+
+    trees = []
+    for path in (args.old, args.new):
+        if not Path(path).exists():
+            print(f"{Colors.RED}Error: File '{path}' not found.{Colors.RESET}")
+            sys.exit(2)
+        try:
+            trees.append(CatalogTree.from_file(path))
+        except (OSError, ValueError) as e:
+            print(f"{Colors.RED}Error reading tool catalog '{path}': {e}{Colors.RESET}")
+            sys.exit(2)
+
+    diff = diff_catalogs(*trees)
+
+    if args.json:
+        print(json.dumps(diff_to_json(diff), indent=2, ensure_ascii=False))
+    else:
+        print_diff(diff, args.old, args.new)
+
+    if args.emit_delta:
+        delta = delta_catalog(diff, trees[1])
+        with open(args.emit_delta, 'w', encoding='utf-8', newline='\n') as f:
+            json.dump(delta, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        if not args.json:
+            print(f"Delta catalog with {len(delta['tools'])} tool(s) written to {args.emit_delta}")
+
+    # Like diff(1): 0 when identical, 1 when different, 2 on errors
+    sys.exit(0 if diff["identical"] else 1)
+
+
+if __name__ == "__main__":
+    main()
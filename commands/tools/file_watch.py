@@ -0,0 +1,161 @@
+"""
+File Watcher
+Reports changed files under a set of directories. Uses inotify through ctypes on Linux
+(no extra dependency) and falls back to polling file mtimes/sizes everywhere else.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+
+# inotify event masks (see inotify(7))
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+# Directories never worth watching
+IGNORED_DIRS = (".git", "__pycache__", ".cache", "node_modules", "Library", "Temp", "obj")
+
+
+def _iter_dirs(root):
+    """Yield root and all of its subdirectories, skipping IGNORED_DIRS."""
+    yield root
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False) and entry.name not in IGNORED_DIRS:
+            yield from _iter_dirs(entry.path)
+
+
+class InotifyWatcher:
+    """Recursive directory watcher on top of Linux inotify."""
+
+    kind = "inotify"
+
+    def __init__(self, directories):
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs = {}
+        for directory in directories:
+            for path in _iter_dirs(os.path.abspath(directory)):
+                self._add_watch(path)
+
+    def _add_watch(self, path):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd >= 0:
+            self._dirs[wd] = path
+
+    def wait(self, timeout=None):
+        """
+        Block until something changes (or timeout seconds pass).
+
+        Returns:
+            Set of changed file paths (created, modified, moved or deleted)
+        """
+        changed = set()
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        while readable:
+            data = os.read(self._fd, 64 * 1024)
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+                directory = self._dirs.get(wd)
+                if mask & IN_IGNORED:
+                    self._dirs.pop(wd, None)
+                    continue
+                if directory is None or not name:
+                    continue
+                path = os.path.join(directory, os.fsdecode(name))
+                if mask & IN_ISDIR:
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        # Watch the new directory and report what was moved in with it
+                        for sub in _iter_dirs(path):
+                            self._add_watch(sub)
+                            try:
+                                entries = list(os.scandir(sub))
+                            except OSError:
+                                continue  # already gone again; its IN_DELETE follows
+                            changed.update(e.path for e in entries if e.is_file())
+                    continue
+                if mask & IN_CREATE:
+                    continue  # the IN_CLOSE_WRITE that follows carries the content
+                changed.add(path)
+            # Drain whatever else is already queued so one save yields one batch
+            readable, _, _ = select.select([self._fd], [], [], 0)
+        return changed
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Portable watcher comparing (mtime, size) snapshots of every file."""
+
+    kind = "polling"
+
+    def __init__(self, directories, interval=0.5):
+        self._directories = [os.path.abspath(d) for d in directories]
+        self._interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        for directory in self._directories:
+            for path in _iter_dirs(directory):
+                try:
+                    entries = list(os.scandir(path))
+                except OSError:
+                    continue
+                for entry in entries:
+                    if entry.is_file():
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def wait(self, timeout=None):
+        """Poll until something changes (or timeout seconds pass) and return the changed paths."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            time.sleep(self._interval)
+            snapshot = self._scan()
+            changed = {path for path in snapshot.keys() | self._snapshot.keys()
+                       if snapshot.get(path) != self._snapshot.get(path)}
+            self._snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        pass
+
+
+def create_watcher(directories, polling=False):
+    """Create the best available watcher for directories."""
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directories)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(directories)
@@ -0,0 +1,801 @@
+#!/usr/bin/env python3
+"""
+MCP Tool Call Payload Generator
+Generates tool-call argument payloads from each tool's inputSchema, for load testing the
+Unity MCP server's tool handlers.
+
+The tool catalog is read from a tools/list dump (like mcpTool.json). Every inputSchema is
+compiled once into a sampling plan - a tree of small generator functions with refs,
+allOf merges, bounds and enums already resolved - so producing a payload is just a walk
+of the plan. Payloads are written as a JSONL stream in any of the record shapes that
+validate_tool_calls.py reads, and the same seed always produces the same stream.
+
+With --invalid-ratio, a share of the payloads is deliberately broken (missing required
+property, wrong type, value outside an enum, unexpected property, non-object
+arguments); each broken payload is confirmed to fail the tool's inputSchema, and each
+payload labelled valid is confirmed to pass it (payloads that don't are not written).
+
+Strings with a `pattern` are generated from the regular expression itself (literals,
+classes, groups, alternation and repeats); tools whose patterns use anything else, such
+as lookarounds or backreferences, are skipped with a warning.
+
+Usage:
+    python generate_tool_calls.py mcpTool.json -n 100000 -o calls.jsonl
+    python generate_tool_calls.py mcpTool.json -n 1000 --invalid-ratio 0.1 --seed 7
+    python generate_tool_calls.py mcpTool.json -n 0 --envelope mcp | my-load-driver
+"""
+
+import argparse
+import json
+import random
+import re
+import string
+import sys
+import time
+import uuid
+from collections import Counter
+
+from mcp_catalog import load_mcp_tools
+from phase_timing import add_instrumentation_arguments, instrumented, phase
+from schema_refs import RefResolver, SchemaRegistry, UnresolvedRefError
+from validate_json_schema import Colors
+
+try:
+    from re import _constants as sre_constants, _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_constants
+    import sre_parse
+
+DEFAULT_COUNT = 1000
+DEFAULT_SEED = 1234
+# Nesting depth after which only required properties and minItems items are generated
+DEFAULT_MAX_DEPTH = 6
+# Extra depth allowed for schemas that require deeper nesting; beyond it generation fails
+REQUIRED_DEPTH_MARGIN = 32
+# Probability of including an optional property
+OPTIONAL_PROPERTY_PROBABILITY = 0.5
+# Items generated above minItems (and characters above minLength) at most
+EXTRA_ITEMS = 3
+EXTRA_LENGTH = 16
+# Attempts at breaking a payload before falling back to non-object arguments
+MUTATION_ATTEMPTS = 8
+# Attempts at generating a string matching a pattern within the length bounds
+PATTERN_ATTEMPTS = 32
+# Characters drawn for `.` and negated classes
+PATTERN_ALPHABET = string.ascii_letters + string.digits + "_-. "
+ENVELOPES = ("plain", "mcp", "openai")
+
+WORDS = ("asset", "scene", "object", "component", "prefab", "material", "path", "value",
+         "name", "type", "reference", "instance", "field", "property", "transform")
+SCALAR_TYPES = ("string", "integer", "number", "boolean", "null")
+
+
+class PlanError(ValueError):
+    """Raised when a schema can't be compiled into a plan or a plan can't produce a value."""
+
+
+class UnsupportedSchemaError(PlanError):
+    """Raised for a schema the generator can't sample reliably; its tool is skipped."""
+
+
+def _random_text(rng, min_length, max_length):
+    length = rng.randint(min_length, max_length)
+    text = ""
+    while len(text) < length:
+        text += rng.choice(WORDS) + "_"
+    return text[:length]
+
+
+_CATEGORY_RANGES = {
+    sre_constants.CATEGORY_DIGIT: [(48, 57)],
+    sre_constants.CATEGORY_WORD: [(48, 57), (65, 90), (95, 95), (97, 122)],
+    sre_constants.CATEGORY_SPACE: [(32, 32)],
+}
+_NEGATED_CATEGORIES = {
+    sre_constants.CATEGORY_NOT_DIGIT: sre_constants.CATEGORY_DIGIT,
+    sre_constants.CATEGORY_NOT_WORD: sre_constants.CATEGORY_WORD,
+    sre_constants.CATEGORY_NOT_SPACE: sre_constants.CATEGORY_SPACE,
+}
+_REPEATS = tuple(getattr(sre_constants, name) for name in
+                 ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT") if hasattr(sre_constants, name))
+
+
+def _in_ranges(code, ranges):
+    return any(low <= code <= high for low, high in ranges)
+
+
+def _class_plan(items, pattern):
+    """Plan for a character class: a list of (op, argument) items of an IN node."""
+    ranges = []
+    negate = False
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            negate = True
+        elif op is sre_constants.LITERAL:
+            ranges.append((av, av))
+        elif op is sre_constants.RANGE:
+            ranges.append(av)
+        elif op is sre_constants.CATEGORY and av in _CATEGORY_RANGES:
+            ranges.extend(_CATEGORY_RANGES[av])
+        elif op is sre_constants.CATEGORY and av in _NEGATED_CATEGORIES:
+            excluded = _CATEGORY_RANGES[_NEGATED_CATEGORIES[av]]
+            ranges.extend((ord(c), ord(c)) for c in PATTERN_ALPHABET
+                          if not _in_ranges(ord(c), excluded))
+        else:
+            raise UnsupportedSchemaError(f"pattern {pattern!r}: unsupported character class")
+    if negate:
+        choices = [c for c in PATTERN_ALPHABET if not _in_ranges(ord(c), ranges)]
+        if not choices:
+            raise UnsupportedSchemaError(f"pattern {pattern!r}: negated class excludes every "
+                                         f"character the generator uses")
+        return lambda rng: rng.choice(choices)
+    if not ranges:
+        raise UnsupportedSchemaError(f"pattern {pattern!r}: empty character class")
+    return lambda rng: chr(rng.randint(*rng.choice(ranges)))
+
+
+def _sequence_plan(parsed, pattern):
+    """Plan for a parsed regular expression: a function rng -> matching text."""
+    parts = []
+    for op, av in parsed:
+        if op is sre_constants.LITERAL:
+            parts.append(lambda rng, text=chr(av): text)
+        elif op is sre_constants.NOT_LITERAL:
+            parts.append(_class_plan([(sre_constants.NEGATE, None),
+                                      (sre_constants.LITERAL, av)], pattern))
+        elif op is sre_constants.ANY:
+            parts.append(lambda rng: rng.choice(PATTERN_ALPHABET))
+        elif op is sre_constants.IN:
+            parts.append(_class_plan(av, pattern))
+        elif op is sre_constants.CATEGORY:
+            parts.append(_class_plan([(op, av)], pattern))
+        elif op is sre_constants.AT:
+            continue  # anchors hold by construction: the generated text is the whole match
+        elif op is sre_constants.BRANCH:
+            branches = [_sequence_plan(branch, pattern) for branch in av[1]]
+            parts.append(lambda rng, branches=branches: rng.choice(branches)(rng))
+        elif op is sre_constants.SUBPATTERN:
+            parts.append(_sequence_plan(av[-1], pattern))
+        elif op in _REPEATS:
+            low, high, item = av
+            high = min(high, low + EXTRA_ITEMS)
+            item_plan = _sequence_plan(item, pattern)
+            parts.append(lambda rng, low=low, high=high, item_plan=item_plan:
+                         "".join(item_plan(rng) for _ in range(rng.randint(low, high))))
+        else:
+            raise UnsupportedSchemaError(f"pattern {pattern!r}: {str(op).lower()} is not "
+                                         f"supported by the generator")
+    return lambda rng: "".join(part(rng) for part in parts)
+
+
+def compile_pattern(pattern):
+    """
+    Compile a `pattern` into a function rng -> string matching it.
+
+    Literals, `.`, character classes and categories (\\d, \\w, \\s), groups,
+    alternation, repeats and anchors are supported.
+
+    Raises:
+        UnsupportedSchemaError: for invalid patterns and other constructs (lookarounds,
+            backreferences, conditionals, word boundaries)
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except (re.error, TypeError) as e:
+        raise UnsupportedSchemaError(f"pattern {pattern!r} is not a valid regular expression: "
+                                     f"{e}") from None
+    return _sequence_plan(parsed, pattern)
+
+
+# Generators for the string formats found in tool schemas; anything else is plain text
+FORMATS = {
+    "date-time": lambda rng: (f"20{rng.randint(10, 39)}-{rng.randint(1, 12):02d}-"
+                              f"{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:"
+                              f"{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}Z"),
+    "date": lambda rng: f"20{rng.randint(10, 39)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+    "time": lambda rng: f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}Z",
+    "uuid": lambda rng: str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+    "email": lambda rng: f"{rng.choice(WORDS)}{rng.randint(0, 999)}@example.com",
+    "hostname": lambda rng: f"{rng.choice(WORDS)}{rng.randint(0, 999)}.example.com",
+    "uri": lambda rng: f"https://example.com/{rng.choice(WORDS)}/{rng.randint(0, 9999)}",
+    "ipv4": lambda rng: ".".join(str(rng.randint(0, 255)) for _ in range(4)),
+}
+
+
+def _types_of(node):
+    """Declared or implied JSON types of a schema node."""
+    declared = node.get("type")
+    if isinstance(declared, str):
+        return [declared]
+    if isinstance(declared, list) and declared:
+        return [t for t in declared if isinstance(t, str)]
+    if any(key in node for key in ("properties", "required", "additionalProperties",
+                                   "minProperties")):
+        return ["object"]
+    if any(key in node for key in ("items", "prefixItems", "minItems")):
+        return ["array"]
+    if any(key in node for key in ("minLength", "maxLength", "pattern", "format")):
+        return ["string"]
+    if any(key in node for key in ("minimum", "maximum", "exclusiveMinimum",
+                                   "exclusiveMaximum", "multipleOf")):
+        return ["number"]
+    return list(SCALAR_TYPES)
+
+
+class PlanCompiler:
+    """
+    Compiles the inputSchemas of one catalog into sampling plans.
+
+    A plan is a function plan(rng, depth) returning one value. Plans are memoized
+    per schema node, so shared `$defs` are compiled once and recursive schemas
+    compile to recursive plans.
+    """
+
+    def __init__(self, registry=None, max_depth=DEFAULT_MAX_DEPTH):
+        self.resolver = RefResolver(registry)
+        self.max_depth = max_depth
+        self._plans = {}
+
+    def compile_tool(self, mcp_tool):
+        """Compile the plan for the arguments of one tool."""
+        schema = mcp_tool.get("inputSchema")
+        if schema is None:
+            schema = {"type": "object"}
+        return self.compile(schema, schema)
+
+    def compile(self, node, root):
+        key = (id(node), id(root))
+        plan = self._plans.get(key)
+        if plan is not None:
+            return plan
+        # Placeholder first, so a ref cycle back to this node finds it
+        cell = []
+        self._plans[key] = lambda rng, depth: cell[0](rng, depth)
+        plan = self._compile_uncached(node, root)
+        cell.append(plan)
+        self._plans[key] = plan
+        return plan
+
+    def _compile_uncached(self, node, root):
+        if node is True or node == {}:
+            return self._any_scalar()
+        if node is False:
+            return self._unsatisfiable("schema is 'false'")
+        if not isinstance(node, dict):
+            raise PlanError(f"schema must be an object or boolean, got {type(node).__name__}")
+
+        if "$ref" in node:
+            try:
+                target = self.resolver.resolve(node["$ref"], root)
+            except UnresolvedRefError as e:
+                raise PlanError(str(e)) from None
+            siblings = {k: v for k, v in node.items() if k not in ("$ref", "description")}
+            if not siblings:
+                return self.compile(target, root)
+            node = self._merge([siblings, target], root)
+        if "allOf" in node:
+            rest = {k: v for k, v in node.items() if k != "allOf"}
+            node = self._merge([rest] + list(node["allOf"]), root)
+
+        if "const" in node:
+            value = node["const"]
+            return lambda rng, depth: value
+        if isinstance(node.get("enum"), list) and node["enum"]:
+            values = node["enum"]
+            return lambda rng, depth: rng.choice(values)
+
+        for keyword in ("anyOf", "oneOf"):
+            if isinstance(node.get(keyword), list) and node[keyword]:
+                rest = {k: v for k, v in node.items() if k != keyword}
+                branches = [self.compile(self._merge([rest, branch], root) if rest else branch, root)
+                            for branch in node[keyword]]
+                return lambda rng, depth: rng.choice(branches)(rng, depth)
+
+        plans = [self._compile_type(t, node, root) for t in _types_of(node)]
+        if len(plans) == 1:
+            return plans[0]
+        return lambda rng, depth: rng.choice(plans)(rng, depth)
+
+    def _merge(self, nodes, root):
+        """Shallow merge of allOf-style subschemas: properties and required are combined."""
+        merged = {}
+        for node in nodes:
+            if isinstance(node, dict) and "$ref" in node:
+                try:
+                    target = self.resolver.resolve(node["$ref"], root)
+                except UnresolvedRefError as e:
+                    raise PlanError(str(e)) from None
+                siblings = {k: v for k, v in node.items() if k != "$ref"}
+                node = self._merge([siblings, target], root) if siblings else self._merge([target], root)
+            if not isinstance(node, dict):
+                continue
+            if "allOf" in node:
+                node = self._merge([{k: v for k, v in node.items() if k != "allOf"}]
+                                   + list(node["allOf"]), root)
+            for key, value in node.items():
+                if key == "properties" and isinstance(value, dict):
+                    merged.setdefault("properties", {}).update(value)
+                elif key == "required" and isinstance(value, list):
+                    merged["required"] = list(dict.fromkeys(merged.get("required", []) + value))
+                else:
+                    merged.setdefault(key, value)
+        return merged
+
+    def _any_scalar(self):
+        plans = [self._compile_type(t, {}, None) for t in SCALAR_TYPES]
+        return lambda rng, depth: rng.choice(plans)(rng, depth)
+
+    @staticmethod
+    def _unsatisfiable(reason):
+        def plan(rng, depth):
+            raise PlanError(f"no value satisfies the schema: {reason}")
+        return plan
+
+    def _compile_type(self, type_name, node, root):
+        compile_type = getattr(self, f"_compile_{type_name}", None)
+        if compile_type is None:
+            return self._unsatisfiable(f"unknown type '{type_name}'")
+        return compile_type(node, root)
+
+    def _compile_null(self, node, root):
+        return lambda rng, depth: None
+
+    def _compile_boolean(self, node, root):
+        return lambda rng, depth: rng.random() < 0.5
+
+    def _compile_string(self, node, root):
+        examples = [v for v in (node.get("examples") or []) if isinstance(v, str)]
+        if "default" in node and isinstance(node["default"], str):
+            examples.append(node["default"])
+        if "pattern" in node and examples:
+            # Documented values are the most realistic matches
+            return lambda rng, depth: rng.choice(examples)
+        if "pattern" in node:
+            return self._compile_pattern_string(node)
+        make_format = FORMATS.get(node.get("format"))
+        if make_format is not None:
+            return lambda rng, depth: make_format(rng)
+        min_length = max(0, int(node.get("minLength", 0)))
+        max_length = int(node.get("maxLength", min_length + EXTRA_LENGTH))
+        if max_length < min_length:
+            return self._unsatisfiable("maxLength < minLength")
+        return lambda rng, depth: _random_text(rng, min_length, max_length)
+
+    @staticmethod
+    def _compile_pattern_string(node):
+        """Strings generated from the pattern, retried until they fit minLength/maxLength."""
+        pattern = node["pattern"]
+        generate = compile_pattern(pattern)
+        matcher = re.compile(pattern)
+        min_length = max(0, int(node.get("minLength", 0)))
+        max_length = node.get("maxLength")
+
+        def plan(rng, depth):
+            for _ in range(PATTERN_ATTEMPTS):
+                text = generate(rng)
+                if len(text) >= min_length and (max_length is None or len(text) <= max_length) \
+                        and matcher.search(text):
+                    return text
+            raise PlanError(f"no string matching {pattern!r} within the length bounds "
+                            f"after {PATTERN_ATTEMPTS} attempts")
+        return plan
+
+    @staticmethod
+    def _bounds(node, default_span):
+        low = node.get("minimum")
+        high = node.get("maximum")
+        exclusive_low = node.get("exclusiveMinimum")
+        exclusive_high = node.get("exclusiveMaximum")
+        # Draft 4 spells exclusive bounds as booleans next to minimum/maximum
+        if exclusive_low is True:
+            exclusive_low, low = low, None
+        if exclusive_high is True:
+            exclusive_high, high = high, None
+        if low is None and high is None:
+            low, high = -default_span, default_span
+        elif low is None:
+            low = high - 2 * default_span
+        elif high is None:
+            high = low + 2 * default_span
+        return low, high, exclusive_low, exclusive_high
+
+    def _compile_integer(self, node, root):
+        low, high, exclusive_low, exclusive_high = self._bounds(node, 1000)
+        low = int(-(-low // 1))
+        high = int(high // 1)
+        if isinstance(exclusive_low, (int, float)) and not isinstance(exclusive_low, bool):
+            low = max(low, int(exclusive_low // 1) + 1)
+        if isinstance(exclusive_high, (int, float)) and not isinstance(exclusive_high, bool):
+            high = min(high, int(-(-exclusive_high // 1)) - 1)
+        step = node.get("multipleOf")
+        if isinstance(step, int) and step > 0:
+            first = -(-low // step)
+            last = high // step
+            if first > last:
+                return self._unsatisfiable("no multipleOf within the bounds")
+            return lambda rng, depth: rng.randint(first, last) * step
+        if low > high:
+            return self._unsatisfiable("empty integer range")
+        return lambda rng, depth: rng.randint(low, high)
+
+    def _compile_number(self, node, root):
+        if isinstance(node.get("multipleOf"), int):
+            return self._compile_integer(node, root)
+        low, high, exclusive_low, exclusive_high = self._bounds(node, 1000.0)
+        if isinstance(exclusive_low, (int, float)) and not isinstance(exclusive_low, bool):
+            low = max(low, exclusive_low)
+        if isinstance(exclusive_high, (int, float)) and not isinstance(exclusive_high, bool):
+            high = min(high, exclusive_high)
+        if low > high:
+            return self._unsatisfiable("empty number range")
+
+        def plan(rng, depth):
+            value = round(rng.uniform(low, high), 3)
+            if value <= low or value >= high:
+                # Rounding may step onto (or past) an exclusive bound
+                value = (low + high) / 2
+            return value
+        return plan
+
+    def _compile_array(self, node, root):
+        prefix = node.get("prefixItems")
+        items = node.get("items")
+        if isinstance(items, list):
+            # Draft 4-7 tuple form
+            prefix, items = items, node.get("additionalItems", True)
+        prefix_plans = [self.compile(item, root) for item in (prefix or [])]
+        item_plan = None if items is False else self.compile(items if items is not None else True, root)
+        min_items = max(int(node.get("minItems", 0)), 0)
+        max_items = int(node.get("maxItems", min_items + EXTRA_ITEMS))
+        if item_plan is None:
+            max_items = min(max_items, len(prefix_plans))
+        if max_items < min_items:
+            return self._unsatisfiable("maxItems < minItems")
+        unique = node.get("uniqueItems") is True
+        max_depth = self.max_depth
+
+        def plan(rng, depth):
+            count = min_items if depth >= max_depth else rng.randint(min_items, max_items)
+            _check_depth(depth, max_depth)
+            values = []
+            seen = set()
+            attempts = 0
+            while len(values) < count:
+                index = len(values)
+                value = (prefix_plans[index] if index < len(prefix_plans) else item_plan)(rng, depth + 1)
+                if unique:
+                    key = json.dumps(value, sort_keys=True)
+                    if key in seen:
+                        attempts += 1
+                        if attempts > 16 * (count + 1):
+                            if len(values) >= min_items:
+                                break
+                            raise PlanError("can't generate enough unique items")
+                        continue
+                    seen.add(key)
+                values.append(value)
+            return values
+        return plan
+
+    def _compile_object(self, node, root):
+        properties = node.get("properties") if isinstance(node.get("properties"), dict) else {}
+        required = [name for name in node.get("required", []) if isinstance(name, str)]
+        plans = {name: self.compile(subschema, root) for name, subschema in properties.items()}
+        additional = node.get("additionalProperties", True)
+        for name in required:
+            if name not in plans:
+                plans[name] = (self._any_scalar() if additional in (True, None)
+                               else self.compile(additional, root))
+        required_set = set(required)
+        optional = [name for name in plans if name not in required_set]
+        min_properties = int(node.get("minProperties", 0))
+        # dependentRequired, or the array form of the draft 4-7 dependencies keyword
+        dependents = {}
+        for keyword in ("dependencies", "dependentRequired"):
+            for name, names in (node.get(keyword) or {}).items():
+                if isinstance(names, list):
+                    dependents.setdefault(name, []).extend(n for n in names if n in plans)
+        max_depth = self.max_depth
+
+        def plan(rng, depth):
+            _check_depth(depth, max_depth)
+            include = set(required)
+            if depth < max_depth:
+                include.update(name for name in optional
+                               if rng.random() < OPTIONAL_PROPERTY_PROBABILITY)
+            missing = min_properties - len(include)
+            if missing > 0:
+                candidates = [name for name in optional if name not in include]
+                include.update(rng.sample(candidates, min(missing, len(candidates))))
+            for name in [name for name in dependents if name in include]:
+                include.update(dependents[name])
+            # Declaration order keeps the output stable and readable
+            return {name: plans[name](rng, depth + 1) for name in plans if name in include}
+        return plan
+
+
+def _check_depth(depth, max_depth):
+    if depth > max_depth + REQUIRED_DEPTH_MARGIN:
+        raise PlanError(f"schema requires nesting deeper than {max_depth + REQUIRED_DEPTH_MARGIN}")
+
+
+class ToolPlan:
+    """Sampling plan for one tool plus the candidates for deliberate breakage."""
+
+    def __init__(self, mcp_tool, compiler):
+        self.name = mcp_tool.get("name", "unknown")
+        self.schema = mcp_tool.get("inputSchema") or {"type": "object"}
+        self.generate = compiler.compile_tool(mcp_tool)
+        self.mutations = self._mutation_candidates(compiler)
+        self.validator = None
+
+    def _mutation_candidates(self, compiler):
+        """Precompute (kind, property) pairs that may break a valid payload."""
+        root = self.schema
+        try:
+            root = compiler._merge([root], root)
+        except PlanError:
+            return [("not_object", None)]
+        candidates = [("not_object", None)]
+        for name in root.get("required", []):
+            candidates.append(("missing_required", name))
+        if root.get("additionalProperties") is False:
+            candidates.append(("unexpected_property", None))
+        for name, subschema in (root.get("properties") or {}).items():
+            try:
+                subschema = compiler._merge([subschema], self.schema)
+            except PlanError:
+                continue
+            if isinstance(subschema.get("enum"), list):
+                candidates.append(("outside_enum", name))
+            if subschema.get("type") and "anyOf" not in subschema and "oneOf" not in subschema:
+                candidates.append(("wrong_type", name))
+        return candidates
+
+    def mutate(self, rng, arguments):
+        """Return (kind, broken copy of arguments)."""
+        kind, name = rng.choice(self.mutations)
+        if kind == "not_object" or not isinstance(arguments, dict):
+            return "not_object", rng.choice([[], 0, True, None])
+        broken = dict(arguments)
+        if kind == "missing_required":
+            broken.pop(name, None)
+        elif kind == "unexpected_property":
+            broken[f"unexpected_{rng.randint(0, 999)}"] = rng.choice(WORDS)
+        elif kind == "outside_enum":
+            broken[name] = "".join(rng.choice(string.ascii_letters) for _ in range(12))
+        elif kind == "wrong_type":
+            value = broken.get(name)
+            choices = [v for v in ([1], {"x": 1}, "text", 17, 2.5, True, None)
+                       if type(v) is not type(value)]
+            broken[name] = rng.choice(choices)
+        return kind, broken
+
+
+def compile_tool_plans(mcp_tools, registry=None, max_depth=DEFAULT_MAX_DEPTH, names=None,
+                       skipped=None):
+    """
+    Compile one sampling plan per tool.
+
+    Args:
+        mcp_tools: Iterable of MCP tool definitions
+        registry: Optional SchemaRegistry of shared $defs for resolving $refs
+        max_depth: Nesting depth after which only required data is generated
+        names: Optional collection of tool names to restrict the plans to
+        skipped: Optional list; (tool name, reason) is appended for every tool left out
+            because the generator can't sample its schema (see UnsupportedSchemaError)
+
+    Returns:
+        List of ToolPlan, in catalog order
+
+    Raises:
+        PlanError: if a schema can't be compiled
+    """
+    compiler = PlanCompiler(registry, max_depth)
+    plans = []
+    for mcp_tool in mcp_tools:
+        if names and mcp_tool.get("name") not in names:
+            continue
+        try:
+            plans.append(ToolPlan(mcp_tool, compiler))
+        except UnsupportedSchemaError as e:
+            if skipped is None:
+                raise PlanError(f"tool '{mcp_tool.get('name', 'unknown')}': {e}") from None
+            skipped.append((mcp_tool.get("name", "unknown"), str(e)))
+        except PlanError as e:
+            raise PlanError(f"tool '{mcp_tool.get('name', 'unknown')}': {e}") from None
+    return plans
+
+
+def attach_validators(plans, registry=None):
+    """Compile the inputSchema validator of every plan (needed to confirm payload labels)."""
+    from validate_tool_calls import compile_tool_validators
+    validators = compile_tool_validators(({"name": plan.name, "inputSchema": plan.schema}
+                                          for plan in plans), registry)
+    for plan in plans:
+        plan.validator = validators[plan.name]
+
+
+def generate_payloads(plans, rng, count, invalid_ratio=0.0):
+    """
+    Yield (plan, arguments, mutation) tuples; mutation is None for valid payloads.
+
+    Args:
+        plans: List of ToolPlan (with validators attached when invalid_ratio > 0)
+        rng: random.Random instance; the stream is fully determined by its seed
+        count: Number of payloads, or 0 for an endless stream
+        invalid_ratio: Share of payloads to break deliberately
+    """
+    produced = 0
+    while not count or produced < count:
+        plan = rng.choice(plans)
+        arguments = plan.generate(rng, 0)
+        mutation = None
+        if invalid_ratio and rng.random() < invalid_ratio:
+            for _ in range(MUTATION_ATTEMPTS):
+                mutation, broken = plan.mutate(rng, arguments)
+                if not plan.validator.is_valid(broken):
+                    break
+            else:
+                mutation, broken = "not_object", None
+            arguments = broken
+        yield plan, arguments, mutation
+        produced += 1
+
+
+def format_record(index, name, arguments, envelope, mutation=None, label=False):
+    """Serialize one payload as a JSONL record in the chosen envelope."""
+    if envelope == "mcp":
+        record = {"jsonrpc": "2.0", "id": index, "method": "tools/call",
+                  "params": {"name": name, "arguments": arguments}}
+    elif envelope == "openai":
+        record = {"function": {"name": name,
+                               "arguments": json.dumps(arguments, separators=(',', ':'))}}
+    else:
+        record = {"name": name, "arguments": arguments}
+    if label:
+        record["expectValid"] = mutation is None
+        if mutation is not None:
+            record["mutation"] = mutation
+    return json.dumps(record, separators=(',', ':'), ensure_ascii=False)
+
+
+def write_payloads(plans, out, rng, count, invalid_ratio=0.0, envelope="plain", verify=False):
+    """
+    Generate payloads and write them to out, one JSONL record per line.
+
+    Valid-by-construction payloads are checked against their schema whenever the
+    plans carry validators (with verify or invalid_ratio); those that fail are counted
+    and not written, so no record claims to be valid without being so.
+
+    Returns:
+        Statistics dictionary: per-tool counts, mutation counts and the
+        valid-by-construction payloads that failed their schema
+    """
+    calls = Counter()
+    mutations = Counter()
+    nonconforming = Counter()
+    label = invalid_ratio > 0
+    for index, (plan, arguments, mutation) in enumerate(
+            generate_payloads(plans, rng, count, invalid_ratio), 1):
+        if mutation is not None:
+            mutations[mutation] += 1
+        elif plan.validator is not None and not plan.validator.is_valid(arguments):
+            nonconforming[plan.name] += 1
+            continue
+        calls[plan.name] += 1
+        out.write(format_record(index, plan.name, arguments, envelope, mutation, label))
+        out.write("\n")
+    return {"calls": calls, "mutations": mutations, "nonconforming": nonconforming}
+
+
+def print_statistics(stats, elapsed, verify):
+    """Print the generation summary to stderr (stdout may carry the payloads)."""
+    total = sum(stats["calls"].values())
+    rate = total / elapsed if elapsed > 0 else float("inf")
+    err = sys.stderr
+    print(f"Generated {total} payload(s) for {len(stats['calls'])} tool(s) in {elapsed:.3f}s "
+          f"({rate:,.0f} payloads/s)", file=err)
+    if stats["mutations"]:
+        kinds = ", ".join(f"{kind}: {n}" for kind, n in stats["mutations"].most_common())
+        print(f"Invalid: {sum(stats['mutations'].values())} ({kinds})", file=err)
+    for name, n in stats["nonconforming"].most_common():
+        print(f"{Colors.RED}✗ {name}: {n} generated payload(s) fail the inputSchema and were "
+              f"not written{Colors.RESET}", file=err)
+    if verify and not stats["nonconforming"]:
+        print(f"{Colors.GREEN}✓ Every valid payload conforms to its inputSchema"
+              f"{Colors.RESET}", file=err)
+
+
+def main():
+    """Main function to handle command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Generate tool-call argument payloads from each tool's inputSchema.")
+    parser.add_argument("catalog", help="tools/list dump with the tool definitions")
+    parser.add_argument("-n", "--count", type=int, default=DEFAULT_COUNT,
+                        help="number of payloads; 0 streams until interrupted (default: %(default)s)")
+    parser.add_argument("-o", "--output", default=None, metavar="PATH",
+                        help="write the JSONL stream to PATH instead of stdout")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED,
+                        help="random seed; the same seed gives the same stream (default: %(default)s)")
+    parser.add_argument("--tool", action="append", default=[], metavar="NAME",
+                        help="only generate calls of tool NAME (repeatable)")
+    parser.add_argument("--invalid-ratio", type=float, default=0.0, metavar="RATIO",
+                        help="share of payloads to break deliberately, 0-1 (default: 0); records "
+                             "are then labelled with expectValid and mutation")
+    parser.add_argument("--envelope", choices=ENVELOPES, default="plain",
+                        help="record shape: plain {name, arguments}, mcp tools/call request or "
+                             "openai function call (default: %(default)s)")
+    parser.add_argument("--max-depth", type=int, default=DEFAULT_MAX_DEPTH,
+                        help="nesting depth after which only required data is generated "
+                             "(default: %(default)s)")
+    parser.add_argument("--defs", action="append", default=[], metavar="PATH",
+                        help="JSON file or directory of shared $defs for resolving $refs (repeatable)")
+    parser.add_argument("--verify", action="store_true",
+                        help="check every valid payload against its inputSchema; exit 1 on mismatches")
+    add_instrumentation_arguments(parser)
+    args = parser.parse_args()
+
+    if not 0.0 <= args.invalid_ratio <= 1.0:
+        parser.error("--invalid-ratio must be between 0 and 1")
+    if args.count < 0:
+        parser.error("--count must not be negative")
+
+    with instrumented(args, "generate_tool_calls"):
+        try:
+            with phase("load_catalog"):
+                mcp_tools = list(load_mcp_tools(args.catalog))
+                registry = SchemaRegistry.from_paths(args.defs) if args.defs else None
+        except (OSError, ValueError) as e:
+            print(f"{Colors.RED}Error reading tool catalog '{args.catalog}': {e}{Colors.RESET}",
+                  file=sys.stderr)
+            sys.exit(1)
+
+        skipped = []
+        try:
+            with phase("compile_plans"):
+                plans = compile_tool_plans(mcp_tools, registry, args.max_depth, set(args.tool),
+                                           skipped)
+                if args.invalid_ratio or args.verify:
+                    attach_validators(plans, registry)
+        except PlanError as e:
+            print(f"{Colors.RED}Error compiling sampling plans: {e}{Colors.RESET}", file=sys.stderr)
+            sys.exit(1)
+        except Exception as e:
+            print(f"{Colors.RED}Error compiling inputSchema validators: {e}{Colors.RESET}",
+                  file=sys.stderr)
+            sys.exit(1)
+        for name, reason in skipped:
+            print(f"{Colors.ORANGE}⚠ Skipping tool '{name}': {reason}{Colors.RESET}",
+                  file=sys.stderr)
+        if not plans:
+            missing = ", ".join(args.tool)
+            print(f"{Colors.RED}Error: no tools to generate calls for"
+                  f"{f' (unknown: {missing})' if missing else ''}{Colors.RESET}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Compiled {len(plans)} sampling plan(s) from {args.catalog}", file=sys.stderr)
+
+        rng = random.Random(args.seed)
+        out = open(args.output, 'w', encoding='utf-8', newline='\n') if args.output else sys.stdout
+        start = time.perf_counter()
+        try:
+            with phase("generate"):
+                stats = write_payloads(plans, out, rng, args.count, args.invalid_ratio,
+                                       args.envelope, args.verify)
+        except PlanError as e:
+            print(f"{Colors.RED}Error generating payloads: {e}{Colors.RESET}", file=sys.stderr)
+            sys.exit(1)
+        except (KeyboardInterrupt, BrokenPipeError):
+            # Endless streams end when the consumer goes away
+            sys.exit(0)
+        finally:
+            if args.output:
+                out.close()
+        elapsed = time.perf_counter() - start
+
+        print_statistics(stats, elapsed, args.verify)
+        sys.exit(1 if stats["nonconforming"] else 0)
+
+
+if __name__ == "__main__":
+    main()
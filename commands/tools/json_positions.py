@@ -0,0 +1,121 @@
+"""
+JSON Source Positions
+Maps JSON pointers back to line/column positions in the source text, so errors found on
+the parsed document can be reported where they are in the file.
+
+Only the paths leading to the requested pointers are walked; every other value is skipped
+with the C JSON decoder, so locating a few errors in a large exported schema costs little
+more than parsing it.
+"""
+
+import json
+import re
+from json.decoder import scanstring
+
+from schema_refs import escape_pointer_token
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _AllFound(Exception):
+    """Raised to stop the walk once every requested pointer has been seen."""
+
+
+class _PointerLocator:
+    def __init__(self, text, pointers):
+        self.text = text
+        self.decoder = json.JSONDecoder()
+        self.trie = {}
+        for pointer in pointers:
+            node = self.trie
+            for token in _split_pointer(pointer):
+                node = node.setdefault(token, {})
+        self.remaining = set(pointers)
+        self.offsets = {}
+
+    def skip_whitespace(self, pos):
+        return _WHITESPACE.match(self.text, pos).end()
+
+    def skip_value(self, pos):
+        return self.decoder.raw_decode(self.text, pos)[1]
+
+    def walk(self, pos, trie, pointer):
+        """Record the offset of the value at pos and descend into the requested children."""
+        text = self.text
+        pos = self.skip_whitespace(pos)
+        self.offsets[pointer] = pos
+        self.remaining.discard(pointer)
+        if not self.remaining:
+            raise _AllFound()
+        if not trie or pos >= len(text) or text[pos] not in "{[":
+            return self.skip_value(pos)
+
+        closing = "}" if text[pos] == "{" else "]"
+        pos = self.skip_whitespace(pos + 1)
+        if text[pos] == closing:
+            return pos + 1
+        index = 0
+        while True:
+            if closing == "}":
+                key, pos = scanstring(text, pos + 1)
+                pos = self.skip_whitespace(pos) + 1  # ':'
+                token = escape_pointer_token(key)
+            else:
+                token = str(index)
+                index += 1
+            child = trie.get(token)
+            if child is None:
+                pos = self.skip_value(self.skip_whitespace(pos))
+            else:
+                pos = self.walk(pos, child, f"{pointer}/{token}")
+            pos = self.skip_whitespace(pos)
+            if text[pos] == closing:
+                return pos + 1
+            pos = self.skip_whitespace(pos + 1)  # ','
+
+
+def _split_pointer(pointer):
+    return pointer[1:].split("/") if pointer else []
+
+
+def offset_to_line_column(text, offset):
+    """1-based (line, column) of a character offset, counted like json.JSONDecodeError."""
+    line = text.count("\n", 0, offset) + 1
+    column = offset - text.rfind("\n", 0, offset)
+    return line, column
+
+
+def locate_pointers(text, pointers):
+    """
+    Find where the values at JSON pointers start in a JSON document.
+
+    A pointer that doesn't exist in the document (for example a missing
+    property an error refers to) is mapped to its closest existing ancestor.
+
+    Args:
+        text: The JSON source text
+        pointers: Iterable of JSON pointers ("" is the root, "/a/0/b" a nested value)
+
+    Returns:
+        Dictionary mapping each pointer to a 1-based (line, column) tuple; empty if
+        the text is not valid JSON
+    """
+    pointers = set(pointers)
+    if not pointers:
+        return {}
+    locator = _PointerLocator(text, pointers)
+    try:
+        locator.walk(0, locator.trie, "")
+    except _AllFound:
+        pass
+    except (ValueError, IndexError):
+        return {}
+
+    positions = {}
+    for pointer in pointers:
+        found = pointer
+        while found not in locator.offsets and found:
+            found = found[:found.rindex("/")]
+        if found in locator.offsets:
+            positions[pointer] = offset_to_line_column(text, locator.offsets[found])
+    return positions
@@ -0,0 +1,260 @@
+"""
+MCP Tool Catalog Helpers
+Shared helpers for reading MCP tools/list dumps used by the validation scripts.
+"""
+
+import json
+
+# Characters read per chunk by the streaming parser
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def extract_mcp_tools(json_content):
+    """
+    Extract the MCP tool definitions from parsed tools/list JSON.
+
+    Supports a JSON-RPC response (`result.tools`), an object with a `tools`
+    array, a bare array of tools, or a single tool object.
+
+    Args:
+        json_content: The parsed JSON content
+
+    Returns:
+        List of MCP tool definitions
+    """
+    # Check if it's wrapped in a result object (like the example)
+    if "result" in json_content and "tools" in json_content["result"]:
+        return json_content["result"]["tools"]
+    elif "tools" in json_content:
+        return json_content["tools"]
+    elif isinstance(json_content, list):
+        return json_content
+    else:
+        # Assume single tool
+        return [json_content]
+
+
+def mcp_tool_pointer(json_content, index):
+    """
+    JSON pointer of the index-th tool found by extract_mcp_tools in json_content.
+
+    Args:
+        json_content: The parsed JSON content
+        index: Position of the tool in the list returned by extract_mcp_tools
+
+    Returns:
+        The pointer, e.g. "/result/tools/3" ("" for a single tool object)
+    """
+    if "result" in json_content and "tools" in json_content["result"]:
+        return f"/result/tools/{index}"
+    elif "tools" in json_content:
+        return f"/tools/{index}"
+    elif isinstance(json_content, list):
+        return f"/{index}"
+    else:
+        return ""
+
+
+def convert_mcp_to_openai_tool(mcp_tool):
+    """
+    Convert MCP tool definition to OpenAI function calling format.
+
+    Args:
+        mcp_tool: MCP tool definition from the JSON
+
+    Returns:
+        OpenAI tool definition
+    """
+    return {
+        "type": "function",
+        "function": {
+            "name": mcp_tool.get("name", "unknown"),
+            "description": mcp_tool.get("description", ""),
+            "parameters": mcp_tool.get("inputSchema", {})
+        }
+    }
+
+
+class _JsonStream:
+    """Minimal pull reader that decodes one JSON value at a time from a text stream."""
+
+    def __init__(self, stream, chunk_size):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        # Position of the buffer start within the whole document
+        self.consumed = 0
+        self.lines = 0
+        self.column = 0
+        self.eof = False
+
+    def _fill(self, size):
+        """Read more input; returns False at end of stream."""
+        if self.eof:
+            return False
+        chunk = self.stream.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop everything already parsed so the buffer only holds the current value
+        dropped = self.buffer[:self.pos]
+        newlines = dropped.count("\n")
+        if newlines:
+            self.lines += newlines
+            self.column = len(dropped) - dropped.rindex("\n") - 1
+        else:
+            self.column += len(dropped)
+        self.consumed += self.pos
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def error(self, message):
+        return json.JSONDecodeError(message, self.buffer, self.pos)
+
+    def relocate(self, error):
+        """Translate an error raised on the buffer into a position within the whole document."""
+        lineno = error.lineno + self.lines
+        colno = error.colno + (self.column if error.lineno == 1 else 0)
+        pos = error.pos + self.consumed
+        relocated = json.JSONDecodeError(error.msg, "", 0)
+        relocated.args = (f"{error.msg}: line {lineno} column {colno} (char {pos})",)
+        relocated.doc, relocated.pos, relocated.lineno, relocated.colno = error.doc, pos, lineno, colno
+        return relocated
+
+    def peek(self):
+        """Return the next non-whitespace character without consuming it ('' at end)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill(self.chunk_size):
+                return ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise self.error(f"Expecting '{char}'")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value, reading ahead as far as needed."""
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Most likely a value cut off at the end of the buffer: read more
+                if not self._fill(size):
+                    raise
+                size *= 2
+                continue
+            if end == len(self.buffer) and not self.eof and self.buffer[self.pos] not in '{["':
+                # A bare number/literal may continue in the next chunk
+                if self._fill(size):
+                    continue
+            self.pos = end
+            return value
+
+    def members(self):
+        """Iterate the keys of the object at the current position, leaving each value unread."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise self.error("Expecting property name enclosed in double quotes")
+            self.expect(":")
+            yield key
+            separator = self.peek()
+            if separator not in ("}", ","):
+                raise self.error("Expecting ',' delimiter")
+            self.pos += 1
+            if separator == "}":
+                return
+
+    def items(self):
+        """Decode and yield the elements of the array at the current position one by one."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            separator = self.peek()
+            if separator not in ("]", ","):
+                raise self.error("Expecting ',' delimiter")
+            self.pos += 1
+            if separator == "]":
+                return
+
+
+def iter_mcp_tools(stream, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Incrementally yield MCP tool definitions from a tools/list dump.
+
+    Detects the same shapes as extract_mcp_tools (`result.tools`, `tools`, a
+    bare array, or a single tool object) but decodes only one tool at a time,
+    so peak memory is bounded by the largest single tool rather than the whole
+    catalog. If a document has both `tools` and `result.tools`, whichever
+    comes first in the file is used.
+
+    Args:
+        stream: Text file object positioned at the start of the JSON document
+        chunk_size: Number of characters read per chunk
+
+    Yields:
+        MCP tool definitions
+
+    Raises:
+        json.JSONDecodeError: if the document is not valid JSON
+    """
+    reader = _JsonStream(stream, chunk_size)
+    try:
+        yield from _iter_document_tools(reader)
+    except json.JSONDecodeError as e:
+        raise reader.relocate(e) from None
+
+
+def _iter_document_tools(reader):
+    if reader.peek() == "[":
+        yield from reader.items()
+    elif reader.peek() != "{":
+        # A scalar document: let extract_mcp_tools decide, like the non-streaming path
+        yield from extract_mcp_tools(reader.value())
+    else:
+        # Members other than the tools array are small; keep them in case the
+        # document turns out to be a single tool
+        document = {}
+        found = False
+        for key in reader.members():
+            if not found and key == "tools" and reader.peek() == "[":
+                yield from reader.items()
+                found = True
+            elif not found and key == "result" and reader.peek() == "{":
+                result = {}
+                for result_key in reader.members():
+                    if not found and result_key == "tools" and reader.peek() == "[":
+                        yield from reader.items()
+                        found = True
+                    else:
+                        result[result_key] = reader.value()
+                document[key] = result
+            else:
+                document[key] = reader.value()
+        if not found:
+            yield from extract_mcp_tools(document)
+
+    if reader.peek() != "":
+        raise reader.error("Extra data")
+
+
+def load_mcp_tools(path):
+    """Stream the MCP tool definitions of a tools/list dump file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        yield from iter_mcp_tools(f)
@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+MCP Tool Catalog Minifier
+Shrinks a tools/list dump without changing what any tool's inputSchema accepts.
+
+Every inputSchema is its own $ref scope, so each one is processed independently:
+  1. Redundant keywords are dropped (empty `required`/`properties`, `additionalProperties: true`
+     unless an `unevaluated*` keyword reads its annotations, descriptions on a $ref site that
+     repeat the referenced definition's description, ...).
+  2. Definitions no $ref reaches are pruned and structurally identical definitions are merged.
+  3. Every subschema is canonicalized and hashed; subschemas that occur more than once are
+     hoisted into the shared definitions and replaced with a $ref.
+The result is written as compact JSON, then re-validated with get_validator_for_schema and
+checked against probe instances (and optional recorded tool calls) to prove that the
+minified schemas accept exactly what the originals did.
+
+Usage:
+    python minify_catalog.py mcpTool.json -o mcpTool.min.json
+    python minify_catalog.py mcpTool.json -o mcpTool.min.json --samples calls.jsonl
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from mcp_catalog import extract_mcp_tools
+from profile_catalog import estimate_tokens, serialize_compact
+from schema_refs import (
+    RefResolver, UnresolvedRefError, escape_pointer_token, iter_child_schemas, iter_refs,
+    iter_subschemas,
+)
+from validate_json_schema import Colors, Draft202012Validator, get_validator_for_schema
+from validate_tool_calls import parse_tool_call
+
+# Subschemas whose canonical form is shorter than this are cheaper inline than as a $ref
+MIN_HOIST_SIZE = 48
+# Length of the name given to a hoisted definition ("_" + hex digest prefix)
+HOISTED_NAME_LENGTH = 7
+# Keywords that give a subschema an identity of its own; such nodes are never moved
+IDENTITY_KEYWORDS = ("$id", "$anchor", "$dynamicAnchor", "id")
+# Keywords that accept everything when true or {}, but still produce the annotations that
+# unevaluatedProperties/unevaluatedItems (2019-09 and later) read
+ANNOTATING_KEYWORDS = ("additionalProperties", "items", "unevaluatedProperties",
+                       "unevaluatedItems", "propertyNames")
+UNEVALUATED_KEYWORDS = ("unevaluatedProperties", "unevaluatedItems")
+# Property name no schema is expected to declare, used to probe for extra properties
+PROBE_PROPERTY = "minifyProbeExtra"
+
+
+def canonicalize(schema):
+    """Return the canonical JSON text of a subschema (sorted keys, sorted `required`)."""
+    def normalize(node):
+        if isinstance(node, dict):
+            normalized = {key: normalize(value) for key, value in node.items()}
+            if isinstance(normalized.get("required"), list):
+                normalized["required"] = sorted(normalized["required"], key=str)
+            return normalized
+        if isinstance(node, list):
+            return [normalize(item) for item in node]
+        return node
+    return json.dumps(normalize(schema), sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+
+def schema_hash(schema):
+    """Hash of the canonical form of a subschema."""
+    return hashlib.sha256(canonicalize(schema).encode('utf-8')).hexdigest()
+
+
+def defs_keyword(schema):
+    """Keyword holding the root definitions: `$defs` for 2020-12, `definitions` before it."""
+    if "$defs" in schema:
+        return "$defs"
+    if "definitions" in schema or get_validator_for_schema(schema) is not Draft202012Validator:
+        return "definitions"
+    return "$defs"
+
+
+def def_name_from_ref(ref):
+    """Return (keyword, name) for refs like `#/$defs/<name>/...`, otherwise None."""
+    if not ref.startswith("#/"):
+        return None
+    parts = ref[2:].split("/")
+    if len(parts) < 2 or parts[0] not in ("$defs", "definitions"):
+        return None
+    return parts[0], parts[1].replace("~1", "/").replace("~0", "~")
+
+
+def uses_unevaluated(schema):
+    """Whether unevaluatedProperties or unevaluatedItems appears anywhere in schema."""
+    return any(keyword in node for _, node in iter_subschemas(schema)
+               for keyword in UNEVALUATED_KEYWORDS)
+
+
+def drop_redundant_keywords(schema, stats):
+    """Remove keywords that can't change validation or repeat information already present."""
+    resolver = RefResolver()
+    # With unevaluated* in play, `additionalProperties: true` & co. mark members as evaluated
+    accepting_keywords = () if uses_unevaluated(schema) else ANNOTATING_KEYWORDS
+    for _, node in list(iter_subschemas(schema)):
+        for keyword in ("required", "properties", "patternProperties", "$defs", "definitions",
+                        "dependentSchemas", "dependentRequired"):
+            if keyword in node and node[keyword] in ([], {}):
+                del node[keyword]
+                stats["keywordsDropped"] += 1
+        # `contains: {}` is not listed: it still requires a non-empty array
+        for keyword in accepting_keywords:
+            if node.get(keyword) is True or node.get(keyword) == {}:
+                del node[keyword]
+                stats["keywordsDropped"] += 1
+        ref = node.get("$ref")
+        if isinstance(ref, str) and isinstance(node.get("description"), str):
+            try:
+                target = resolver.resolve(ref, schema)
+            except UnresolvedRefError:
+                continue
+            if isinstance(target, dict) and target.get("description") == node["description"]:
+                del node["description"]
+                stats["keywordsDropped"] += 1
+
+
+def rewrite_refs(schema, mapping):
+    """Point every `#/<keyword>/<old>` ref at `#/<keyword>/<new>` for each old -> new in mapping."""
+    for _, node in iter_subschemas(schema):
+        ref = node.get("$ref")
+        if not isinstance(ref, str):
+            continue
+        parsed = def_name_from_ref(ref)
+        if parsed and parsed in mapping:
+            keyword, name = parsed
+            prefix = f"#/{keyword}/{escape_pointer_token(name)}"
+            node["$ref"] = f"#/{keyword}/{escape_pointer_token(mapping[parsed])}" + ref[len(prefix):]
+
+
+def prune_unused_defs(schema, stats):
+    """Delete root definitions that no $ref reachable from the root refers to."""
+    roots = {key: value for key, value in schema.items() if key not in ("$defs", "definitions")}
+    reachable = set()
+    pending = [ref for _, ref in iter_refs(roots)]
+    while pending:
+        parsed = def_name_from_ref(pending.pop())
+        if parsed is None or parsed in reachable:
+            continue
+        reachable.add(parsed)
+        definition = (schema.get(parsed[0]) or {}).get(parsed[1])
+        if isinstance(definition, dict):
+            pending.extend(ref for _, ref in iter_refs(definition))
+    for keyword in ("$defs", "definitions"):
+        defs = schema.get(keyword)
+        if not isinstance(defs, dict):
+            continue
+        for name in [name for name in defs if (keyword, name) not in reachable]:
+            del defs[name]
+            stats["defsPruned"] += 1
+        if not defs:
+            del schema[keyword]
+
+
+def merge_duplicate_defs(schema, stats):
+    """Merge structurally identical definitions until none are left."""
+    while True:
+        seen = {}
+        mapping = {}
+        for keyword in ("$defs", "definitions"):
+            for name, definition in (schema.get(keyword) or {}).items():
+                if not isinstance(definition, dict) or any(k in definition for k in IDENTITY_KEYWORDS):
+                    continue
+                digest = schema_hash(definition)
+                if digest in seen:
+                    mapping[(keyword, name)] = seen[digest][1]
+                    # Refs are rewritten per keyword; merged definitions must share it
+                    if seen[digest][0] != keyword:
+                        del mapping[(keyword, name)]
+                else:
+                    seen[digest] = (keyword, name)
+        if not mapping:
+            return
+        rewrite_refs(schema, mapping)
+        for keyword, name in mapping:
+            del schema[keyword][name]
+            stats["defsMerged"] += 1
+
+
+def hoist_duplicate_subschemas(schema, stats):
+    """Replace subschemas that occur more than once with a $ref to a shared definition."""
+    keyword = defs_keyword(schema)
+    while True:
+        defs = schema.get(keyword) or {}
+        by_hash = {}
+        counts = {}
+        sizes = {}
+        def_roots = set()
+        for name, definition in defs.items():
+            if isinstance(definition, dict):
+                digest = schema_hash(definition)
+                by_hash.setdefault(digest, name)
+                def_roots.add(id(definition))
+
+        for _, node in iter_subschemas(schema):
+            if node is schema or id(node) in def_roots:
+                continue
+            text = canonicalize(node)
+            digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+            counts[digest] = counts.get(digest, 0) + 1
+            sizes[digest] = len(text)
+
+        ref_size = len(f'{{"$ref":"#/{keyword}/"}}') + HOISTED_NAME_LENGTH
+
+        def is_candidate(node):
+            # Pure $ref aliases would only add indirection
+            if set(node) == {"$ref"} or any(k in node for k in IDENTITY_KEYWORDS):
+                return None
+            digest = schema_hash(node)
+            if digest in by_hash:
+                return digest
+            count = counts.get(digest, 0)
+            size = sizes.get(digest, 0)
+            if count < 2 or size < MIN_HOIST_SIZE:
+                return None
+            # Keep one copy as the definition and pay for a $ref at every site
+            saving = count * size - (size + HOISTED_NAME_LENGTH + 3) - count * ref_size
+            return digest if saving > 0 else None
+
+        replaced = 0
+
+        def visit(node):
+            # Outermost duplicates first: a replaced node's children are not visited
+            nonlocal replaced
+            for _, child in list(iter_child_schemas(node)):
+                if not isinstance(child, dict):
+                    continue
+                digest = is_candidate(child) if id(child) not in def_roots else None
+                if digest is None:
+                    visit(child)
+                    continue
+                name = by_hash.get(digest)
+                if name is None:
+                    name = "_" + digest[:HOISTED_NAME_LENGTH - 1]
+                    while name in defs:
+                        name += "_"
+                    defs[name] = copy.deepcopy(child)
+                    by_hash[digest] = name
+                    def_roots.add(id(defs[name]))
+                    stats["subschemasHoisted"] += 1
+                child.clear()
+                child["$ref"] = f"#/{keyword}/{escape_pointer_token(name)}"
+                replaced += 1
+
+        if defs and keyword not in schema:
+            schema[keyword] = defs
+        visit(schema)
+        if defs and keyword not in schema:
+            schema[keyword] = defs
+        if not replaced:
+            if not defs and keyword in schema:
+                del schema[keyword]
+            return
+        stats["refsIntroduced"] += replaced
+
+
+def minify_schema(schema, stats):
+    """
+    Return a minified copy of an inputSchema.
+
+    Args:
+        schema: The original inputSchema (left untouched)
+        stats: Counter dictionary updated with what was changed
+
+    Returns:
+        The minified schema
+    """
+    if not isinstance(schema, dict):
+        return schema
+    minified = copy.deepcopy(schema)
+    drop_redundant_keywords(minified, stats)
+    prune_unused_defs(minified, stats)
+    merge_duplicate_defs(minified, stats)
+    hoist_duplicate_subschemas(minified, stats)
+    return minified
+
+
+def collect_probe_instances(schema):
+    """
+    Build instances to compare the original and minified schema on: trivial
+    values of every JSON type plus every const/enum/default/examples value
+    found in the schema, alone and wrapped in the schema's properties, and
+    objects and arrays with members no keyword declares (which only the
+    additionalProperties/items/unevaluated* family decides on).
+    """
+    probes = [None, True, 0, 1.5, -1, "", "probe", [], [{}], {},
+              {PROBE_PROPERTY: 1}, {PROBE_PROPERTY: {}}, [1, "", None, {}, []]]
+    values = []
+    for _, node in iter_subschemas(schema):
+        if "const" in node:
+            values.append(node["const"])
+        if isinstance(node.get("enum"), list):
+            values.extend(node["enum"])
+        if "default" in node:
+            values.append(node["default"])
+        if isinstance(node.get("examples"), list):
+            values.extend(node["examples"])
+    probes.extend(values)
+
+    properties = schema.get("properties") if isinstance(schema, dict) else None
+    if isinstance(properties, dict):
+        samples = [{}, [], "", 0, None, True] + values
+        for name in properties:
+            for sample in samples:
+                probes.append({name: sample})
+        probes.append({name: {} for name in properties})
+        probes.append(dict({name: {} for name in properties}, **{PROBE_PROPERTY: 1}))
+    return probes
+
+
+def check_equivalence(original, minified, instances):
+    """
+    Prove the minified schema is well-formed and agrees with the original.
+
+    Args:
+        original: The original inputSchema
+        minified: The minified inputSchema
+        instances: Instances both schemas must accept or reject alike
+
+    Returns:
+        List of problem messages (empty if equivalent)
+    """
+    validator_class = get_validator_for_schema(original)
+    try:
+        get_validator_for_schema(minified).check_schema(minified)
+    except Exception as e:
+        return [f"minified schema is invalid: {getattr(e, 'message', e)}"]
+    if get_validator_for_schema(minified) is not validator_class:
+        return ["minified schema selects a different draft validator"]
+
+    issues = [f"{issue['pointer']}: {issue['message']}" for issue in RefResolver().check(minified)
+              if issue["severity"] == "error"]
+    if issues:
+        return issues
+
+    before = validator_class(original)
+    after = validator_class(minified)
+    problems = []
+    for instance in instances:
+        if before.is_valid(instance) != after.is_valid(instance):
+            problems.append(f"disagrees on {json.dumps(instance)[:120]}")
+            if len(problems) >= 5:
+                break
+    return problems
+
+
+def load_samples(path):
+    """Load recorded tool calls (JSONL) and group their arguments by tool name."""
+    samples = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                name, arguments = parse_tool_call(json.loads(line))
+            except (ValueError, AttributeError, TypeError):
+                continue
+            samples.setdefault(name, []).append(arguments)
+    return samples
+
+
+def minify_catalog(json_content, samples=None):
+    """
+    Minify every tool's inputSchema of a parsed tools/list document in place.
+
+    Args:
+        json_content: Parsed tools/list document
+        samples: Optional dictionary of tool name to recorded arguments
+
+    Returns:
+        Tuple of (stats dictionary, list of equivalence problems)
+    """
+    stats = {"keywordsDropped": 0, "defsPruned": 0, "defsMerged": 0,
+             "subschemasHoisted": 0, "refsIntroduced": 0}
+    problems = []
+    for i, mcp_tool in enumerate(extract_mcp_tools(json_content)):
+        if not isinstance(mcp_tool, dict) or not isinstance(mcp_tool.get("inputSchema"), dict):
+            continue
+        original = mcp_tool["inputSchema"]
+        minified = minify_schema(original, stats)
+        instances = collect_probe_instances(original)
+        instances.extend((samples or {}).get(mcp_tool.get("name"), []))
+        for problem in check_equivalence(original, minified, instances):
+            problems.append(f"tools[{i}] '{mcp_tool.get('name', f'tool_{i}')}': {problem}")
+        mcp_tool["inputSchema"] = minified
+    return stats, problems
+
+
+def main():
+    """Main function to handle command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Deduplicate and minify the tool schemas of a tools/list dump.")
+    parser.add_argument("filename", help="tools/list dump (like mcpTool.json)")
+    parser.add_argument("-o", "--output", required=True,
+                        help="where to write the minified catalog ('-' for stdout)")
+    parser.add_argument("--samples", help="JSONL of recorded tool calls used as extra "
+                                          "equivalence probes")
+    args = parser.parse_args()
+
+    if not Path(args.filename).exists():
+        print(f"{Colors.RED}Error: File '{args.filename}' not found.{Colors.RESET}")
+        sys.exit(1)
+
+    try:
+        with open(args.filename, 'r', encoding='utf-8') as f:
+            json_content = json.load(f)
+    except json.JSONDecodeError as e:
+        print(f"{Colors.RED}Error: Invalid JSON format in '{args.filename}'{Colors.RESET}")
+        print(f"  Line {e.lineno}, Column {e.colno}: {e.msg}")
+        sys.exit(1)
+
+    before = serialize_compact(json_content)
+    samples = load_samples(args.samples) if args.samples else None
+    stats, problems = minify_catalog(json_content, samples)
+    after = serialize_compact(json_content)
+
+    # Progress goes to stderr when the catalog itself is written to stdout
+    log = sys.stderr if args.output == "-" else sys.stdout
+
+    if problems:
+        print(f"{Colors.RED}✗ Minified catalog is not equivalent - nothing written:{Colors.RESET}",
+              file=log)
+        for problem in problems:
+            print(f"  {problem}", file=log)
+        sys.exit(1)
+
+    if args.output == "-":
+        sys.stdout.write(after + "\n")
+    else:
+        with open(args.output, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(after + "\n")
+
+    before_bytes = len(before.encode('utf-8'))
+    after_bytes = len(after.encode('utf-8'))
+    saved = 100.0 * (before_bytes - after_bytes) / before_bytes if before_bytes else 0.0
+    print(f"{Colors.GREEN}✓ Minified catalog written to {args.output} "
+          f"(equivalence verified){Colors.RESET}", file=log)
+    print(f"  Bytes:  {before_bytes:,} -> {after_bytes:,} ({saved:.1f}% smaller, compact JSON "
+          f"on both sides)", file=log)
+    print(f"  Tokens: {estimate_tokens(before):,} -> {estimate_tokens(after):,}", file=log)
+    print(f"  Keywords dropped: {stats['keywordsDropped']}, unused definitions pruned: "
+          f"{stats['defsPruned']}, duplicate definitions merged: {stats['defsMerged']}, "
+          f"subschemas hoisted: {stats['subschemasHoisted']} ({stats['refsIntroduced']} refs)",
+          file=log)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Mock OpenAI Server
+Minimal OpenAI-compatible stand-in for exercising validate_mcp_openai.py without an API key
+or network access. Only POST /v1/chat/completions is implemented: requests containing a
+tool listed with --reject are answered with an OpenAI-style 400 error, all others with a
+minimal chat completion. --latency, --rate-limit and --fail-every simulate slow responses,
+429 rate limiting (with Retry-After) and transient 5xx errors.
+
+Usage:
+    python mock_openai_server.py --port 8765 --reject bad-tool
+    OPENAI_API_KEY=sk-test python validate_mcp_openai.py catalog.json \\
+        --base-url http://127.0.0.1:8765/v1 --bisect
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class MockOpenAIHandler(BaseHTTPRequestHandler):
+    """Request handler; behaviour is configured through attributes on the server."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            sys.stderr.write(f"[mock] {format % args}\n")
+
+    def send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_json(self, status, message, error_type, param=None, code=None, headers=None):
+        self.send_json(status, {
+            "error": {"message": message, "type": error_type, "param": param, "code": code}
+        }, headers)
+
+    def rate_limited(self):
+        """Sliding one-second window; returns the seconds to wait if over the limit."""
+        server = self.server
+        if not server.rate_limit:
+            return None
+        now = time.monotonic()
+        with server.lock:
+            while server.window and now - server.window[0] >= 1.0:
+                server.window.popleft()
+            if len(server.window) >= server.rate_limit:
+                return max(0.001, 1.0 - (now - server.window[0]))
+            server.window.append(now)
+        return None
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length)
+        with self.server.lock:
+            self.server.request_count += 1
+            request_number = self.server.request_count
+
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        wait = self.rate_limited()
+        if wait is not None:
+            with self.server.lock:
+                self.server.throttled_count += 1
+            self.send_error_json(429, "Rate limit reached for requests", "requests",
+                                 code="rate_limit_exceeded",
+                                 headers={"retry-after-ms": str(int(wait * 1000))})
+            return
+        if self.server.fail_every and request_number % self.server.fail_every == 0:
+            self.send_error_json(500, "The server had an error while processing your request.",
+                                 "server_error")
+            return
+
+        if self.path.rstrip("/") not in ("/v1/chat/completions", "/chat/completions"):
+            self.send_error_json(404, f"Unknown path {self.path}", "invalid_request_error")
+            return
+        try:
+            request = json.loads(raw or b"{}")
+        except json.JSONDecodeError as e:
+            self.send_error_json(400, f"Invalid JSON body: {e}", "invalid_request_error")
+            return
+
+        tools = request.get("tools") or []
+        for index, tool in enumerate(tools):
+            name = tool.get("function", {}).get("name")
+            if name in self.server.reject:
+                self.send_error_json(
+                    400,
+                    f"Invalid schema for function '{name}': rejected by mock server.",
+                    "invalid_request_error",
+                    param=f"tools[{index}].function.parameters",
+                    code="invalid_function_parameters")
+                return
+
+        self.send_json(200, {
+            "id": f"chatcmpl-mock-{request_number}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "mock"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "Hello!"},
+                "finish_reason": "stop"
+            }],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+        })
+
+
+def create_server(host="127.0.0.1", port=0, reject=(), quiet=False, latency=0.0,
+                  rate_limit=None, fail_every=None):
+    """
+    Create (but don't start) a mock server.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 picks a free one, see server.server_address)
+        reject: Tool names whose presence makes a request fail with 400
+        quiet: Don't log requests to stderr
+        latency: Seconds to sleep before answering each request
+        rate_limit: Requests per second above which 429 is returned (None for no limit)
+        fail_every: Answer every Nth request with a 500 error (None to never fail)
+
+    Returns:
+        ThreadingHTTPServer with request_count and throttled_count attributes
+    """
+    server = ThreadingHTTPServer((host, port), MockOpenAIHandler)
+    server.reject = set(reject)
+    server.quiet = quiet
+    server.lock = threading.Lock()
+    server.request_count = 0
+    server.throttled_count = 0
+    server.latency = latency
+    server.rate_limit = rate_limit
+    server.fail_every = fail_every
+    server.window = deque()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a mock OpenAI-compatible API server.")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="port to bind (default: 8765)")
+    parser.add_argument("--reject", action="append", default=[], metavar="NAME",
+                        help="reject requests containing the tool NAME (repeatable)")
+    parser.add_argument("--latency", type=float, default=0.0, metavar="SECONDS",
+                        help="delay every response (default: 0)")
+    parser.add_argument("--rate-limit", type=int, default=None, metavar="RPS",
+                        help="answer 429 with Retry-After above RPS requests per second")
+    parser.add_argument("--fail-every", type=int, default=None, metavar="N",
+                        help="answer every Nth request with a 500 error")
+    parser.add_argument("--quiet", action="store_true", help="don't log requests")
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, args.reject, args.quiet, args.latency,
+                           args.rate_limit, args.fail_every)
+    host, port = server.server_address[:2]
+    print(f"Mock OpenAI API listening on http://{host}:{port}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Served {server.request_count} request(s), {server.throttled_count} throttled")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+"""
+OpenAI Function-Calling Rules
+Static, offline checks of converted tools against the constraints the OpenAI
+function-calling API enforces, reported in the same error/warning structure as
+validate_with_openai. No network access and no openai package are needed.
+"""
+
+import re
+
+from schema_refs import RefResolver, iter_child_schemas, iter_subschemas
+
+NAME_PATTERN = re.compile(r"^[a-zA-Z0-9_-]{1,64}$")
+MAX_DESCRIPTION_LENGTH = 1024
+MAX_TOOLS = 128
+SUPPORTED_TYPES = ("string", "number", "integer", "boolean", "object", "array", "null")
+ROOT_FORBIDDEN_KEYWORDS = ("anyOf", "oneOf", "allOf", "enum", "not")
+
+# Structured Outputs (strict: true) limits
+STRICT_MAX_DEPTH = 10
+STRICT_MAX_PROPERTIES = 5000
+STRICT_MAX_ENUM_VALUES = 1000
+STRICT_MAX_STRING_LENGTH = 120000
+STRICT_UNSUPPORTED_KEYWORDS = (
+    "allOf", "oneOf", "not", "if", "then", "else", "dependentRequired", "dependentSchemas",
+    "patternProperties", "unevaluatedProperties", "propertyNames", "minProperties",
+    "maxProperties", "minLength", "maxLength", "unevaluatedItems", "contains", "minContains",
+    "maxContains", "uniqueItems", "prefixItems",
+)
+
+RULES = []
+
+
+def rule(strict_only=False):
+    """Register a rule; strict_only rules run only when checking for strict mode."""
+    def register(func):
+        RULES.append((func, strict_only))
+        return func
+    return register
+
+
+def finding(severity, location, message, suggestion):
+    return {"severity": severity, "location": location, "message": message, "suggestion": suggestion}
+
+
+def _types(node):
+    value = node.get("type")
+    if isinstance(value, str):
+        return [value]
+    return value if isinstance(value, list) else []
+
+
+def _iter_object_nodes(nodes, location):
+    for pointer, node in nodes:
+        if "object" in _types(node) or "properties" in node:
+            yield f"{location}{pointer}", node
+
+
+@rule()
+def check_name(context):
+    name = context["function"].get("name")
+    if not isinstance(name, str) or not NAME_PATTERN.match(name):
+        yield finding("error", f"{context['location']}.name",
+                      f"Function name {name!r} must match {NAME_PATTERN.pattern}",
+                      "Use only letters, digits, '_' and '-', at most 64 characters")
+
+
+@rule()
+def check_description(context):
+    description = context["function"].get("description") or ""
+    if len(description) > MAX_DESCRIPTION_LENGTH:
+        yield finding("error", f"{context['location']}.description",
+                      f"Tool '{context['name']}' description is {len(description)} characters, "
+                      f"the limit is {MAX_DESCRIPTION_LENGTH}",
+                      "Shorten the description; move details into parameter descriptions")
+    elif not description:
+        yield finding("warning", f"{context['location']}.description",
+                      f"Tool '{context['name']}' is missing a description",
+                      "Add a description to help the AI understand when to use this tool")
+
+
+@rule()
+def check_parameters_root(context):
+    parameters = context["parameters"]
+    location = f"{context['location']}.parameters"
+    if not isinstance(parameters, dict) or parameters.get("type") != "object":
+        got = parameters.get("type") if isinstance(parameters, dict) else type(parameters).__name__
+        yield finding("error", location,
+                      f"Tool '{context['name']}' parameters must be a JSON Schema of "
+                      f"type 'object', got {got!r}",
+                      "Set \"type\": \"object\" on the root of inputSchema")
+        return
+    for keyword in ROOT_FORBIDDEN_KEYWORDS:
+        if keyword in parameters:
+            yield finding("error", f"{location}/{keyword}",
+                          f"Tool '{context['name']}' parameters can't use '{keyword}' at the top level",
+                          "Move the alternatives into a property instead of the root schema")
+
+
+@rule()
+def check_types(context):
+    for pointer, node in context["nodes"]:
+        for value in _types(node):
+            if value not in SUPPORTED_TYPES:
+                yield finding("error", f"{context['location']}.parameters{pointer}/type",
+                              f"Tool '{context['name']}' uses unsupported type {value!r}",
+                              "Use one of: " + ", ".join(SUPPORTED_TYPES))
+
+
+@rule()
+def check_array_items(context):
+    for pointer, node in context["nodes"]:
+        if "array" in _types(node) and "items" not in node and "$ref" not in node:
+            yield finding("error", f"{context['location']}.parameters{pointer}",
+                          f"Tool '{context['name']}' has an array schema without 'items'",
+                          "Describe the array elements with an 'items' schema")
+
+
+@rule()
+def check_refs(context):
+    for pointer, node in context["nodes"]:
+        ref = node.get("$ref")
+        if isinstance(ref, str) and not ref.startswith("#"):
+            yield finding("error", f"{context['location']}.parameters{pointer}/$ref",
+                          f"Tool '{context['name']}' uses external $ref '{ref}'",
+                          "Only local refs ('#' or '#/$defs/...') are supported; inline the schema")
+    for issue in context["resolver"].check(context["parameters"]):
+        if issue["ref"].startswith("#"):
+            yield finding("error", f"{context['location']}.parameters{issue['pointer']}",
+                          f"Tool '{context['name']}': {issue['message']}",
+                          "Add the missing definition to $defs or fix the $ref path")
+
+
+@rule()
+def check_depth(context):
+    depth = _object_depth(context["parameters"])
+    if depth > STRICT_MAX_DEPTH:
+        yield finding("error" if context["strict"] else "warning",
+                      f"{context['location']}.parameters",
+                      f"Tool '{context['name']}' nests objects {depth} levels deep, "
+                      f"the strict-mode limit is {STRICT_MAX_DEPTH}",
+                      "Flatten the schema or move nested objects into $defs")
+
+
+@rule(strict_only=True)
+def check_strict_keywords(context):
+    for pointer, node in context["nodes"]:
+        for keyword in STRICT_UNSUPPORTED_KEYWORDS:
+            if keyword in node:
+                yield finding("error", f"{context['location']}.parameters{pointer}/{keyword}",
+                              f"Tool '{context['name']}' uses '{keyword}', which strict mode "
+                              f"does not support",
+                              "Remove the keyword or describe the constraint in the description")
+
+
+@rule(strict_only=True)
+def check_strict_objects(context):
+    for location, node in _iter_object_nodes(context["nodes"], f"{context['location']}.parameters"):
+        if node.get("additionalProperties") is not False:
+            yield finding("error", f"{location}/additionalProperties",
+                          f"Tool '{context['name']}' object schema must set "
+                          f"'additionalProperties': false in strict mode",
+                          "Add \"additionalProperties\": false")
+        properties = node.get("properties") or {}
+        missing = [name for name in properties if name not in (node.get("required") or [])]
+        if missing:
+            yield finding("error", f"{location}/required",
+                          f"Tool '{context['name']}' strict mode requires every property to be "
+                          f"required; missing: {', '.join(missing)}",
+                          "List all properties in 'required'; make optional ones nullable "
+                          "(\"type\": [\"string\", \"null\"])")
+
+
+@rule(strict_only=True)
+def check_strict_sizes(context):
+    properties = 0
+    enum_values = 0
+    string_length = 0
+    for _, node in context["nodes"]:
+        names = node.get("properties") or {}
+        properties += len(names)
+        string_length += sum(len(name) for name in names)
+        for keyword in ("$defs", "definitions"):
+            string_length += sum(len(name) for name in (node.get(keyword) or {}))
+        if isinstance(node.get("enum"), list):
+            enum_values += len(node["enum"])
+            string_length += sum(len(v) for v in node["enum"] if isinstance(v, str))
+        if isinstance(node.get("const"), str):
+            string_length += len(node["const"])
+    location = f"{context['location']}.parameters"
+    for count, limit, what in ((properties, STRICT_MAX_PROPERTIES, "properties"),
+                               (enum_values, STRICT_MAX_ENUM_VALUES, "enum values"),
+                               (string_length, STRICT_MAX_STRING_LENGTH,
+                                "characters of property names, definition names, enums and consts")):
+        if count > limit:
+            yield finding("error", location,
+                          f"Tool '{context['name']}' has {count} {what}, the strict-mode limit is {limit}",
+                          "Split the tool or simplify its schema")
+
+
+def _object_depth(schema):
+    """Count nested object levels (refs are not followed)."""
+    if not isinstance(schema, dict):
+        return 0
+    deepest = 0
+    stack = [(schema, 0)]
+    while stack:
+        node, depth = stack.pop()
+        if "object" in _types(node) or "properties" in node:
+            depth += 1
+        deepest = max(deepest, depth)
+        for pointer, child in iter_child_schemas(node):
+            if isinstance(child, dict) and not pointer.startswith(("/$defs/", "/definitions/")):
+                stack.append((child, depth))
+    return deepest
+
+
+def check_openai_tool(index, openai_tool, strict=False, resolver=None):
+    """
+    Run every rule against one converted tool.
+
+    Args:
+        index: Position of the tool in the catalog
+        openai_tool: Tool in OpenAI function-calling format
+        strict: Also enforce the Structured Outputs (strict: true) constraints
+        resolver: Optional RefResolver shared across the catalog
+
+    Returns:
+        List of findings (dictionaries with severity, location, message, suggestion)
+    """
+    function = openai_tool.get("function") or {}
+    parameters = function.get("parameters")
+    context = {
+        "location": f"tools[{index}].function",
+        "function": function,
+        "name": function.get("name", f"tool_{index}"),
+        "parameters": parameters,
+        # Every rule walks the same subschemas: collect them once
+        "nodes": list(iter_subschemas(parameters)) if isinstance(parameters, dict) else [],
+        "strict": strict,
+        "resolver": resolver or RefResolver(),
+    }
+    findings = []
+    for func, strict_only in RULES:
+        if strict_only and not strict:
+            continue
+        if func is not check_parameters_root and not isinstance(context["parameters"], dict):
+            continue
+        findings.extend(func(context))
+    return findings
+
+
+def check_openai_tools(openai_tools, strict=False, registry=None):
+    """
+    Statically check a list of converted tools.
+
+    Args:
+        openai_tools: Iterable of tools in OpenAI function-calling format; entries that
+            are not objects (catalog entries that could not be converted) are reported
+            as errors
+        strict: Also enforce the Structured Outputs (strict: true) constraints
+        registry: Optional SchemaRegistry of shared $defs
+
+    Returns:
+        Validation result dictionary (same structure as validate_with_openai, with
+        the tool names in "tools")
+    """
+    validation_results = {
+        "isValid": True,
+        "errors": [],
+        "warnings": [],
+        "info": [],
+        "summary": "",
+        "tools": []
+    }
+    resolver = RefResolver(registry)
+    names = {}
+    count = 0
+    for index, openai_tool in enumerate(openai_tools):
+        count += 1
+        if not isinstance(openai_tool, dict):
+            validation_results["errors"].append(finding(
+                "error", f"tools[{index}]", "Tool definition must be a JSON object",
+                "Check that the tool has required fields: name, description, inputSchema"))
+            validation_results["tools"].append(f"tool_{index}")
+            continue
+        for item in check_openai_tool(index, openai_tool, strict, resolver):
+            validation_results["errors" if item["severity"] == "error" else "warnings"].append(item)
+        name = (openai_tool.get("function") or {}).get("name")
+        validation_results["tools"].append(name if isinstance(name, str) else f"tool_{index}")
+        if name in names:
+            validation_results["errors"].append(finding(
+                "error", f"tools[{index}].function.name",
+                f"Function name '{name}' is also used by tools[{names[name]}]",
+                "Function names must be unique within a request"))
+        else:
+            names[name] = index
+
+    if count > MAX_TOOLS:
+        validation_results["errors"].append(finding(
+            "error", "root", f"{count} tools exceed the limit of {MAX_TOOLS} tools per request",
+            "Send the tools in several requests or expose fewer tools at once"))
+
+    validation_results["isValid"] = not validation_results["errors"]
+    mode = "strict" if strict else "non-strict"
+    if validation_results["isValid"]:
+        validation_results["summary"] = f"All {count} tool(s) pass the offline {mode} function-calling rules"
+        validation_results["info"].append({
+            "severity": "info",
+            "message": f"{count} tool definition(s) checked offline against {len(RULES)} rules"
+        })
+    else:
+        validation_results["summary"] = (f"Validation failed - {len(validation_results['errors'])} "
+                                         f"offline {mode} rule violation(s)")
+    return validation_results
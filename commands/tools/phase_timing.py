@@ -0,0 +1,165 @@
+"""
+Phase Timing
+Shared instrumentation for the Python tools: per-phase wall-clock and CPU timers, an
+optional cProfile dump and a machine-readable JSON timing summary for CI logs and
+dashboards. Standard library only.
+
+Usage:
+    from phase_timing import add_instrumentation_arguments, instrumented, phase
+
+    add_instrumentation_arguments(parser)
+    args = parser.parse_args()
+    with instrumented(args, "my_tool"):
+        with phase("load"):
+            ...
+"""
+
+import contextlib
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+TIMING_FORMAT_VERSION = 1
+# Number of functions listed on stderr after a --profile run
+PROFILE_TOP_FUNCTIONS = 25
+
+
+class PhaseTimer:
+    """
+    Accumulates wall-clock and CPU time per named phase.
+
+    CPU time is time.process_time() of the current process; phases that run in
+    worker processes are merged in with merge() from the workers' snapshots.
+    Phases may be timed from several threads at once.
+    """
+
+    def __init__(self):
+        self.phases = OrderedDict()
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add(self, name, wall, cpu, calls=1):
+        with self._lock:
+            entry = self.phases.get(name)
+            if entry is None:
+                entry = self.phases[name] = {"wall": 0.0, "cpu": 0.0, "calls": 0}
+            entry["wall"] += wall
+            entry["cpu"] += cpu
+            entry["calls"] += calls
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Time the enclosed block as one call of phase `name` (nested phases overlap)."""
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - wall, time.process_time() - cpu)
+
+    def snapshot(self):
+        """Plain-data copy of the phases, e.g. to send back from a worker process."""
+        with self._lock:
+            return {name: dict(entry) for name, entry in self.phases.items()}
+
+    def merge(self, snapshot):
+        """Add the phases of another timer's snapshot."""
+        for name, entry in snapshot.items():
+            self.add(name, entry["wall"], entry["cpu"], entry["calls"])
+
+    def reset(self):
+        with self._lock:
+            self.phases.clear()
+        self.started = time.perf_counter()
+
+    def summary(self, tool=None):
+        """Machine-readable summary (seconds, rounded to microseconds)."""
+        return {
+            "version": TIMING_FORMAT_VERSION,
+            "tool": tool,
+            "pid": os.getpid(),
+            "totalWallSeconds": round(time.perf_counter() - self.started, 6),
+            "totalCpuSeconds": round(time.process_time(), 6),
+            "phases": [
+                {"name": name, "calls": entry["calls"], "wallSeconds": round(entry["wall"], 6),
+                 "cpuSeconds": round(entry["cpu"], 6)}
+                for name, entry in self.phases.items()
+            ],
+        }
+
+
+# Process-wide timer used by phase()
+TIMER = PhaseTimer()
+
+
+def phase(name):
+    """Time the enclosed block on the process-wide timer."""
+    return TIMER.phase(name)
+
+
+def timed_iter(iterable, name):
+    """Yield from iterable, timing each step as a call of phase `name` (e.g. a lazy parser)."""
+    iterator = iter(iterable)
+    while True:
+        with TIMER.phase(name):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
+
+
+def write_timings(path, tool=None, timer=TIMER):
+    """Write the JSON timing summary to path ('-' for stderr, keeping stdout clean)."""
+    text = json.dumps(timer.summary(tool), indent=2)
+    if path == "-":
+        sys.stderr.write(text + "\n")
+        return
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(text + "\n")
+
+
+def add_instrumentation_arguments(parser):
+    """Add the --timings and --profile options to an argparse parser."""
+    parser.add_argument("--timings", metavar="PATH", default=None,
+                        help="write a JSON summary of per-phase wall/CPU time to PATH "
+                             "('-' for stderr)")
+    parser.add_argument("--profile", metavar="PATH", default=None,
+                        help="run under cProfile and dump the stats to PATH (pstats format); "
+                             "the slowest functions are listed on stderr")
+
+
+@contextlib.contextmanager
+def instrumented(args, tool):
+    """
+    Run the enclosed block with the instrumentation requested on the command line.
+
+    The timing summary and the profile are written even when the block exits
+    through sys.exit().
+
+    Args:
+        args: Parsed arguments with `timings` and `profile` attributes
+        tool: Tool name recorded in the summary
+    """
+    profiler = cProfile.Profile() if getattr(args, "profile", None) else None
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield TIMER
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+            report = io.StringIO()
+            pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(
+                PROFILE_TOP_FUNCTIONS)
+            sys.stderr.write(report.getvalue())
+            sys.stderr.write(f"Profile written to {args.profile}\n")
+        if getattr(args, "timings", None):
+            write_timings(args.timings, tool)
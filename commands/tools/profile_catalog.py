@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+MCP Tool Catalog Profiler
+Reports how much every tool of a tools/list dump costs in the LLM context.
+
+The whole tools/list response is sent to the model on every request, so each byte
+adds latency and cost. Per tool this reports the serialized size of the OpenAI
+function definition, an estimated token count, schema depth, $defs fan-out and
+description length, sorted by cost, plus a catalog total. Budgets make it a CI gate.
+
+Usage:
+    python profile_catalog.py mcpTool.json
+    python profile_catalog.py mcpTool.json --max-tokens 20000 --max-tool-tokens 1500
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from mcp_catalog import convert_mcp_to_openai_tool, load_mcp_tools
+from schema_refs import iter_refs, iter_subschemas, schema_depth
+
+# Try to import tiktoken for exact token counts; its encoding is loaded on first use,
+# since that may download the BPE file
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Try to import colorama for Windows color support
+try:
+    from colorama import init, Fore, Style
+    init(autoreset=True)
+    HAS_COLORAMA = True
+except ImportError:
+    HAS_COLORAMA = False
+
+# ANSI color codes
+class Colors:
+    if HAS_COLORAMA:
+        GREEN = Fore.GREEN
+        RED = Fore.RED
+        ORANGE = Fore.YELLOW
+        RESET = Style.RESET_ALL
+        BOLD = Style.BRIGHT
+    else:
+        GREEN = '\033[92m'
+        RED = '\033[91m'
+        ORANGE = '\033[93m'
+        RESET = '\033[0m'
+        BOLD = '\033[1m'
+
+
+# Average characters per token for JSON-heavy text when tiktoken is unavailable
+CHARS_PER_TOKEN = 4
+
+
+def serialize_compact(value):
+    """Serialize JSON the way it goes over the wire: compact, non-ASCII kept as-is."""
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+
+
+_encoding = None
+_encoding_loaded = False
+
+
+def get_encoding():
+    """
+    Load the tiktoken encoding on first use.
+
+    Returns:
+        The encoding, or None if tiktoken is missing or its BPE file can't be
+        loaded (e.g. offline with a cold cache)
+    """
+    global _encoding, _encoding_loaded
+    if not _encoding_loaded:
+        _encoding_loaded = True
+        if tiktoken is not None:
+            try:
+                _encoding = tiktoken.get_encoding("o200k_base")
+            except Exception:
+                _encoding = None
+    return _encoding
+
+
+def estimate_tokens(text):
+    """Count tokens with tiktoken if available, otherwise estimate from the length."""
+    encoding = get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def profile_tool(mcp_tool):
+    """
+    Measure the context cost of a single MCP tool.
+
+    Args:
+        mcp_tool: MCP tool definition
+
+    Returns:
+        Dictionary of metrics for the tool
+    """
+    openai_tool = convert_mcp_to_openai_tool(mcp_tool)
+    serialized = serialize_compact(openai_tool)
+    schema = openai_tool["function"]["parameters"]
+    defs = {}
+    if isinstance(schema, dict):
+        defs = schema.get("$defs") or schema.get("definitions") or {}
+    description = openai_tool["function"]["description"] or ""
+
+    return {
+        "name": openai_tool["function"]["name"],
+        "bytes": len(serialized.encode('utf-8')),
+        "tokens": estimate_tokens(serialized),
+        "depth": schema_depth(schema),
+        "defs": len(defs),
+        "refs": sum(1 for _ in iter_refs(schema)) if isinstance(schema, dict) else 0,
+        "descriptionLength": len(description),
+        "schemaDescriptionLength": sum(
+            len(node["description"]) for _, node in iter_subschemas(schema)
+            if isinstance(node.get("description"), str)),
+    }
+
+
+def profile_catalog(mcp_tools):
+    """
+    Profile every tool of a catalog.
+
+    Args:
+        mcp_tools: Iterable of MCP tool definitions
+
+    Returns:
+        Tuple of (per-tool metrics sorted by token cost, catalog totals, list of
+        error messages for catalog entries that aren't tool definitions)
+    """
+    profiles = []
+    errors = []
+    for index, mcp_tool in enumerate(mcp_tools):
+        if not isinstance(mcp_tool, dict):
+            errors.append(f"tools[{index}]: Tool definition must be a JSON object")
+            continue
+        profiles.append(profile_tool(mcp_tool))
+    profiles.sort(key=lambda p: (-p["tokens"], p["name"]))
+    totals = {
+        "tools": len(profiles),
+        "bytes": sum(p["bytes"] for p in profiles),
+        "tokens": sum(p["tokens"] for p in profiles),
+    }
+    return profiles, totals, errors
+
+
+def print_profile(profiles, totals, max_tool_tokens=None):
+    """Print the per-tool cost table and the catalog total."""
+    print(f"{Colors.BOLD}{'Tool':<40} {'Bytes':>9} {'Tokens':>8} {'Depth':>6} "
+          f"{'$defs':>6} {'$refs':>6} {'Desc':>6} {'SchDesc':>8}{Colors.RESET}")
+    for p in profiles:
+        over = max_tool_tokens is not None and p["tokens"] > max_tool_tokens
+        color = Colors.RED if over else ""
+        reset = Colors.RESET if over else ""
+        print(f"{color}{p['name']:<40} {p['bytes']:>9,} {p['tokens']:>8,} {p['depth']:>6} "
+              f"{p['defs']:>6} {p['refs']:>6} {p['descriptionLength']:>6} "
+              f"{p['schemaDescriptionLength']:>8}{reset}")
+    print("-" * 96)
+    print(f"{Colors.BOLD}{'TOTAL (' + str(totals['tools']) + ' tools)':<40} {totals['bytes']:>9,} "
+          f"{totals['tokens']:>8,}{Colors.RESET}")
+    if get_encoding() is None:
+        hint = ("pip install tiktoken for exact counts" if tiktoken is None
+                else "tiktoken couldn't load its encoding")
+        print(f"  Token counts estimated at ~{CHARS_PER_TOKEN} chars/token ({hint})")
+
+
+def check_budgets(profiles, totals, max_tokens=None, max_tool_tokens=None):
+    """
+    Check the catalog against token budgets.
+
+    Returns:
+        List of budget violation messages
+    """
+    violations = []
+    if max_tokens is not None and totals["tokens"] > max_tokens:
+        violations.append(f"Catalog costs {totals['tokens']:,} tokens, budget is {max_tokens:,}")
+    if max_tool_tokens is not None:
+        for p in profiles:
+            if p["tokens"] > max_tool_tokens:
+                violations.append(f"Tool '{p['name']}' costs {p['tokens']:,} tokens, "
+                                  f"budget is {max_tool_tokens:,}")
+    return violations
+
+
+def main():
+    """Main function to handle command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Report the size and token cost of every tool in a tools/list dump.")
+    parser.add_argument("filename", help="tools/list dump (like mcpTool.json)")
+    parser.add_argument("--max-tokens", type=int, default=None,
+                        help="fail if the whole catalog exceeds this many tokens")
+    parser.add_argument("--max-tool-tokens", type=int, default=None,
+                        help="fail if any single tool exceeds this many tokens")
+    parser.add_argument("--json", action="store_true",
+                        help="print the profile as JSON instead of a table")
+    args = parser.parse_args()
+
+    if not Path(args.filename).exists():
+        print(f"{Colors.RED}Error: File '{args.filename}' not found.{Colors.RESET}")
+        sys.exit(1)
+
+    try:
+        profiles, totals, errors = profile_catalog(load_mcp_tools(args.filename))
+    except json.JSONDecodeError as e:
+        print(f"{Colors.RED}Error: Invalid JSON format in '{args.filename}'{Colors.RESET}")
+        print(f"  Line {e.lineno}, Column {e.colno}: {e.msg}")
+        sys.exit(1)
+
+    violations = check_budgets(profiles, totals, args.max_tokens, args.max_tool_tokens)
+
+    if args.json:
+        json.dump({"tools": profiles, "total": totals, "errors": errors,
+                   "violations": violations}, sys.stdout, indent=2)
+        print()
+    else:
+        print_profile(profiles, totals, args.max_tool_tokens)
+        for message in errors + violations:
+            print(f"{Colors.RED}✗ {message}{Colors.RESET}")
+
+    sys.exit(1 if errors or violations else 0)
+
+
+if __name__ == "__main__":
+    main()
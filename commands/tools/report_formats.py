@@ -0,0 +1,254 @@
+"""
+Machine-Readable Report Formats
+Streaming writers for validation records, used by the --format option of the validators.
+Each record is written (and flushed) as soon as it is decided, so large batches are cheap
+to produce and CI can consume results while the run is still going.
+
+A record is a dictionary:
+    {
+        "file": "path/to/file.json",
+        "name": "tool or schema name",        # optional
+        "valid": true,
+        "errors": [{"message": "...", "location": "...", "line": 3, "column": 5}],
+        "warnings": [{"message": "...", "location": "..."}]
+    }
+"location", "line", "column" and "suggestion" are optional in errors and warnings.
+
+Formats:
+    jsonl   one JSON object per line
+    junit   JUnit XML, one <testcase> per record
+    sarif   SARIF 2.1.0, one result per error and warning
+"""
+
+import json
+import sys
+from pathlib import Path
+from xml.sax.saxutils import escape, quoteattr
+
+FORMATS = ("jsonl", "junit", "sarif")
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+PROJECT_URI = "https://github.com/IvanMurzak/Unity-MCP"
+
+
+def make_record(filename, valid, errors=(), warnings=(), name=None):
+    """Build a record (see the module docstring)."""
+    record = {"file": filename, "valid": valid, "errors": list(errors),
+              "warnings": list(warnings)}
+    if name is not None:
+        record["name"] = name
+    return record
+
+
+def issue(message, location=None, line=None, column=None, suggestion=None):
+    """Build an error/warning entry of a record, leaving out unknown fields."""
+    entry = {"message": message}
+    for key, value in (("location", location), ("line", line), ("column", column),
+                       ("suggestion", suggestion)):
+        if value is not None:
+            entry[key] = value
+    return entry
+
+
+class JsonLinesWriter:
+    """Writes one JSON object per record and line."""
+
+    def __init__(self, stream, tool):
+        self.stream = stream
+        self.tool = tool
+
+    def record(self, record):
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+    def close(self):
+        self.stream.flush()
+
+
+class JUnitWriter:
+    """
+    Writes JUnit XML, one <testcase> per record.
+
+    Test cases are streamed, so the suite totals are not known up front and are
+    left out of <testsuite>; JUnit consumers count the test cases themselves.
+    """
+
+    def __init__(self, stream, tool):
+        self.stream = stream
+        self.tool = tool
+        stream.write('<?xml version="1.0" encoding="UTF-8"?>\n<testsuites>\n')
+        stream.write(f'  <testsuite name={quoteattr(tool)}>\n')
+
+    def record(self, record):
+        name = record.get("name") or record["file"]
+        classname = record["file"] if record.get("name") else self.tool
+        lines = [f'    <testcase classname={quoteattr(classname)} name={quoteattr(name)}']
+        if record["valid"] and not record["warnings"]:
+            lines[0] += " />"
+        else:
+            lines[0] += ">"
+            if not record["valid"]:
+                messages = [_format_issue(item) for item in record["errors"]]
+                first = messages[0] if messages else "invalid"
+                lines.append(f'      <failure message={quoteattr(first)} type="error">'
+                             f'{escape(chr(10).join(messages))}</failure>')
+            if record["warnings"]:
+                text = "\n".join("warning: " + _format_issue(item) for item in record["warnings"])
+                lines.append(f'      <system-out>{escape(text)}</system-out>')
+            lines.append("    </testcase>")
+        self.stream.write("\n".join(lines) + "\n")
+        self.stream.flush()
+
+    def close(self):
+        self.stream.write("  </testsuite>\n</testsuites>\n")
+        self.stream.flush()
+
+
+class SarifWriter:
+    """
+    Writes a SARIF 2.1.0 log with one run; every error and warning becomes a result.
+
+    The document is streamed: the header is written up front and each result is
+    appended as soon as its record arrives.
+    """
+
+    def __init__(self, stream, tool):
+        self.stream = stream
+        self.tool = tool
+        self.count = 0
+        header = {
+            "$schema": SARIF_SCHEMA,
+            "version": "2.1.0",
+            "runs": [{"tool": {"driver": {"name": tool, "informationUri": PROJECT_URI}},
+                      "results": []}],
+        }
+        text = json.dumps(header, indent=2)
+        # Everything up to the (still empty) results array; close() writes the rest
+        self.footer = text[text.rindex("[]") + 2:]
+        stream.write(text[:text.rindex("[]") + 1] + "\n")
+
+    def record(self, record):
+        for level, items in (("error", record["errors"]), ("warning", record["warnings"])):
+            for item in items:
+                self._result(record, level, item)
+        self.stream.flush()
+
+    def _result(self, record, level, item):
+        region = {}
+        if item.get("line") is not None:
+            region["startLine"] = item["line"]
+            if item.get("column") is not None:
+                region["startColumn"] = item["column"]
+        physical = {"artifactLocation": {"uri": Path(record["file"]).as_posix()}}
+        if region:
+            physical["region"] = region
+        location = {"physicalLocation": physical}
+        logical = item.get("location")
+        if logical:
+            location["logicalLocations"] = [{"fullyQualifiedName": logical}]
+        message = item["message"]
+        if record.get("name"):
+            message = f"{record['name']}: {message}"
+        if item.get("suggestion"):
+            message += f" ({item['suggestion']})"
+        result = {
+            "ruleId": f"{self.tool}/{level}",
+            "level": level,
+            "message": {"text": message},
+            "locations": [location],
+        }
+        separator = ",\n" if self.count else ""
+        self.stream.write(separator + "        " + json.dumps(result, ensure_ascii=False))
+        self.count += 1
+
+    def close(self):
+        self.stream.write(("\n" if self.count else "") + "      ]" + self.footer + "\n")
+        self.stream.flush()
+
+
+_WRITERS = {"jsonl": JsonLinesWriter, "junit": JUnitWriter, "sarif": SarifWriter}
+
+
+def _format_issue(item):
+    location = item.get("location")
+    if item.get("line") is not None:
+        location = f"line {item['line']}" + (f", column {item['column']}"
+                                             if item.get("column") is not None else "")
+    return f"{location}: {item['message']}" if location else item["message"]
+
+
+def create_writer(fmt, tool, stream=None):
+    """
+    Create a streaming writer.
+
+    Args:
+        fmt: One of FORMATS
+        tool: Name of the producing tool (JUnit suite name, SARIF driver name)
+        stream: Text stream to write to (default: stdout)
+    """
+    return _WRITERS[fmt](stream or sys.stdout, tool)
+
+
+def format_quiet_line(record):
+    """One undecorated line for a failing record (quiet mode), or None if it passed."""
+    if record["valid"]:
+        return None
+    name = f" {record['name']}" if record.get("name") else ""
+    first = _format_issue(record["errors"][0]) if record["errors"] else "invalid"
+    more = f" (+{len(record['errors']) - 1} more)" if len(record["errors"]) > 1 else ""
+    return f"{record['file']}{name}: {first}{more}"
+
+
+def add_format_arguments(parser):
+    """Add the --format, --output and --quiet options to an argparse parser."""
+    parser.add_argument("--format", choices=FORMATS, default=None,
+                        help="stream one machine-readable record per result instead of the "
+                             "decorated report")
+    parser.add_argument("--output", metavar="PATH", default=None,
+                        help="with --format, write the records to PATH instead of stdout")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="no decoration: print one plain line per failure and nothing "
+                             "on success")
+
+
+class Reporter:
+    """
+    Where the validators send records in --format or --quiet mode.
+
+    With a format, records go to the streaming writer; in quiet mode only failing
+    records are printed, one plain line each.
+    """
+
+    def __init__(self, fmt=None, tool=None, output=None, quiet=False):
+        self.quiet = quiet
+        # Captured now: callers may redirect sys.stdout to silence progress output
+        self.stream = sys.stdout
+        self.valid = 0
+        self.invalid = 0
+        self._file = open(output, 'w', encoding='utf-8', newline='\n') if output else None
+        self.writer = create_writer(fmt, tool, self._file or self.stream) if fmt else None
+
+    def record(self, record):
+        if record["valid"]:
+            self.valid += 1
+        else:
+            self.invalid += 1
+        if self.writer is not None:
+            self.writer.record(record)
+        elif self.quiet:
+            line = format_quiet_line(record)
+            if line:
+                self.stream.write(line + "\n")
+                self.stream.flush()
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        if self._file is not None:
+            self._file.close()
+
+
+def create_reporter(args, tool):
+    """Build a Reporter from parsed --format/--output/--quiet options, or None for text mode."""
+    if not args.format and not args.quiet:
+        return None
+    return Reporter(args.format, tool, args.output, args.quiet)
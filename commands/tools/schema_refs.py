@@ -0,0 +1,526 @@
+"""
+JSON Schema $ref Resolver
+Offline, memoized resolution of `$ref`s against the schema itself (including resources
+embedded with their own `$id`), a local registry of shared `$defs` (for example the `AIGD.*`
+and `com.IvanMurzak.*` definitions that every exported tool schema repeats) and the
+standard JSON Schema metaschemas. Nothing is ever fetched over the network.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from urllib.parse import unquote, urldefrag, urljoin, urlsplit
+
+from mcp_catalog import extract_mcp_tools
+
+try:
+    from jsonschema_specifications import REGISTRY as METASCHEMAS
+except ImportError:
+    METASCHEMAS = None
+
+try:
+    import referencing
+    import referencing.exceptions
+    import referencing.jsonschema
+except ImportError:
+    referencing = None
+
+# Keywords whose value is a single subschema
+SCHEMA_KEYWORDS = (
+    "additionalItems", "additionalProperties", "contains", "contentSchema", "else", "if",
+    "items", "not", "propertyNames", "then", "unevaluatedItems", "unevaluatedProperties",
+)
+# Keywords whose value is an array of subschemas
+SCHEMA_ARRAY_KEYWORDS = ("allOf", "anyOf", "oneOf", "prefixItems", "items")
+# Keywords whose value is an object of named subschemas
+SCHEMA_MAP_KEYWORDS = (
+    "$defs", "definitions", "dependentSchemas", "patternProperties", "properties",
+)
+
+_KEYWORD_KINDS = {keyword: "schema" for keyword in SCHEMA_KEYWORDS + SCHEMA_ARRAY_KEYWORDS}
+_KEYWORD_KINDS.update({keyword: "map" for keyword in SCHEMA_MAP_KEYWORDS})
+_KEYWORD_KINDS["dependencies"] = "dependencies"
+
+
+class UnresolvedRefError(LookupError):
+    """Raised when a `$ref` can't be resolved locally."""
+
+    def __init__(self, ref, reason):
+        super().__init__(f"Unresolved $ref '{ref}': {reason}")
+        self.ref = ref
+        self.reason = reason
+
+
+class ExternalRefError(UnresolvedRefError):
+    """Raised when a `$ref` points into a document that is not available offline."""
+
+
+def escape_pointer_token(token):
+    """Escape a key for use as a JSON pointer token."""
+    token = str(token)
+    if "~" in token or "/" in token:
+        return token.replace("~", "~0").replace("/", "~1")
+    return token
+
+
+def iter_child_schemas(node, pointer=""):
+    """
+    Yield (json_pointer, subschema) for the direct subschemas of a schema node.
+
+    Only schema keywords are descended into, so `$ref`-like strings inside
+    `const`, `enum`, `default` or unrelated data are never mistaken for refs.
+    """
+    if not isinstance(node, dict):
+        return
+    # Nodes have a handful of keys, so scanning them beats probing every keyword
+    for keyword, value in node.items():
+        kind = _KEYWORD_KINDS.get(keyword)
+        if kind is None:
+            continue
+        if isinstance(value, dict):
+            if kind == "map":
+                for name, child in value.items():
+                    yield f"{pointer}/{keyword}/{escape_pointer_token(name)}", child
+            elif kind == "dependencies":
+                for name, child in value.items():
+                    if isinstance(child, dict):
+                        yield f"{pointer}/dependencies/{escape_pointer_token(name)}", child
+            else:
+                yield f"{pointer}/{keyword}", value
+        elif isinstance(value, list) and keyword in SCHEMA_ARRAY_KEYWORDS:
+            for index, child in enumerate(value):
+                yield f"{pointer}/{keyword}/{index}", child
+
+
+def iter_subschemas(schema, pointer=""):
+    """
+    Walk a schema and yield (json_pointer, subschema) for it and every nested subschema.
+
+    Args:
+        schema: The JSON schema (dict or bool)
+        pointer: JSON pointer of schema within its document
+
+    Yields:
+        Tuples of (json_pointer, subschema)
+    """
+    stack = [(pointer, schema)]
+    while stack:
+        pointer, node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+        yield pointer, node
+        stack.extend(iter_child_schemas(node, pointer))
+
+
+def schema_depth(schema):
+    """Return the nesting depth of subschemas (1 for a flat schema, 0 for a boolean one)."""
+    if not isinstance(schema, dict):
+        return 0
+    depth = 0
+    stack = [(schema, 1)]
+    while stack:
+        node, level = stack.pop()
+        depth = max(depth, level)
+        for _, child in iter_child_schemas(node):
+            if isinstance(child, dict):
+                stack.append((child, level + 1))
+    return depth
+
+
+def iter_refs(schema):
+    """Yield (json_pointer_of_ref_keyword, ref) for every `$ref` in a schema."""
+    for pointer, node in iter_subschemas(schema):
+        ref = node.get("$ref")
+        if isinstance(ref, str):
+            yield f"{pointer}/$ref", ref
+
+
+def join_uri(base, ref):
+    """Resolve ref against the base URI; unlike urljoin, also for `urn:` and `tag:` bases."""
+    if not base:
+        return ref
+    if ref.startswith("#"):
+        return urldefrag(base).url + ref
+    if urlsplit(ref).scheme:
+        return ref
+    return urljoin(base, ref)
+
+
+def iter_resources(schema, base_uri=""):
+    """
+    Walk a schema and yield (json_pointer, base_uri, subschema) for every subschema.
+
+    base_uri is the URI established by the closest enclosing `$id` (the subschema's
+    own included), or base_uri for subschemas outside any `$id`.
+    """
+    stack = [("", base_uri, schema)]
+    while stack:
+        pointer, base, node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+        schema_id = node.get("$id")
+        if isinstance(schema_id, str):
+            base = urldefrag(join_uri(base, schema_id)).url
+        yield pointer, base, node
+        stack.extend((child_pointer, base, child)
+                     for child_pointer, child in iter_child_schemas(node, pointer))
+
+
+def resolve_pointer(document, pointer):
+    """
+    Resolve a JSON pointer (RFC 6901) inside document.
+
+    Raises:
+        KeyError: if any token of the pointer is missing
+    """
+    node = document
+    if not pointer:
+        return node
+    if not pointer.startswith("/"):
+        raise KeyError(pointer)
+    for token in pointer[1:].split("/"):
+        token = token.replace("~1", "/").replace("~0", "~")
+        if isinstance(node, list):
+            try:
+                node = node[int(token)]
+            except (ValueError, IndexError):
+                raise KeyError(token) from None
+        elif isinstance(node, dict) and token in node:
+            node = node[token]
+        else:
+            raise KeyError(token)
+    return node
+
+
+class SchemaRegistry:
+    """
+    Local registry of schema documents and shared definitions.
+
+    Documents are registered under their `$id` (or an explicit URI), together
+    with the resources embedded in them under their own `$id`; every entry of
+    their `$defs`/`definitions` is also registered by name so that
+    `#/$defs/<name>` refs missing from a schema can fall back to the shared copy.
+    The standard metaschemas are always available.
+    """
+
+    def __init__(self):
+        self.documents = {}
+        self.defs = {}
+
+    def add_document(self, document, uri=None):
+        """Register a schema document, its embedded resources and its definitions."""
+        if not isinstance(document, dict):
+            return
+        if uri:
+            self.documents[urldefrag(uri).url] = document
+        for _, base, node in iter_resources(document, urldefrag(uri or "").url):
+            if base and isinstance(node.get("$id"), str):
+                self.documents.setdefault(base, node)
+        for keyword in ("$defs", "definitions"):
+            for name, definition in (document.get(keyword) or {}).items():
+                self.defs.setdefault(name, definition)
+
+    def get_document(self, uri):
+        """
+        Look up a registered document or a standard metaschema by URI.
+
+        Returns:
+            The document, or None if it isn't available offline
+        """
+        uri = urldefrag(uri).url
+        document = self.documents.get(uri)
+        if document is None and METASCHEMAS is not None:
+            try:
+                document = METASCHEMAS.contents(uri)
+            except LookupError:
+                document = None
+        return document
+
+    def add_file(self, path):
+        """
+        Register a JSON file: a plain schema, or a tools/list dump whose tools'
+        inputSchema/outputSchema definitions are all registered.
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            content = json.load(f)
+        if isinstance(content, dict) and ("$schema" in content or "$defs" in content
+                                          or "definitions" in content):
+            self.add_document(content, uri=content.get("$id") or Path(path).resolve().as_uri())
+            return
+        for mcp_tool in extract_mcp_tools(content):
+            if isinstance(mcp_tool, dict):
+                self.add_document(mcp_tool.get("inputSchema"))
+                self.add_document(mcp_tool.get("outputSchema"))
+
+    def with_shared_defs(self, schema):
+        """
+        Add the shared definitions that schema's `#/$defs/<name>` refs need but lack.
+
+        Validators only see the schema they are built from, so this gives them the
+        same fallback as RefResolver. Definitions pulled in are scanned for further
+        refs as well.
+
+        Returns:
+            A shallow copy of schema with the definitions added, or schema itself
+            when nothing is missing
+        """
+        if not isinstance(schema, dict) or not self.defs:
+            return schema
+        result = schema
+        pending = [schema]
+        while pending:
+            for _, ref in iter_refs(pending.pop()):
+                parts = unquote(ref).split("/")
+                if len(parts) != 3 or parts[0] != "#" or parts[1] not in ("$defs", "definitions"):
+                    continue
+                name = parts[2].replace("~1", "/").replace("~0", "~")
+                if name not in self.defs:
+                    continue
+                try:
+                    resolve_pointer(result, f"/{parts[1]}/{parts[2]}")
+                    continue
+                except KeyError:
+                    pass
+                if result is schema:
+                    result = dict(schema)
+                if result.get(parts[1]) is schema.get(parts[1]):
+                    result[parts[1]] = dict(schema.get(parts[1]) or {})
+                result[parts[1]][name] = self.defs[name]
+                pending.append(self.defs[name])
+        return result
+
+    def to_referencing(self):
+        """
+        Build a `referencing.Registry` of the registered documents for jsonschema validators.
+
+        Unknown URIs are never retrieved over the network; jsonschema adds the
+        standard metaschemas itself.
+
+        Returns:
+            The registry, or None if the referencing library is unavailable
+        """
+        if referencing is None:
+            return None
+
+        def retrieve(uri):
+            raise referencing.exceptions.NoSuchResource(ref=uri)
+
+        return referencing.Registry(retrieve=retrieve).with_resources(
+            (uri, referencing.Resource.from_contents(
+                document, default_specification=referencing.jsonschema.DRAFT202012))
+            for uri, document in self.documents.items())
+
+    def fingerprint(self):
+        """Digest of the registered content, for keying cached results."""
+        canonical = json.dumps([sorted(self.documents), self.defs], sort_keys=True)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def from_paths(cls, paths):
+        """Build a registry from JSON files and directories (searched for *.json)."""
+        registry = cls()
+        for path in paths:
+            path = Path(path)
+            files = sorted(path.rglob("*.json")) if path.is_dir() else [path]
+            for file_path in files:
+                registry.add_file(file_path)
+        return registry
+
+
+class RefResolver:
+    """
+    Memoized offline `$ref` resolver.
+
+    Refs are resolved against the base URI of the `$id` they appear under; the
+    root document and its embedded `$id` resources are looked up first, then
+    the registry. Each (document, base URI, ref) is resolved at most once, so
+    catalogs that reuse the same few definitions hundreds of times pay for each
+    lookup only once.
+    """
+
+    def __init__(self, registry=None):
+        self.registry = registry or SchemaRegistry()
+        self._memo = {}
+        # Per document: (base URI of every subschema pointer, resources by URI)
+        self._indexes = {}
+        # Keep documents alive so their id() stays unique for the memo keys
+        self._documents = {}
+
+    def _index(self, document):
+        index = self._indexes.get(id(document))
+        if index is None:
+            bases = {}
+            resources = {}
+            for pointer, base, node in iter_resources(document):
+                bases[pointer] = base
+                if base:
+                    resources.setdefault(base, node)
+            index = self._indexes[id(document)] = (bases, resources)
+            self._documents[id(document)] = document
+        return index
+
+    def base_uri(self, document, pointer=""):
+        """Base URI in effect at the subschema at pointer ("" if there is none)."""
+        return self._index(document)[0].get(pointer, "")
+
+    def resolve(self, ref, document, base=None):
+        """
+        Resolve ref relative to document.
+
+        Args:
+            ref: The `$ref` value
+            document: Root schema the ref appears in
+            base: Base URI in effect where the ref appears; defaults to the root's `$id`
+
+        Returns:
+            The referenced subschema
+
+        Raises:
+            ExternalRefError: if the ref points into a document that isn't available offline
+            UnresolvedRefError: if the ref can't be resolved offline
+        """
+        if base is None:
+            base = self.base_uri(document)
+        key = (id(document), base, ref)
+        try:
+            return self._memo[key]
+        except KeyError:
+            pass
+        target = self._resolve_uncached(ref, document, base)
+        self._memo[key] = target
+        return target
+
+    def _resolve_uncached(self, ref, document, base):
+        uri, fragment = urldefrag(join_uri(base, ref))
+        fragment = unquote(fragment)
+
+        if uri:
+            resources = self._index(document)[1]
+            base = resources.get(uri)
+            if base is None:
+                base = self.registry.get_document(uri)
+            if base is None:
+                raise ExternalRefError(ref, f"document '{uri}' is not in the local registry")
+        else:
+            base = document
+
+        if fragment and not fragment.startswith("/"):
+            # Plain-name fragment: look for a matching $anchor
+            for _, node in iter_subschemas(base):
+                if node.get("$anchor") == fragment:
+                    return node
+            raise UnresolvedRefError(ref, f"no $anchor named '{fragment}'")
+
+        try:
+            return resolve_pointer(base, fragment)
+        except KeyError:
+            pass
+
+        # Fall back to the shared definitions for `#/$defs/<name>` style refs
+        parts = fragment.split("/")
+        if len(parts) == 3 and parts[1] in ("$defs", "definitions"):
+            name = parts[2].replace("~1", "/").replace("~0", "~")
+            if name in self.registry.defs:
+                return self.registry.defs[name]
+        raise UnresolvedRefError(ref, f"JSON pointer '{fragment}' does not exist")
+
+    def ref_cycles(self, schema):
+        """
+        Find `$ref`s that only alias other refs in a loop (A -> B -> A) and
+        can therefore never resolve to an actual schema.
+
+        Returns:
+            List of ref chains, each ending with the ref that closes the loop
+        """
+        cycles = []
+        seen = set()
+        for _, ref in iter_refs(schema):
+            if ref in seen:
+                continue
+            chain = [ref]
+            target_ref = ref
+            while True:
+                seen.add(target_ref)
+                try:
+                    target = self.resolve(target_ref, schema)
+                except UnresolvedRefError:
+                    break
+                if not isinstance(target, dict) or set(target) - {"$ref", "description", "title"}:
+                    break
+                target_ref = target.get("$ref")
+                if not isinstance(target_ref, str):
+                    break
+                if target_ref in chain:
+                    cycles.append(chain + [target_ref])
+                    break
+                chain.append(target_ref)
+        return cycles
+
+    def recursive_refs(self, schema):
+        """
+        Find refs whose target (transitively) refers back to itself, such as
+        `SerializedMember` whose `fields` items are SerializedMembers. These are
+        legal, but can't be inlined.
+
+        Returns:
+            Set of recursive ref strings
+        """
+        graph = {}
+        pending = [ref for _, ref in iter_refs(schema)]
+        while pending:
+            ref = pending.pop()
+            if ref in graph:
+                continue
+            try:
+                target = self.resolve(ref, schema)
+            except UnresolvedRefError:
+                graph[ref] = set()
+                continue
+            children = {child for _, child in iter_refs(target)}
+            graph[ref] = children
+            pending.extend(children)
+
+        recursive = set()
+        for start in graph:
+            stack = list(graph[start])
+            visited = set()
+            while stack:
+                ref = stack.pop()
+                if ref == start:
+                    recursive.add(start)
+                    break
+                if ref in visited:
+                    continue
+                visited.add(ref)
+                stack.extend(graph.get(ref, ()))
+        return recursive
+
+    def check(self, schema):
+        """
+        Check that every `$ref` in schema resolves and no ref only aliases itself.
+
+        Args:
+            schema: The root JSON schema
+
+        Returns:
+            List of issue dictionaries with "severity", "pointer", "ref" and "message";
+            refs into documents that aren't available offline are only warnings
+        """
+        issues = []
+        for pointer, ref in sorted(iter_refs(schema)):
+            try:
+                self.resolve(ref, schema, self.base_uri(schema, pointer[:-len("/$ref")]))
+            except ExternalRefError as e:
+                issues.append({"severity": "warning", "pointer": pointer, "ref": ref,
+                               "message": str(e)})
+            except UnresolvedRefError as e:
+                issues.append({"severity": "error", "pointer": pointer, "ref": ref,
+                               "message": str(e)})
+        for chain in self.ref_cycles(schema):
+            issues.append({
+                "severity": "error",
+                "pointer": next(pointer for pointer, ref in iter_refs(schema) if ref == chain[0]),
+                "ref": chain[0],
+                "message": "$ref cycle never reaches a schema: " + " -> ".join(chain),
+            })
+        return issues
@@ -0,0 +1,52 @@
+"""Tests for generate_tool_calls.py."""
+
+import io
+import json
+import random
+import re
+
+import pytest
+
+from generate_tool_calls import (PlanError, UnsupportedSchemaError, attach_validators,
+                                 compile_pattern, compile_tool_plans, write_payloads)
+
+
+@pytest.mark.parametrize("pattern", [
+    r"^[a-z]+$",
+    r"^[A-Z]{3}-\d{2,4}$",
+    r"^v(\d+\.){2}\d+(-(alpha|beta))?$",
+    r"[^abc]\w*x",
+    r"^\S+@\S+\.(com|org)$",
+])
+def test_generated_strings_match_pattern(pattern):
+    generate = compile_pattern(pattern)
+    rng = random.Random(7)
+    for _ in range(200):
+        assert re.search(pattern, generate(rng))
+
+
+def test_unsupported_pattern_skips_the_tool():
+    tools = [{"name": "look", "inputSchema": {"type": "object", "properties": {
+                 "a": {"type": "string", "pattern": "^(?=x)x+$"}}}},
+             {"name": "plain", "inputSchema": {"type": "object"}}]
+    skipped = []
+    plans = compile_tool_plans(tools, skipped=skipped)
+    assert [plan.name for plan in plans] == ["plain"]
+    assert [name for name, _ in skipped] == ["look"]
+    with pytest.raises(PlanError):
+        compile_tool_plans(tools)
+    with pytest.raises(UnsupportedSchemaError):
+        compile_pattern(r"(a)\1")
+
+
+def test_payloads_labelled_valid_pass_their_schema():
+    schema = {"type": "object", "required": ["id"], "properties": {
+        "id": {"type": "string", "pattern": r"^[a-z]{2}\d+$", "maxLength": 5}}}
+    plans = compile_tool_plans([{"name": "t", "inputSchema": schema}])
+    attach_validators(plans)
+    out = io.StringIO()
+    stats = write_payloads(plans, out, random.Random(1), 500, invalid_ratio=0.2)
+    assert not stats["nonconforming"]
+    for line in out.getvalue().splitlines():
+        record = json.loads(line)
+        assert plans[0].validator.is_valid(record["arguments"]) == record["expectValid"]
@@ -0,0 +1,35 @@
+"""Tests for minify_catalog.py."""
+
+import copy
+
+from minify_catalog import check_equivalence, collect_probe_instances, minify_schema
+
+
+def new_stats():
+    return {"keywordsDropped": 0, "defsPruned": 0, "defsMerged": 0,
+            "subschemasHoisted": 0, "refsIntroduced": 0}
+
+
+def test_keeps_accepting_keywords_read_by_unevaluated_properties():
+    # `additionalProperties: true` marks "x" as evaluated; without it the outer
+    # unevaluatedProperties: false would reject {"x": 1}
+    original = {"allOf": [{"additionalProperties": True}], "unevaluatedProperties": False}
+    minified = minify_schema(original, new_stats())
+    assert minified["allOf"] == [{"additionalProperties": True}]
+    assert check_equivalence(original, minified, collect_probe_instances(original)) == []
+
+
+def test_drops_accepting_keywords_without_unevaluated():
+    original = {"type": "object", "additionalProperties": True,
+                "properties": {"a": {"type": "array", "items": {}}}}
+    stats = new_stats()
+    minified = minify_schema(original, stats)
+    assert minified == {"type": "object", "properties": {"a": {"type": "array"}}}
+    assert stats["keywordsDropped"] == 2
+
+
+def test_probes_catch_dropped_annotations():
+    original = {"allOf": [{"additionalProperties": True}], "unevaluatedProperties": False}
+    broken = copy.deepcopy(original)
+    broken["allOf"] = [{}]
+    assert check_equivalence(original, broken, collect_probe_instances(original))
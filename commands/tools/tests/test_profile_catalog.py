@@ -0,0 +1,12 @@
+"""Tests for profile_catalog.py."""
+
+from profile_catalog import profile_catalog
+
+
+def test_non_object_entries_are_reported_per_tool():
+    tools = [{"name": "a", "description": "A", "inputSchema": {"type": "object"}}, 3, "b"]
+    profiles, totals, errors = profile_catalog(tools)
+    assert [p["name"] for p in profiles] == ["a"]
+    assert totals["tools"] == 1
+    assert errors == ["tools[1]: Tool definition must be a JSON object",
+                      "tools[2]: Tool definition must be a JSON object"]
@@ -0,0 +1,47 @@
+"""Tests for schema_refs.py."""
+
+import pytest
+
+from schema_refs import ExternalRefError, RefResolver, SchemaRegistry
+
+
+def test_self_reference_by_absolute_id():
+    schema = {"$id": "https://ex.com/s.json", "$defs": {"A": {"type": "string"}},
+              "properties": {"a": {"$ref": "https://ex.com/s.json#/$defs/A"}}}
+    assert RefResolver().check(schema) == []
+
+
+def test_metaschemas_resolve_offline():
+    schema = {"properties": {"s": {"$ref": "https://json-schema.org/draft/2020-12/schema"},
+                             "d7": {"$ref": "http://json-schema.org/draft-07/schema#"}}}
+    resolver = RefResolver()
+    assert resolver.check(schema) == []
+    assert resolver.resolve("https://json-schema.org/draft/2020-12/schema", schema)["$id"] \
+        == "https://json-schema.org/draft/2020-12/schema"
+
+
+def test_refs_resolve_against_embedded_id():
+    schema = {"$id": "https://ex.com/root.json",
+              "properties": {"x": {"$ref": "item.json"}, "y": {"$ref": "item.json#/$defs/N"}},
+              "$defs": {"item": {"$id": "item.json", "$defs": {"N": {"type": "number"}},
+                                 "properties": {"n": {"$ref": "#/$defs/N"}}}}}
+    resolver = RefResolver()
+    assert resolver.check(schema) == []
+    assert resolver.resolve("#/$defs/N", schema, resolver.base_uri(schema, "/$defs/item")) \
+        == {"type": "number"}
+    # Outside the embedded resource the same ref points into the root, where N doesn't exist
+    with pytest.raises(LookupError):
+        resolver.resolve("#/$defs/N", schema)
+
+
+def test_refs_into_unknown_documents_are_warnings():
+    schema = {"properties": {"e": {"$ref": "https://elsewhere.org/x.json#/$defs/Q"},
+                             "m": {"$ref": "#/$defs/Missing"}}}
+    issues = {issue["pointer"]: issue["severity"] for issue in RefResolver().check(schema)}
+    assert issues == {"/properties/e/$ref": "warning", "/properties/m/$ref": "error"}
+    with pytest.raises(ExternalRefError):
+        RefResolver().resolve("https://elsewhere.org/x.json", schema)
+
+    registry = SchemaRegistry()
+    registry.add_document({"$id": "https://elsewhere.org/x.json", "$defs": {"Q": {}}})
+    assert [issue["severity"] for issue in RefResolver(registry).check(schema)] == ["error"]
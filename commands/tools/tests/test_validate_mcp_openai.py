@@ -0,0 +1,100 @@
+"""Online validation of validate_mcp_openai.py against mock_openai_server.py on a free port."""
+
+import math
+import threading
+
+import pytest
+
+pytest.importorskip("openai")
+
+from mock_openai_server import create_server  # noqa: E402
+from validate_mcp_openai import validate_tools_with_openai  # noqa: E402
+from verdict_cache import ToolVerdictCache  # noqa: E402
+
+
+def make_tool(name):
+    return {"name": name, "description": f"The {name} tool",
+            "inputSchema": {"type": "object", "properties": {"id": {"type": "string"}}}}
+
+
+@pytest.fixture
+def mock_server(monkeypatch):
+    """Start a mock server configured by the test; yields (start(**options) -> server, url)."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    servers = []
+
+    def start(**options):
+        server = create_server(port=0, quiet=True, **options)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        host, port = server.server_address[:2]
+        return server, f"http://{host}:{port}/v1"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_accepted_catalog(mock_server):
+    server, url = mock_server()
+    result = validate_tools_with_openai([make_tool("alpha"), make_tool("beta")], "catalog.json",
+                                        base_url=url)
+    assert result["isValid"], result["errors"]
+    assert result["tools"] == ["alpha", "beta"]
+    assert server.request_count == 1
+
+
+def test_rejected_tool_is_reported(mock_server):
+    server, url = mock_server(reject=["beta"])
+    result = validate_tools_with_openai([make_tool("alpha"), make_tool("beta")], "catalog.json",
+                                        base_url=url)
+    assert not result["isValid"]
+    assert any("beta" in error["message"] for error in result["errors"]), result["errors"]
+
+
+@pytest.mark.parametrize("count, bad", [(8, [3, 6]), (32, [0, 17, 31])])
+def test_bisection_isolates_rejected_tools(mock_server, count, bad):
+    server, url = mock_server(reject=[f"tool_{i}" for i in bad])
+    tools = [make_tool(f"tool_{i}") for i in range(count)]
+    result = validate_tools_with_openai(tools, "catalog.json", base_url=url, bisect=True)
+    assert not result["isValid"]
+    assert [error["location"] for error in result["errors"]] \
+        == [f"tools[{i}].inputSchema" for i in bad]
+    # The whole batch, then at most two requests per level of each rejected tool's path
+    assert server.request_count <= 1 + 2 * len(bad) * math.ceil(math.log2(count))
+
+
+def test_rate_limited_requests_are_retried(mock_server):
+    server, url = mock_server(rate_limit=2)
+    tools = [make_tool(f"tool_{i}") for i in range(6)]
+    result = validate_tools_with_openai(tools, "catalog.json", base_url=url, concurrency=6,
+                                        chunk_size=1)
+    assert result["isValid"], result["errors"]
+    assert server.throttled_count > 0
+    # Every throttled request was sent again until it went through
+    assert server.request_count == len(tools) + server.throttled_count
+
+
+def test_cached_verdicts_are_kept_per_endpoint(mock_server, tmp_path):
+    cache_path = tmp_path / "verdicts.json"
+    tools = [make_tool("alpha")]
+    first, first_url = mock_server()
+    cache = ToolVerdictCache(cache_path)
+    result = validate_tools_with_openai(tools, "catalog.json", base_url=first_url, cache=cache)
+    assert result["isValid"], result["errors"]
+    cache.save()
+    assert first.request_count == 1
+
+    # A warm run makes no request and leaves the cache file alone
+    cache = ToolVerdictCache(cache_path)
+    assert validate_tools_with_openai(tools, "catalog.json", base_url=first_url + "/",
+                                      cache=cache)["isValid"]
+    assert first.request_count == 1
+    assert not cache.dirty
+
+    # Verdicts of one endpoint don't carry over to another
+    second, second_url = mock_server(reject=["alpha"])
+    result = validate_tools_with_openai(tools, "catalog.json", base_url=second_url, cache=cache)
+    assert not result["isValid"]
+    assert second.request_count == 1
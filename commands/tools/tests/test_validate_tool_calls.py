@@ -0,0 +1,33 @@
+"""Tests for validate_tool_calls.py."""
+
+import json
+
+import pytest
+
+from schema_refs import SchemaRegistry
+from validate_tool_calls import compile_tool_validators, validate_tool_calls
+
+TOOL = {"name": "Assets_Modify", "inputSchema": {
+    "type": "object", "required": ["ref"],
+    "properties": {"ref": {"$ref": "#/$defs/com.IvanMurzak.Ref"},
+                   "ext": {"$ref": "https://ex.com/shared.json#/$defs/Id"}}}}
+SHARED = {"$id": "https://ex.com/shared.json", "$defs": {
+    "com.IvanMurzak.Ref": {"type": "object", "required": ["id"],
+                           "properties": {"id": {"$ref": "#/$defs/Id"}}},
+    "Id": {"type": "integer"}}}
+
+
+def test_refs_resolve_against_the_registry():
+    registry = SchemaRegistry()
+    registry.add_document(SHARED)
+    validators = compile_tool_validators([TOOL], registry)
+    lines = [json.dumps({"name": "Assets_Modify", "arguments": arguments}) for arguments in
+             ({"ref": {"id": 3}, "ext": 4}, {"ref": {"id": "x"}}, {"ref": {"id": 1}, "ext": "no"})]
+    stats = validate_tool_calls(validators, lines)
+    assert stats["calls"]["Assets_Modify"] == 3
+    assert stats["failures"]["Assets_Modify"] == 2
+
+
+def test_refs_outside_the_registry_fail_to_compile():
+    with pytest.raises(ValueError, match="not in the local registry"):
+        compile_tool_validators([TOOL])
@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+"""
+Provider Schema Transpiler
+Rewrites the inputSchemas of a tools/list dump for a target provider dialect and writes
+a ready-to-send array of function tools, so the conversion is done once per catalog
+version instead of on every request.
+
+Dialects are pluggable (see register_dialect); the built-in ones are:
+  openai         OpenAI function calling (non-strict): $refs inlined, meta keywords dropped
+  openai-strict  OpenAI Structured Outputs (strict: true): closed objects, every property
+                 required (optional ones made nullable), unsupported keywords stripped
+                 or rewritten, $refs kept in a pruned $defs
+  draft7         Generic JSON Schema draft-07 subset: $refs inlined, 2019-09/2020-12
+                 keywords rewritten to their draft-07 equivalents or dropped
+
+$refs are inlined with memoization (each referenced definition is transpiled once per
+tool) and recursive definitions stay behind a $ref. The inlined size is capped, so a
+catalog can't blow up through repeated expansion.
+
+Usage:
+    python transpile_catalog.py mcpTool.json --dialect openai-strict -o tools.strict.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from mcp_catalog import extract_mcp_tools
+from openai_rules import STRICT_UNSUPPORTED_KEYWORDS
+from schema_refs import (
+    SCHEMA_ARRAY_KEYWORDS, SCHEMA_KEYWORDS, SCHEMA_MAP_KEYWORDS, RefResolver, SchemaRegistry,
+    UnresolvedRefError, escape_pointer_token, iter_refs,
+)
+from validate_json_schema import Colors
+
+# Maximum number of schema nodes in one transpiled tool schema
+DEFAULT_MAX_NODES = 20000
+# Keywords that only annotate a schema; they may be merged next to an inlined $ref
+ANNOTATION_KEYWORDS = ("title", "description", "default", "examples", "deprecated",
+                       "readOnly", "writeOnly")
+META_KEYWORDS = ("$schema", "$id", "$comment", "$anchor", "$dynamicAnchor", "$vocabulary")
+DRAFT7_SCHEMA_URI = "http://json-schema.org/draft-07/schema#"
+
+DIALECTS = {}
+
+
+class TranspileError(ValueError):
+    """Raised when a schema can't be expressed in the target dialect."""
+
+
+class Dialect:
+    """
+    A provider profile.
+
+    Args:
+        name: Dialect name used on the command line
+        description: One-line summary
+        inline_refs: Inline non-recursive $refs (recursive ones are always kept)
+        defs_keyword: Root keyword holding the definitions that remain referenced
+        dropped_keywords: Keywords removed from every schema node
+        renamed_keywords: Keywords renamed on every schema node (e.g. oneOf -> anyOf)
+        node_hooks: Functions (node, notes) -> node applied to every transpiled node,
+            after its subschemas were transpiled
+        schema_uri: $schema set on the root schema, or None to leave it out
+        strict: Mark the function as strict (OpenAI Structured Outputs)
+    """
+
+    def __init__(self, name, description, inline_refs=True, defs_keyword="$defs",
+                 dropped_keywords=(), renamed_keywords=None, node_hooks=(), schema_uri=None,
+                 strict=False):
+        self.name = name
+        self.description = description
+        self.inline_refs = inline_refs
+        self.defs_keyword = defs_keyword
+        self.dropped_keywords = frozenset(dropped_keywords)
+        self.renamed_keywords = dict(renamed_keywords or {})
+        self.node_hooks = tuple(node_hooks)
+        self.schema_uri = schema_uri
+        self.strict = strict
+
+
+def register_dialect(dialect):
+    """Register (or replace) a dialect by name."""
+    DIALECTS[dialect.name] = dialect
+    return dialect
+
+
+def def_name_from_ref(ref):
+    """Name of the definition a `#/$defs/<name>` or `#/definitions/<name>` ref points to."""
+    parts = ref.split("/")
+    if len(parts) == 3 and parts[0] == "#" and parts[1] in ("$defs", "definitions"):
+        return parts[2].replace("~1", "/").replace("~0", "~")
+    return None
+
+
+def _types(node):
+    value = node.get("type")
+    if isinstance(value, str):
+        return [value]
+    return list(value) if isinstance(value, list) else []
+
+
+def _make_nullable(schema):
+    """Return schema widened to also accept null."""
+    if not isinstance(schema, dict):
+        return schema
+    types = _types(schema)
+    if types and "$ref" not in schema:
+        if "null" in types:
+            return schema
+        nullable = dict(schema)
+        nullable["type"] = types + ["null"]
+        if isinstance(nullable.get("enum"), list) and None not in nullable["enum"]:
+            nullable["enum"] = nullable["enum"] + [None]
+        return nullable
+    if isinstance(schema.get("anyOf"), list) and "$ref" not in schema:
+        if {"type": "null"} in schema["anyOf"]:
+            return schema
+        nullable = dict(schema)
+        nullable["anyOf"] = schema["anyOf"] + [{"type": "null"}]
+        return nullable
+    return {"anyOf": [schema, {"type": "null"}]}
+
+
+def merge_all_of(node, notes):
+    """
+    Fold allOf into the node (properties and required are merged).
+
+    Raises:
+        TranspileError: if a member can't be merged without loosening the schema (a
+            $ref, a false schema, or a keyword whose value conflicts with the node's)
+    """
+    parts = node.pop("allOf", None)
+    if not isinstance(parts, list):
+        return node
+    for part in parts:
+        if part is True or part == {}:
+            continue
+        if not isinstance(part, dict):
+            raise TranspileError("allOf member 'false' can't be expressed in strict mode")
+        if "$ref" in part:
+            raise TranspileError(f"allOf member $ref '{part['$ref']}' can't be merged in strict "
+                                 f"mode; inline the definition into the schema")
+        for key, value in part.items():
+            if key == "properties" and isinstance(value, dict):
+                properties = node.setdefault("properties", {})
+                for name, schema in value.items():
+                    if name in properties and properties[name] != schema:
+                        raise TranspileError(f"allOf members constrain property '{name}' "
+                                             f"differently; can't merge them in strict mode")
+                    properties[name] = schema
+            elif key == "required" and isinstance(value, list):
+                required = node.setdefault("required", [])
+                required.extend(name for name in value if name not in required)
+            elif key in node and node[key] != value and key not in ANNOTATION_KEYWORDS:
+                raise TranspileError(f"allOf members set '{key}' differently; can't merge "
+                                     f"them in strict mode")
+            else:
+                node.setdefault(key, value)
+    notes.append("allOf merged into its parent schema")
+    return node
+
+
+def close_strict_object(node, notes):
+    """Strict mode: objects are closed and list every property as required."""
+    if "object" not in _types(node) and "properties" not in node:
+        return node
+    if node.get("additionalProperties") not in (None, False):
+        notes.append("additionalProperties schema replaced with false")
+    node["additionalProperties"] = False
+    properties = node.get("properties")
+    if isinstance(properties, dict):
+        required = set(node.get("required") or [])
+        optional = [name for name in properties if name not in required]
+        if optional:
+            node["properties"] = {
+                name: schema if name in required else _make_nullable(schema)
+                for name, schema in properties.items()
+            }
+            notes.append(f"optional properties made nullable: {', '.join(optional)}")
+        node["required"] = list(properties)
+    return node
+
+
+def convert_prefix_items(node, notes):
+    """draft-07: prefixItems + items become array-form items + additionalItems."""
+    if "prefixItems" not in node:
+        return node
+    prefix = node.pop("prefixItems")
+    if "items" in node:
+        node["additionalItems"] = node.pop("items")
+    node["items"] = prefix
+    return node
+
+
+def convert_dependent_keywords(node, notes):
+    """draft-07: dependentRequired/dependentSchemas become dependencies."""
+    for keyword in ("dependentRequired", "dependentSchemas"):
+        value = node.pop(keyword, None)
+        if isinstance(value, dict):
+            node.setdefault("dependencies", {}).update(value)
+    return node
+
+
+register_dialect(Dialect(
+    "openai", "OpenAI function calling (non-strict)",
+    inline_refs=True,
+    dropped_keywords=META_KEYWORDS,
+))
+register_dialect(Dialect(
+    "openai-strict", "OpenAI Structured Outputs (strict: true)",
+    inline_refs=False,
+    dropped_keywords=META_KEYWORDS + tuple(keyword for keyword in STRICT_UNSUPPORTED_KEYWORDS
+                                           if keyword not in ("allOf", "oneOf")),
+    renamed_keywords={"oneOf": "anyOf", "definitions": "$defs"},
+    node_hooks=(merge_all_of, close_strict_object),
+    strict=True,
+))
+register_dialect(Dialect(
+    "draft7", "Generic JSON Schema draft-07 subset",
+    inline_refs=True,
+    defs_keyword="definitions",
+    dropped_keywords=("$schema", "$id", "$anchor", "$dynamicAnchor", "$dynamicRef", "$recursiveAnchor",
+                      "$recursiveRef", "$vocabulary", "unevaluatedProperties",
+                      "unevaluatedItems", "minContains", "maxContains", "contentSchema"),
+    renamed_keywords={"$defs": "definitions"},
+    node_hooks=(convert_prefix_items, convert_dependent_keywords),
+    schema_uri=DRAFT7_SCHEMA_URI,
+))
+
+
+class SchemaTranspiler:
+    """
+    Transpiles the schemas of one catalog for a dialect.
+
+    Args:
+        dialect: Target Dialect
+        registry: Optional SchemaRegistry of shared $defs for resolving $refs
+        max_nodes: Maximum number of schema nodes per transpiled tool schema
+    """
+
+    def __init__(self, dialect, registry=None, max_nodes=DEFAULT_MAX_NODES):
+        self.dialect = dialect
+        self.resolver = RefResolver(registry)
+        self.max_nodes = max_nodes
+
+    def transpile_schema(self, schema):
+        """
+        Transpile a root schema.
+
+        Returns:
+            Tuple of (transpiled schema, list of notes about rewritten/dropped keywords)
+
+        Raises:
+            TranspileError: if a $ref doesn't resolve or the expansion exceeds max_nodes
+        """
+        if not isinstance(schema, dict):
+            raise TranspileError("inputSchema must be an object")
+        self._document = schema
+        self._recursive = self.resolver.recursive_refs(schema)
+        self._memo = {}
+        self._notes = []
+        self._nodes = 0
+
+        root = {key: value for key, value in schema.items()
+                if key not in ("$defs", "definitions")}
+        result, _ = self._transpile(root)
+
+        # Definitions still referenced (recursive ones, or all of them without inlining)
+        defs = {}
+        pending = [ref for _, ref in iter_refs(result)]
+        while pending:
+            ref = pending.pop()
+            name = def_name_from_ref(ref)
+            if name is None or name in defs:
+                continue
+            defs[name], _ = self._transpile(self._resolve_def(name))
+            pending.extend(ref for _, ref in iter_refs(defs[name]))
+        if defs:
+            result[self.dialect.defs_keyword] = dict(sorted(defs.items()))
+        if self.dialect.schema_uri:
+            result = {"$schema": self.dialect.schema_uri, **result}
+        return result, sorted(set(self._notes))
+
+    def _resolve(self, ref):
+        try:
+            return self.resolver.resolve(ref, self._document)
+        except UnresolvedRefError as e:
+            raise TranspileError(str(e)) from e
+
+    def _resolve_def(self, name):
+        """Resolve a definition by name; kept refs were already rewritten to the dialect's keyword."""
+        token = escape_pointer_token(name)
+        for keyword in ("$defs", "definitions"):
+            try:
+                return self.resolver.resolve(f"#/{keyword}/{token}", self._document)
+            except UnresolvedRefError:
+                continue
+        raise TranspileError(f"Unresolved definition '{name}'")
+
+    def _count(self, size):
+        self._nodes += size
+        if self._nodes > self.max_nodes:
+            raise TranspileError(f"inlined schema exceeds {self.max_nodes} nodes; "
+                                 f"raise --max-nodes or use a dialect that keeps $refs")
+
+    def _inline(self, ref):
+        """Transpiled copy of a ref target, memoized per ref (the tree is shared, not copied)."""
+        try:
+            result, size = self._memo[ref]
+        except KeyError:
+            # Count the first expansion while transpiling it, then only its total size on reuse
+            result, size = self._transpile(self._resolve(ref))
+            self._memo[ref] = (result, size)
+            return result, size
+        self._count(size)
+        return result, size
+
+    def _rewrite_ref(self, ref):
+        name = def_name_from_ref(ref)
+        if name is None:
+            return ref
+        return f"#/{self.dialect.defs_keyword}/{escape_pointer_token(name)}"
+
+    def _transpile(self, node):
+        """Return (transpiled node, node count)."""
+        if not isinstance(node, dict):
+            self._count(1)
+            return node, 1
+        dialect = self.dialect
+        ref = node.get("$ref")
+        if isinstance(ref, str) and dialect.inline_refs and ref not in self._recursive:
+            target, size = self._inline(ref)
+            siblings = {key: value for key, value in node.items()
+                        if key != "$ref" and key not in dialect.dropped_keywords}
+            if not siblings:
+                return target, size
+            if not isinstance(target, dict):
+                return target, size
+            merged = dict(target)
+            rest = {}
+            for key, value in siblings.items():
+                if key in ANNOTATION_KEYWORDS:
+                    merged[key] = value
+                else:
+                    rest[key] = value
+            if rest:
+                # Non-annotation siblings still apply next to the ref (2019-09+ semantics)
+                extra, extra_size = self._transpile(rest)
+                return self._apply_hooks({"allOf": [merged, extra]}), size + extra_size
+            return merged, size
+
+        result = {}
+        size = 1
+        self._count(1)
+        for key, value in node.items():
+            if key in dialect.dropped_keywords:
+                self._notes.append(f"dropped unsupported keyword '{key}'")
+                continue
+            key = dialect.renamed_keywords.get(key, key)
+            if key == "$ref" and isinstance(value, str):
+                result[key] = self._rewrite_ref(value)
+            elif key in SCHEMA_MAP_KEYWORDS and key not in ("$defs", "definitions") \
+                    and isinstance(value, dict):
+                result[key] = {}
+                for name, child in value.items():
+                    result[key][name], child_size = self._transpile(child)
+                    size += child_size
+            elif key in SCHEMA_ARRAY_KEYWORDS and isinstance(value, list):
+                result[key] = []
+                for child in value:
+                    transpiled, child_size = self._transpile(child)
+                    result[key].append(transpiled)
+                    size += child_size
+            elif key in SCHEMA_KEYWORDS and isinstance(value, dict):
+                result[key], child_size = self._transpile(value)
+                size += child_size
+            elif key == "dependencies" and isinstance(value, dict):
+                result[key] = {}
+                for name, child in value.items():
+                    if isinstance(child, dict):
+                        result[key][name], child_size = self._transpile(child)
+                        size += child_size
+                    else:
+                        result[key][name] = child
+            elif key in ("$defs", "definitions"):
+                # Nested definitions are reached through their refs, if at all
+                continue
+            else:
+                result[key] = value
+        return self._apply_hooks(result), size
+
+    def _apply_hooks(self, node):
+        for hook in self.dialect.node_hooks:
+            node = hook(node, self._notes)
+        return node
+
+    def transpile_tool(self, mcp_tool):
+        """
+        Transpile one MCP tool into a ready-to-send OpenAI-format function tool.
+
+        Returns:
+            Tuple of (function tool, list of notes)
+        """
+        parameters, notes = self.transpile_schema(mcp_tool.get("inputSchema") or
+                                                  {"type": "object", "properties": {}})
+        function = {
+            "name": mcp_tool.get("name", "unknown"),
+            "description": mcp_tool.get("description", ""),
+            "parameters": parameters,
+        }
+        if self.dialect.strict:
+            function["strict"] = True
+        return {"type": "function", "function": function}, notes
+
+
+def transpile_catalog(json_content, dialect, registry=None, max_nodes=DEFAULT_MAX_NODES):
+    """
+    Transpile every tool of a parsed tools/list document.
+
+    Args:
+        json_content: Parsed tools/list document
+        dialect: Target Dialect
+        registry: Optional SchemaRegistry of shared $defs for resolving $refs
+        max_nodes: Maximum number of schema nodes per transpiled tool schema
+
+    Returns:
+        Tuple of (list of function tools, list of (index, name, notes), list of errors)
+    """
+    tools = []
+    reports = []
+    errors = []
+    for i, mcp_tool in enumerate(extract_mcp_tools(json_content)):
+        name = mcp_tool.get("name", f"tool_{i}") if isinstance(mcp_tool, dict) else f"tool_{i}"
+        if not isinstance(mcp_tool, dict):
+            errors.append(f"tools[{i}]: tool definition must be an object")
+            continue
+        # A fresh transpiler per tool: refs and memo entries are local to each inputSchema
+        transpiler = SchemaTranspiler(dialect, registry, max_nodes)
+        try:
+            tool, notes = transpiler.transpile_tool(mcp_tool)
+        except TranspileError as e:
+            errors.append(f"tools[{i}] '{name}': {e}")
+            continue
+        tools.append(tool)
+        if notes:
+            reports.append((i, name, notes))
+    return tools, reports, errors
+
+
+def main():
+    """Main function to handle command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Transpile the tool schemas of a tools/list dump for a provider dialect.")
+    parser.add_argument("filename", help="tools/list dump (like mcpTool.json)")
+    parser.add_argument("-d", "--dialect", default="openai", choices=sorted(DIALECTS),
+                        help="target dialect (default: %(default)s)")
+    parser.add_argument("-o", "--output", required=True,
+                        help="where to write the array of function tools ('-' for stdout)")
+    parser.add_argument("--defs", action="append", default=[], metavar="PATH",
+                        help="schema, tools/list dump or directory with shared $defs used to "
+                             "resolve $refs (repeatable)")
+    parser.add_argument("--max-nodes", type=int, default=DEFAULT_MAX_NODES, metavar="N",
+                        help="fail tools whose inlined schema exceeds N nodes "
+                             "(default: %(default)s)")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="list the rewritten and dropped keywords per tool")
+    args = parser.parse_args()
+
+    if not Path(args.filename).exists():
+        print(f"{Colors.RED}Error: File '{args.filename}' not found.{Colors.RESET}")
+        sys.exit(1)
+
+    try:
+        with open(args.filename, 'r', encoding='utf-8') as f:
+            json_content = json.load(f)
+    except json.JSONDecodeError as e:
+        print(f"{Colors.RED}Error: Invalid JSON format in '{args.filename}'{Colors.RESET}")
+        print(f"  Line {e.lineno}, Column {e.colno}: {e.msg}")
+        sys.exit(1)
+
+    registry = SchemaRegistry.from_paths(args.defs) if args.defs else None
+    dialect = DIALECTS[args.dialect]
+    tools, reports, errors = transpile_catalog(json_content, dialect, registry, args.max_nodes)
+
+    # Progress goes to stderr when the tools themselves are written to stdout
+    log = sys.stderr if args.output == "-" else sys.stdout
+
+    if errors:
+        print(f"{Colors.RED}✗ {len(errors)} tool(s) can't be transpiled to '{dialect.name}' "
+              f"- nothing written:{Colors.RESET}", file=log)
+        for error in errors:
+            print(f"  {error}", file=log)
+        sys.exit(1)
+
+    output = json.dumps(tools, ensure_ascii=False, separators=(',', ':'))
+    if args.output == "-":
+        sys.stdout.write(output + "\n")
+    else:
+        with open(args.output, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(output + "\n")
+
+    print(f"{Colors.GREEN}✓ {len(tools)} tool(s) transpiled to '{dialect.name}' "
+          f"({dialect.description}), written to {args.output}{Colors.RESET}", file=log)
+    if reports:
+        print(f"{Colors.ORANGE}⚠ {len(reports)} tool(s) needed rewrites{Colors.RESET}", file=log)
+        for index, name, notes in reports:
+            if args.verbose:
+                print(f"  tools[{index}] '{name}':", file=log)
+                for note in notes:
+                    print(f"    - {note}", file=log)
+            else:
+                print(f"  tools[{index}] '{name}': {len(notes)} rewrite(s)", file=log)
+
+
+if __name__ == "__main__":
+    main()
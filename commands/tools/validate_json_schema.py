@@ -2,10 +2,27 @@
 """
 JSON Schema Validator
 Validates a JSON schema file to ensure it's well-formed and follows JSON Schema specifications.
+
+Usage:
+    python validate_json_schema.py schema.json
+    python validate_json_schema.py schemas/ "exports/**/*.json" other.json   # batch mode
+    python validate_json_schema.py schemas/ --watch                          # re-validate on save
+    python validate_json_schema.py big_schema.json --all-errors              # every error at once
+    python validate_json_schema.py mcpTool.json --catalog                    # every tool's inputSchema
 """
 
+import argparse
+import contextlib
+import glob
+import hashlib
+import io
 import json
+import os
 import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from importlib import metadata
 from pathlib import Path
 
 try:
@@ -16,12 +33,38 @@ try:
         Draft202012Validator,
         ValidationError
     )
-    from jsonschema.exceptions import SchemaError
+    from jsonschema.exceptions import best_match
+    from jsonschema.validators import validator_for
 except ImportError:
     print("Error: jsonschema library not found.")
     print("Install it with: pip install jsonschema")
     sys.exit(1)
 
+try:
+    JSONSCHEMA_VERSION = metadata.version('jsonschema')
+except metadata.PackageNotFoundError:
+    JSONSCHEMA_VERSION = 'unknown'
+
+# Catalog mode: most tools handed to a worker process at a time
+CATALOG_BATCH_SIZE = 8
+# Catalog mode: number of slowest tools listed in the summary
+SLOWEST_TOOLS_SHOWN = 3
+
+# Result cache defaults
+DEFAULT_CACHE_PATH = Path(__file__).parent / '.cache' / 'validate_json_schema.json'
+DEFAULT_CACHE_SIZE = 2000
+CACHE_FORMAT_VERSION = 6
+# Stands in for the file name in cached reports, which are replayed for any file with the
+# same content
+FILENAME_PLACEHOLDER = "\0file\0"
+
+from file_watch import create_watcher
+from json_positions import locate_pointers
+from mcp_catalog import extract_mcp_tools, mcp_tool_pointer
+from phase_timing import TIMER, add_instrumentation_arguments, instrumented, phase
+from report_formats import add_format_arguments, create_reporter, issue, make_record
+from schema_refs import RefResolver, SchemaRegistry, escape_pointer_token
+
 # Try to import colorama for Windows color support
 try:
     from colorama import init, Fore, Style
@@ -50,12 +93,15 @@ def get_validator_for_schema(schema):
     Determine the appropriate validator based on the $schema field.
 
     Args:
-        schema: The JSON schema dictionary
+        schema: The JSON schema (a dictionary, or a boolean schema)
 
     Returns:
-        The appropriate validator class
+        The appropriate validator class; Draft 2020-12 when the schema has no
+        usable $schema (including boolean schemas and non-schema values)
     """
-    schema_uri = schema.get('$schema', '')
+    schema_uri = schema.get('$schema', '') if isinstance(schema, dict) else ''
+    if not isinstance(schema_uri, str):
+        schema_uri = ''
 
     # Map schema URIs to validators
     if 'draft/2020-12' in schema_uri:
@@ -96,94 +142,1012 @@ def show_schema_preview(schema, missing_schema_field=False):
         print(f"  {Colors.GREEN}}}{Colors.RESET}\n")
 
 
-def validate_schema_file(filename):
+class SchemaResultCache:
     """
-    Validate a JSON schema file.
+    On-disk cache of schema validation results.
+
+    Entries are keyed by the SHA-256 of the raw file bytes, the installed
+    jsonschema version and the shared $defs registry, so editing a file
+    (including its $schema, which selects the draft), upgrading jsonschema or
+    changing the registry all invalidate the entry. The key is computed without
+    parsing the file.
+    The least recently used entries are evicted once max_entries is exceeded.
+    Looking entries up doesn't make the cache dirty, so a fully warm run
+    doesn't rewrite the file.
+    """
+
+    def __init__(self, path, max_entries=DEFAULT_CACHE_SIZE):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.dirty = False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CACHE_FORMAT_VERSION:
+                self.entries = OrderedDict(data.get('entries', {}))
+        except (OSError, ValueError, AttributeError):
+            # Missing or corrupt cache - start from scratch
+            self.entries = OrderedDict()
+
+    @staticmethod
+    def key_for(raw, registry=None, all_errors=False):
+        """Build the cache key for raw file bytes."""
+        digest = hashlib.sha256(raw).hexdigest()
+        key = f"{digest}:{JSONSCHEMA_VERSION}"
+        if registry is not None:
+            key += f":{registry.fingerprint()}"
+        if all_errors:
+            key += ":all-errors"
+        return key
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key, valid, output=None, record=None):
+        """
+        Store a result as decorated text output and/or a structured record.
+
+        The output is a template from render_schema_result(): the report split
+        at the file name.
+        """
+        entry = {"valid": valid}
+        if output is not None:
+            entry["output"] = output
+        if record is not None:
+            entry["record"] = record
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": CACHE_FORMAT_VERSION, "entries": self.entries}, f)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+
+def replay_cached_result(entry, filename, reporter=None):
+    """
+    Report a cached validation result for filename and return its pass/fail state.
+
+    The decorated text is printed, or with a reporter the structured record is sent to it.
+    """
+    if reporter is not None:
+        record = dict(entry["record"], file=filename)
+        reporter.record(record)
+        return record["valid"]
+    sys.stdout.write(filename.join(entry["output"]))
+    return entry["valid"]
+
+
+def read_schema_file(filename, errors=None):
+    """
+    Read and parse a JSON schema file, printing any problem.
 
     Args:
         filename: Path to the JSON schema file
+        errors: Optional list; problems are appended to it as record issues
+            instead of being printed
 
     Returns:
-        True if valid, False otherwise
+        Tuple of (raw bytes, parsed schema), or None if the file can't be used
     """
     file_path = Path(filename)
 
     # Check if file exists
     if not file_path.exists():
+        if errors is not None:
+            errors.append(issue("File not found"))
+            return None
         print(f"{Colors.RED}Error: File '{filename}' not found.{Colors.RESET}")
-        return False
+        return None
 
     # Read and parse the JSON file
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            schema = json.load(f)
+        with phase("read"):
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+        with phase("json_load"):
+            schema = json.loads(raw.decode('utf-8'))
     except json.JSONDecodeError as e:
+        if errors is not None:
+            errors.append(issue(f"Invalid JSON format: {e.msg}", line=e.lineno, column=e.colno))
+            return None
         print(f"{Colors.RED}Error: Invalid JSON format in '{filename}'{Colors.RESET}")
         print(f"  {e}")
-        return False
+        return None
     except Exception as e:
+        if errors is not None:
+            errors.append(issue(f"Error reading file: {e}"))
+            return None
         print(f"{Colors.RED}Error reading file: {e}{Colors.RESET}")
+        return None
+
+    return raw, schema
+
+
+def lookup_cached_result(filename, cache, registry=None, structured=False, all_errors=False):
+    """
+    Look a file up in the result cache without validating it.
+
+    Args:
+        structured: Only count entries holding a structured record as hits
+            (otherwise entries holding the decorated text output)
+        all_errors: Look up the result of the --all-errors mode
+
+    Returns:
+        Tuple of (cache key, cached entry). The key is None when the file can't
+        be read; the entry is None on a cache miss. The file is hashed, not parsed.
+    """
+    try:
+        with phase("read"):
+            with open(filename, 'rb') as f:
+                raw = f.read()
+    except OSError:
+        return None, None
+    with phase("cache_lookup"):
+        key = cache.key_for(raw, registry, all_errors)
+        entry = cache.get(key)
+    if entry is not None and ("record" if structured else "output") not in entry:
+        entry = None
+    return key, entry
+
+
+def validate_schema_file(filename, cache=None, registry=None, reporter=None, all_errors=False):
+    """
+    Validate a JSON schema file.
+
+    Args:
+        filename: Path to the JSON schema file
+        cache: Optional SchemaResultCache to reuse and record results
+        registry: Optional SchemaRegistry of shared $defs for resolving $refs
+        reporter: Optional report_formats.Reporter; the result is sent to it as a
+            structured record instead of being printed
+        all_errors: Report every metaschema violation instead of stopping at the first
+
+    Returns:
+        True if valid, False otherwise
+    """
+    if reporter is not None:
+        record = schema_file_record(filename, cache, registry, all_errors)
+        reporter.record(record)
+        return record["valid"]
+
+    loaded = read_schema_file(filename)
+    if loaded is None:
         return False
+    raw, schema = loaded
 
     # Get the appropriate validator for the schema
-    validator_class = get_validator_for_schema(schema)
+    with phase("select_validator"):
+        validator_class = get_validator_for_schema(schema)
+
+    if cache is None:
+        return check_schema_and_report(filename, schema, validator_class, registry, all_errors, raw)
+
+    with phase("cache_lookup"):
+        key = cache.key_for(raw, registry, all_errors)
+        entry = cache.get(key)
+    if entry is not None and "output" in entry:
+        return replay_cached_result(entry, filename)
+
+    record = evaluate_schema(schema, validator_class, registry, filename, all_errors, raw)
+    output, template = render_schema_result(record, schema, validator_class)
+    sys.stdout.write(output)
+    if template is not None:
+        cache.put(key, record["valid"], template, record)
+    return record["valid"]
+
+
+def schema_file_record(filename, cache=None, registry=None, all_errors=False):
+    """
+    Validate a JSON schema file without printing anything.
+
+    Args:
+        filename: Path to the JSON schema file
+        cache: Optional SchemaResultCache to reuse and record results
+        registry: Optional SchemaRegistry of shared $defs for resolving $refs
+        all_errors: Report every metaschema violation instead of stopping at the first
+
+    Returns:
+        Structured record (see report_formats)
+    """
+    errors = []
+    loaded = read_schema_file(filename, errors)
+    if loaded is None:
+        return make_record(filename, False, errors)
+    raw, schema = loaded
 
-    # Validate the schema
+    with phase("select_validator"):
+        validator_class = get_validator_for_schema(schema)
+
+    if cache is None:
+        return evaluate_schema(schema, validator_class, registry, filename, all_errors, raw)
+
+    with phase("cache_lookup"):
+        key = cache.key_for(raw, registry, all_errors)
+        entry = cache.get(key)
+    if entry is not None and "record" in entry:
+        return dict(entry["record"], file=filename)
+
+    record = evaluate_schema(schema, validator_class, registry, filename, all_errors, raw)
+    cache.put(key, record["valid"], record=record)
+    return record
+
+
+def metaschema_validator(validator_class):
+    """
+    The validator that checks schemas of validator_class's draft against its metaschema.
+
+    This is what check_schema() builds on every call; it is built once per draft here.
+    """
+    validator = _metaschema_validators.get(validator_class)
+    if validator is None:
+        meta_class = validator_for(validator_class.META_SCHEMA, default=validator_class)
+        validator = meta_class(validator_class.META_SCHEMA, format_checker=meta_class.FORMAT_CHECKER)
+        _metaschema_validators[validator_class] = validator
+    return validator
+
+
+_metaschema_validators = {}
+
+
+def schema_error_pointer(error):
+    """JSON pointer of the schema location a metaschema error is about."""
+    return "".join("/" + escape_pointer_token(token) for token in error.path)
+
+
+def unique_schema_errors(schema_errors):
+    """
+    Metaschema errors with repeats removed, keeping the first of each.
+
+    The 2020-12 metaschema reaches most keywords through several $dynamicRef/allOf
+    vocabulary branches, so one problem is reported once per branch; errors with the
+    same location and message are the same problem.
+    """
+    seen = set()
+    unique = []
+    for error in schema_errors:
+        key = (schema_error_pointer(error), error.message)
+        if key not in seen:
+            seen.add(key)
+            unique.append(error)
+    return unique
+
+
+def locate_issues(items, raw):
+    """
+    Fill in the line and column of issues whose location is a JSON pointer.
+
+    Args:
+        items: Issues (see report_formats); updated in place
+        raw: The raw bytes the document was parsed from
+    """
+    pointers = {item["location"] for item in items
+                if item.get("location") is not None and "line" not in item}
+    if not pointers:
+        return
+    with phase("locate_errors"):
+        positions = locate_pointers(raw.decode('utf-8'), pointers)
+    for item in items:
+        position = positions.get(item.get("location"))
+        if position is not None and "line" not in item:
+            item["line"], item["column"] = position
+
+
+def evaluate_schema(schema, validator_class, registry=None, filename=None, all_errors=False,
+                    raw=None):
+    """
+    Check a parsed schema against its metaschema and verify its $refs resolve offline.
+
+    Args:
+        schema: The parsed JSON schema
+        validator_class: Validator class from get_validator_for_schema
+        registry: Optional SchemaRegistry of shared $defs for resolving $refs
+        filename: Path of the file the schema was read from
+        all_errors: Collect every metaschema violation in one pass instead of
+            stopping at the first (the $refs are then checked as well)
+        raw: Optional raw bytes of the file; errors are then located by line and column
+
+    Returns:
+        Structured record (see report_formats)
+    """
+    errors = []
+    warnings = []
+    if not isinstance(schema, (dict, bool)):
+        errors.append(issue("Invalid JSON Schema: a schema must be a JSON object or a boolean, "
+                            f"not {json_type_name(schema)}", location=""))
+        if raw is not None:
+            locate_issues(errors, raw)
+        return make_record(filename, False, errors)
     try:
-        validator_class.check_schema(schema)
-        print(f"{Colors.GREEN}✓ Schema in '{filename}' is valid!{Colors.RESET}")
-
-        # Check schema type and print with warning color if not specified
-        schema_type = schema.get('$schema', 'Not specified')
-        if schema_type == 'Not specified':
-            print(f"\n  {Colors.ORANGE}⚠ Warning: $schema field is missing from the root of your JSON schema{Colors.RESET}")
-            print(f"  {Colors.ORANGE}├─ Location: Root level of the JSON object (typically line 1-2 in {filename}){Colors.RESET}")
-            print(f"  {Colors.ORANGE}├─ Issue: Without $schema, validators may interpret your schema differently{Colors.RESET}")
-            print(f"  {Colors.ORANGE}└─ Defaulting to: Draft 2020-12 for this validation{Colors.RESET}")
-
-            # Show example of how to fix it
-            show_schema_preview(schema, missing_schema_field=True)
-        else:
-            print(f"  Schema type: {schema_type}")
-
-        # Show which validator was used
-        validator_name = validator_class.__name__.replace('Validator', '')
-        print(f"  Validated with: {validator_name}")
-
-        if 'title' in schema:
-            print(f"  Title: {schema['title']}")
-        return True
-    except SchemaError as e:
-        print(f"{Colors.RED}✗ Invalid JSON Schema in '{filename}'{Colors.RESET}")
-        print(f"  {e.message}")
-        return False
+        with phase("check_schema"):
+            schema_errors = metaschema_validator(validator_class).iter_errors(schema)
+            if all_errors:
+                schema_errors = unique_schema_errors(schema_errors)
+            else:
+                # The most relevant error, independent of the order the metaschema yields them
+                error = best_match(schema_errors)
+                schema_errors = [] if error is None else [error]
     except Exception as e:
-        print(f"{Colors.RED}Error validating schema: {e}{Colors.RESET}")
-        return False
+        errors.append(issue(f"Error validating schema: {e}"))
+        return make_record(filename, False, errors)
+
+    for error in schema_errors:
+        errors.append(issue(f"Invalid JSON Schema: {error.message}",
+                            location=schema_error_pointer(error)))
+    if schema_errors and not all_errors:
+        if raw is not None:
+            locate_issues(errors, raw)
+        return make_record(filename, False, errors)
+
+    with phase("resolve_refs"):
+        try:
+            ref_issues = RefResolver(registry).check(schema)
+        except Exception:
+            if not errors:
+                raise
+            # An invalid schema may trip the ref walk; the metaschema errors say why
+            ref_issues = []
+    for ref_issue in ref_issues:
+        if ref_issue["severity"] == "warning":
+            warnings.append(issue(ref_issue["message"], location=ref_issue["pointer"],
+                                  suggestion="Pass the document with --defs to check this $ref"))
+        else:
+            errors.append(issue(ref_issue["message"], location=ref_issue["pointer"]))
+
+    if raw is not None and errors:
+        locate_issues(errors, raw)
+        errors.sort(key=lambda item: (item.get("line", 0), item.get("column", 0)))
+    if raw is not None and warnings:
+        locate_issues(warnings, raw)
+
+    if isinstance(schema, dict) and "$schema" not in schema:
+        warnings.append(issue("$schema field is missing from the root of your JSON schema",
+                              location="/",
+                              suggestion="Add a $schema field; defaulting to Draft 2020-12"))
+    return make_record(filename, not errors, errors, warnings)
+
+
+def json_type_name(value):
+    """The JSON type name of a parsed value, e.g. "array" for a list."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    return "array" if isinstance(value, list) else "object"
+
+
+def check_schema_and_report(filename, schema, validator_class, registry=None, all_errors=False,
+                            raw=None):
+    """
+    Check a parsed schema against its metaschema, verify its $refs resolve
+    offline and print the result.
+
+    Args:
+        filename: Path of the file the schema was read from
+        schema: The parsed JSON schema
+        validator_class: Validator class from get_validator_for_schema
+        registry: Optional SchemaRegistry of shared $defs for resolving $refs
+        all_errors: Report every metaschema violation instead of stopping at the first
+        raw: Optional raw bytes of the file, used to locate errors by line and column
+
+    Returns:
+        True if valid, False otherwise
+    """
+    record = evaluate_schema(schema, validator_class, registry, filename, all_errors, raw)
+    print_schema_result(record, schema, validator_class)
+    return record["valid"]
+
+
+def render_schema_result(record, schema, validator_class):
+    """
+    Render print_schema_result() to text, along with a template of it for the result cache.
+
+    Returns:
+        Tuple of (text, template), where template is the text split at the file
+        name (joining it with a file name gives that file's report), or None if
+        the file name can't be told apart from the rest of the report
+    """
+    reports = []
+    for name in (record["file"], FILENAME_PLACEHOLDER):
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            print_schema_result(dict(record, file=name), schema, validator_class)
+        reports.append(buffer.getvalue())
+    text = reports[0]
+    template = reports[1].split(FILENAME_PLACEHOLDER)
+    return text, (template if record["file"].join(template) == text else None)
+
+
+def print_schema_result(record, schema, validator_class):
+    """Print the decorated report of a record from evaluate_schema."""
+    filename = record["file"]
+    if not record["valid"]:
+        prefix = "Invalid JSON Schema: "
+        message = record["errors"][0]["message"]
+        if message.startswith("Error validating schema: "):
+            print(f"{Colors.RED}{message}{Colors.RESET}")
+            return
+        schema_errors = [item for item in record["errors"] if item["message"].startswith(prefix)]
+        ref_errors = [item for item in record["errors"] if not item["message"].startswith(prefix)]
+        if schema_errors:
+            count = f" ({len(schema_errors)} errors)" if len(schema_errors) > 1 else ""
+            print(f"{Colors.RED}✗ Invalid JSON Schema in '{filename}'{count}{Colors.RESET}")
+            for item in schema_errors:
+                print(f"  {describe_location(item)}: {item['message'][len(prefix):]}")
+        if ref_errors:
+            print(f"{Colors.RED}✗ Unresolved $ref(s) in '{filename}'{Colors.RESET}")
+            for item in ref_errors:
+                print(f"  {describe_location(item)}: {item['message']}")
+        return
+
+    print(f"{Colors.GREEN}✓ Schema in '{filename}' is valid!{Colors.RESET}")
+
+    # Check schema type and print with warning color if not specified
+    schema_type = schema.get('$schema', 'Not specified') if isinstance(schema, dict) else None
+    if schema_type is None:
+        print(f"  Schema type: boolean schema ({'accepts' if schema else 'rejects'} "
+              f"every instance)")
+    elif schema_type == 'Not specified':
+        print(f"\n  {Colors.ORANGE}⚠ Warning: $schema field is missing from the root of your JSON schema{Colors.RESET}")
+        print(f"  {Colors.ORANGE}├─ Location: Root level of the JSON object (typically line 1-2 in {filename}){Colors.RESET}")
+        print(f"  {Colors.ORANGE}├─ Issue: Without $schema, validators may interpret your schema differently{Colors.RESET}")
+        print(f"  {Colors.ORANGE}└─ Defaulting to: Draft 2020-12 for this validation{Colors.RESET}")
+
+        # Show example of how to fix it
+        show_schema_preview(schema, missing_schema_field=True)
+    else:
+        print(f"  Schema type: {schema_type}")
+
+    # Show which validator was used
+    validator_name = validator_class.__name__.replace('Validator', '')
+    print(f"  Validated with: {validator_name}")
+
+    if isinstance(schema, dict) and 'title' in schema:
+        print(f"  Title: {schema['title']}")
+
+    ref_warnings = [item for item in record.get("warnings", [])
+                    if item["message"].startswith("Unresolved $ref")]
+    if ref_warnings:
+        print(f"  {Colors.ORANGE}⚠ $ref(s) into documents that aren't available offline "
+              f"were not checked:{Colors.RESET}")
+        for item in ref_warnings:
+            print(f"  {Colors.ORANGE}  {describe_location(item)}: {item['message']}{Colors.RESET}")
+
+
+def describe_location(item):
+    """Where an issue is, e.g. "line 12, column 15 (/properties/id/type)"."""
+    pointer = item.get("location") or "/"
+    if item.get("line") is None:
+        return pointer
+    return f"line {item['line']}, column {item['column']} ({pointer})"
+
+
+def expand_schema_paths(patterns):
+    """
+    Expand files, directories and glob patterns into a list of schema files.
+
+    Directories are searched recursively for *.json files. Paths that match
+    nothing are kept as-is so the validator reports them as missing.
+
+    Args:
+        patterns: Iterable of file paths, directory paths or glob patterns
+
+    Returns:
+        Ordered list of unique file paths
+    """
+    files = []
+    seen = set()
+
+    def add(path):
+        key = os.path.normcase(os.path.abspath(path))
+        if key not in seen:
+            seen.add(key)
+            files.append(str(path))
+
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for path in sorted(Path(pattern).rglob('*.json')):
+                add(path)
+        elif glob.has_magic(pattern):
+            for path in sorted(glob.glob(pattern, recursive=True)):
+                if os.path.isfile(path):
+                    add(path)
+        else:
+            add(pattern)
+
+    return files
+
+
+# Shared $defs registries built once per worker process, keyed by their source paths
+_worker_registries = {}
+
+
+def _worker_registry(defs_paths):
+    """The shared $defs registry of a worker process, loaded once per defs_paths."""
+    if not defs_paths:
+        return None
+    if defs_paths not in _worker_registries:
+        _worker_registries[defs_paths] = SchemaRegistry.from_paths(defs_paths)
+    return _worker_registries[defs_paths]
+
+
+def _validate_schema_file_captured(filename, defs_paths=(), structured=False, all_errors=False):
+    """
+    Validate a schema file in a worker process.
+
+    Returns:
+        Tuple of (filename, success, output, cache value, phase timing snapshot of this
+        file), where output is the decorated text, or the structured record when
+        structured is set. The cache value is what to store in the result cache (the
+        record, or the template of the text), or None if the result shouldn't be cached.
+    """
+    TIMER.reset()
+    registry = _worker_registry(defs_paths)
+
+    if structured:
+        record = schema_file_record(filename, registry=registry, all_errors=all_errors)
+        return filename, record["valid"], record, record, TIMER.snapshot()
+
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        loaded = read_schema_file(filename)
+    if loaded is None:
+        return filename, False, buffer.getvalue(), None, TIMER.snapshot()
+    raw, schema = loaded
+    with phase("select_validator"):
+        validator_class = get_validator_for_schema(schema)
+    record = evaluate_schema(schema, validator_class, registry, filename, all_errors, raw)
+    output, template = render_schema_result(record, schema, validator_class)
+    return filename, record["valid"], output, template, TIMER.snapshot()
+
+
+def validate_schema_files(filenames, jobs=None, cache=None, defs_paths=(), reporter=None,
+                          all_errors=False):
+    """
+    Validate many schema files on a process pool, printing each result as it finishes.
+
+    Files with a cached result are reported straight away; only the misses
+    are sent to the pool.
+
+    Args:
+        filenames: List of schema file paths
+        jobs: Number of worker processes (defaults to the CPU count)
+        cache: Optional SchemaResultCache to reuse and record results
+        defs_paths: Tuple of files/directories with shared $defs for resolving $refs
+        reporter: Optional report_formats.Reporter receiving a structured record per
+            file instead of the printed report
+        all_errors: Report every metaschema violation instead of stopping at the first
+
+    Returns:
+        Tuple of (valid_count, invalid_count)
+    """
+    valid = 0
+    invalid = 0
+    pending = {}
+    registry = SchemaRegistry.from_paths(defs_paths) if defs_paths else None
+
+    for filename in filenames:
+        key, entry = (lookup_cached_result(filename, cache, registry, reporter is not None,
+                                           all_errors)
+                      if cache else (None, None))
+        if entry is None:
+            pending[filename] = key
+        elif replay_cached_result(entry, filename, reporter):
+            valid += 1
+        else:
+            invalid += 1
+
+    if not pending:
+        return valid, invalid
+
+    workers = max(1, min(jobs or os.cpu_count() or 1, len(pending)))
+
+    with phase("worker_pool"), ProcessPoolExecutor(max_workers=workers) as executor:
+        structured = reporter is not None
+        futures = {executor.submit(_validate_schema_file_captured, name, defs_paths, structured,
+                                   all_errors): name
+                   for name in pending}
+        for future in as_completed(futures):
+            try:
+                filename, success, output, cached, timings = future.result()
+                TIMER.merge(timings)
+            except Exception as e:
+                # One file crashing its worker must not cost the results of all the others
+                filename, success, cached = futures[future], False, None
+                message = f"Error validating schema: {type(e).__name__}: {e}"
+                output = (make_record(filename, False, [issue(message)]) if structured
+                          else f"{Colors.RED}✗ {message} ('{filename}'){Colors.RESET}\n")
+            if structured:
+                reporter.record(output)
+            else:
+                sys.stdout.write(output)
+                sys.stdout.flush()
+            if cached is not None and pending[filename] is not None:
+                if structured:
+                    cache.put(pending[filename], success, record=cached)
+                else:
+                    cache.put(pending[filename], success, cached)
+            if success:
+                valid += 1
+            else:
+                invalid += 1
+
+    return valid, invalid
+
+
+def check_tool_schema(index, mcp_tool, registry=None, all_errors=False, filename=None):
+    """
+    Check the inputSchema of one catalog tool against its metaschema.
+
+    Error locations are JSON pointers relative to the inputSchema. No warning is
+    given for a missing $schema: MCP tool schemas default to Draft 2020-12.
+
+    Returns:
+        Tuple of (index, structured record, seconds)
+    """
+    start = time.perf_counter()
+    name = f"tool_{index}"
+    schema = None
+    if isinstance(mcp_tool, dict):
+        name = mcp_tool.get("name", name)
+        schema = mcp_tool.get("inputSchema")
+
+    if schema is None:
+        record = make_record(filename, False, [issue("Tool has no inputSchema")], name=name)
+    elif not isinstance(schema, dict):
+        record = make_record(filename, False, [issue("inputSchema must be a JSON object")],
+                             name=name)
+    else:
+        validator_class = get_validator_for_schema(schema)
+        record = evaluate_schema(schema, validator_class, registry, filename, all_errors)
+        record = make_record(filename, record["valid"], record["errors"], name=name)
+    return index, record, time.perf_counter() - start
+
+
+def _check_tool_schemas_captured(batch, defs_paths=(), all_errors=False, filename=None):
+    """
+    Check a batch of catalog tools in a worker process.
+
+    Returns:
+        Tuple of (list of check_tool_schema results, phase timing snapshot)
+    """
+    TIMER.reset()
+    registry = _worker_registry(defs_paths)
+    results = [check_tool_schema(index, mcp_tool, registry, all_errors, filename)
+               for index, mcp_tool in batch]
+    return results, TIMER.snapshot()
+
+
+def check_catalog_tools(mcp_tools, jobs=None, defs_paths=(), all_errors=False, filename=None):
+    """
+    Check every tool's inputSchema, in parallel across worker processes.
+
+    Tools are dealt out largest schema first and striped across the batches,
+    so the slowest tools start right away and the batches take about as long
+    as each other.
+
+    Returns:
+        List of (index, structured record, seconds), in catalog order
+    """
+    workers = max(1, min(jobs or os.cpu_count() or 1, len(mcp_tools)))
+    if workers == 1:
+        registry = SchemaRegistry.from_paths(defs_paths) if defs_paths else None
+        return [check_tool_schema(index, mcp_tool, registry, all_errors, filename)
+                for index, mcp_tool in enumerate(mcp_tools)]
+
+    def size(index):
+        mcp_tool = mcp_tools[index]
+        return len(json.dumps(mcp_tool.get("inputSchema"))) if isinstance(mcp_tool, dict) else 0
+
+    order = sorted(range(len(mcp_tools)), key=size, reverse=True)
+    batch_size = max(1, min(CATALOG_BATCH_SIZE, len(order) // (workers * 4)))
+    stripes = -(-len(order) // batch_size)
+    batches = [[(index, mcp_tools[index]) for index in order[stripe::stripes]]
+               for stripe in range(stripes)]
+
+    results = []
+    with phase("worker_pool"), ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_check_tool_schemas_captured, batch, defs_paths, all_errors,
+                                   filename)
+                   for batch in batches]
+        for future in as_completed(futures):
+            batch_results, timings = future.result()
+            TIMER.merge(timings)
+            results.extend(batch_results)
+    results.sort(key=lambda result: result[0])
+    return results
+
+
+def validate_catalog_file(filename, jobs=None, defs_paths=(), reporter=None, all_errors=False):
+    """
+    Validate the inputSchema of every tool in a tools/list dump against its metaschema.
+
+    Args:
+        filename: Path to the tools/list dump
+        jobs: Number of worker processes (defaults to the CPU count)
+        defs_paths: Tuple of files/directories with shared $defs for resolving $refs
+        reporter: Optional report_formats.Reporter receiving a structured record per
+            tool instead of the printed report
+        all_errors: Report every metaschema violation instead of stopping at the first
+
+    Returns:
+        Tuple of (valid_count, invalid_count) of tools; a file that can't be read
+        counts as one invalid
+    """
+    errors = [] if reporter is not None else None
+    loaded = read_schema_file(filename, errors)
+    if loaded is None:
+        if reporter is not None:
+            reporter.record(make_record(filename, False, errors))
+        return 0, 1
+    raw, document = loaded
+
+    mcp_tools = extract_mcp_tools(document) if isinstance(document, (dict, list)) else None
+    if not isinstance(mcp_tools, list) or not mcp_tools:
+        message = "No tools found (expected result.tools, tools, or an array of tools)"
+        if reporter is not None:
+            reporter.record(make_record(filename, False, [issue(message)]))
+        else:
+            print(f"{Colors.RED}✗ {message} in '{filename}'{Colors.RESET}")
+        return 0, 1
+
+    start = time.perf_counter()
+    results = check_catalog_tools(mcp_tools, jobs, defs_paths, all_errors, filename)
+    elapsed = time.perf_counter() - start
+
+    # Locations are relative to each inputSchema; make them point into the file
+    located = []
+    for index, record, _ in results:
+        prefix = f"{mcp_tool_pointer(document, index)}/inputSchema"
+        for item in record["errors"]:
+            if item.get("location") is not None:
+                item["location"] = prefix + item["location"]
+                located.append(item)
+    locate_issues(located, raw)
+
+    valid = sum(1 for _, record, _ in results if record["valid"])
+    invalid = len(results) - valid
+    if reporter is not None:
+        for _, record, _ in results:
+            reporter.record(record)
+        return valid, invalid
+
+    print(f"Checking {len(results)} tool inputSchema(s) in '{filename}'")
+    for _, record, seconds in results:
+        if record["valid"]:
+            print(f"{Colors.GREEN}✓ {record['name']}{Colors.RESET} ({seconds * 1000:.1f} ms)")
+            continue
+        print(f"{Colors.RED}✗ {record['name']}{Colors.RESET} ({seconds * 1000:.1f} ms)")
+        for item in record["errors"]:
+            message = item["message"]
+            if message.startswith("Invalid JSON Schema: "):
+                message = message[len("Invalid JSON Schema: "):]
+            where = describe_location(item) if item.get("location") is not None else None
+            print(f"  {where}: {message}" if where else f"  {message}")
+
+    slowest = sorted(results, key=lambda result: result[2], reverse=True)[:SLOWEST_TOOLS_SHOWN]
+    print("-" * 40)
+    color = Colors.GREEN if invalid == 0 else Colors.RED
+    print(f"{color}{len(results)} tool schema(s) checked in {elapsed:.2f}s: {valid} valid, "
+          f"{invalid} invalid{Colors.RESET}")
+    print("  Slowest: " + ", ".join(f"{record['name']} ({seconds * 1000:.1f} ms)"
+                                    for _, record, seconds in slowest))
+    return valid, invalid
+
+
+def watch_roots(patterns):
+    """Return the directories to watch for a list of files, directories and glob patterns."""
+    roots = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            root = pattern
+        elif glob.has_magic(pattern):
+            # Watch the longest directory prefix without wildcards
+            parts = Path(pattern).parts
+            prefix = []
+            for part in parts:
+                if glob.has_magic(part):
+                    break
+                prefix.append(part)
+            root = str(Path(*prefix)) if prefix else '.'
+        else:
+            root = os.path.dirname(pattern) or '.'
+        if os.path.isdir(root):
+            roots.append(os.path.abspath(root))
+
+    # Nested roots are already covered by their parents
+    roots = sorted(set(roots))
+    return [root for root in roots
+            if not any(root != other and root.startswith(other.rstrip(os.sep) + os.sep)
+                       for other in roots)]
+
+
+def warm_up_validators():
+    """Load every draft's metaschema once so the first real check is as fast as the rest."""
+    for validator_class in (Draft4Validator, Draft6Validator, Draft7Validator, Draft202012Validator):
+        validator_class.check_schema({})
+
+
+def watch_schema_files(patterns, cache=None, registry=None, polling=False, all_errors=False):
+    """
+    Validate the matching schema files, then re-validate each one as soon as it changes.
+
+    Runs until interrupted. Only files that changed since the last event are
+    re-validated; the interpreter, jsonschema and the validator classes stay loaded.
+
+    Args:
+        patterns: Files, directories and glob patterns to watch
+        cache: Optional SchemaResultCache to reuse and record results
+        registry: Optional SchemaRegistry of shared $defs for resolving $refs
+        polling: Force the polling watcher even where inotify is available
+        all_errors: Report every metaschema violation instead of stopping at the first
+    """
+    warm_up_validators()
+
+    filenames = expand_schema_paths(patterns)
+    known = {os.path.abspath(name): name for name in filenames}
+    for filename in filenames:
+        validate_schema_file(filename, cache=cache, registry=registry, all_errors=all_errors)
+
+    watcher = create_watcher(watch_roots(patterns), polling=polling)
+    print("-" * 40)
+    print(f"Watching {len(known)} schema file(s) ({watcher.kind}). Press Ctrl+C to stop.")
+
+    try:
+        while True:
+            changed = watcher.wait()
+            if not changed:
+                continue
+            if any(os.path.abspath(path) not in known for path in changed):
+                # A file appeared or was renamed: refresh which files the patterns match
+                known = {os.path.abspath(name): name for name in expand_schema_paths(patterns)}
+
+            targets = sorted(known[os.path.abspath(path)] for path in changed
+                             if os.path.abspath(path) in known)
+            for filename in targets:
+                start = time.perf_counter()
+                print(f"\n[{time.strftime('%H:%M:%S')}] {filename} changed")
+                if os.path.exists(filename):
+                    validate_schema_file(filename, cache=cache, registry=registry,
+                                         all_errors=all_errors)
+                else:
+                    print(f"{Colors.ORANGE}  File was removed{Colors.RESET}")
+                print(f"  ({(time.perf_counter() - start) * 1000:.1f} ms)")
+            if cache:
+                cache.save()
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    finally:
+        watcher.close()
+        if cache:
+            with phase("cache_save"):
+                cache.save()
 
 
 def main():
     """Main function to handle command line arguments and user input."""
-    filename = None
+    parser = argparse.ArgumentParser(description="Validate JSON schema files.")
+    parser.add_argument("paths", nargs="*",
+                        help="schema files, directories (searched for *.json) or glob patterns")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="number of worker processes in batch mode (default: CPU count)")
+    parser.add_argument("--defs", action="append", default=[], metavar="PATH",
+                        help="schema, tools/list dump or directory with shared $defs used to "
+                             "resolve $refs offline (repeatable)")
+    parser.add_argument("--catalog", action="store_true",
+                        help="treat each file as a tools/list dump and check every tool's "
+                             "inputSchema in parallel (no result cache)")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and re-validate files as they change")
+    parser.add_argument("--poll", action="store_true",
+                        help="with --watch, poll for changes instead of using inotify")
+    parser.add_argument("--all-errors", action="store_true",
+                        help="report every metaschema violation in one pass, located by line "
+                             "and column, instead of stopping at the first")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="always re-validate, ignoring and not updating the result cache")
+    parser.add_argument("--cache-file", default=str(DEFAULT_CACHE_PATH),
+                        help="path of the result cache (default: %(default)s)")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE,
+                        help="maximum number of cached results before LRU eviction "
+                             "(default: %(default)s)")
+    add_format_arguments(parser)
+    add_instrumentation_arguments(parser)
+    args = parser.parse_args()
+    if args.watch and (args.format or args.quiet):
+        parser.error("--format and --quiet can't be combined with --watch")
+    if args.watch and args.catalog:
+        parser.error("--catalog can't be combined with --watch")
 
-    # Check if filename was provided as command line argument
-    if len(sys.argv) > 1:
-        filename = sys.argv[1]
-    else:
-        # Prompt user for filename
-        print("JSON Schema Validator")
-        print("-" * 40)
-        filename = input("Enter the JSON schema filename: ").strip()
+    with instrumented(args, "validate_json_schema"):
+        patterns = args.paths
+        if not patterns:
+            # Prompt user for filename
+            print("JSON Schema Validator")
+            print("-" * 40)
+            patterns = [input("Enter the JSON schema filename: ").strip()]
+
+        if not any(patterns):
+            print(f"{Colors.RED}Error: No filename provided.{Colors.RESET}")
+            sys.exit(1)
 
-    if not filename:
-        print(f"{Colors.RED}Error: No filename provided.{Colors.RESET}")
-        sys.exit(1)
+        cache = None if args.no_cache else SchemaResultCache(args.cache_file, args.cache_size)
+        defs_paths = tuple(args.defs)
 
-    # Validate the schema
-    success = validate_schema_file(filename)
+        if args.watch:
+            registry = SchemaRegistry.from_paths(defs_paths) if defs_paths else None
+            watch_schema_files([p for p in patterns if p], cache=cache, registry=registry,
+                               polling=args.poll, all_errors=args.all_errors)
+            sys.exit(0)
+
+        filenames = expand_schema_paths(p for p in patterns if p)
+        if not filenames:
+            print(f"{Colors.RED}Error: No JSON schema files matched {', '.join(patterns)}.{Colors.RESET}")
+            sys.exit(1)
+
+        reporter = create_reporter(args, "validate_json_schema")
+
+        if args.catalog:
+            valid = invalid = 0
+            for filename in filenames:
+                counts = validate_catalog_file(filename, jobs=args.jobs, defs_paths=defs_paths,
+                                               reporter=reporter, all_errors=args.all_errors)
+                valid += counts[0]
+                invalid += counts[1]
+            if reporter:
+                reporter.close()
+            elif len(filenames) > 1:
+                print("-" * 40)
+                color = Colors.GREEN if invalid == 0 else Colors.RED
+                print(f"{color}{len(filenames)} catalog(s) checked: {valid} valid, "
+                      f"{invalid} invalid tool schema(s){Colors.RESET}")
+            sys.exit(0 if invalid == 0 else 1)
+
+        # A single file keeps the plain in-process behavior
+        if len(filenames) == 1:
+            registry = SchemaRegistry.from_paths(defs_paths) if defs_paths else None
+            success = validate_schema_file(filenames[0], cache=cache, registry=registry,
+                                           reporter=reporter, all_errors=args.all_errors)
+            if reporter:
+                reporter.close()
+            if cache:
+                with phase("cache_save"):
+                    cache.save()
+            sys.exit(0 if success else 1)
+
+        valid, invalid = validate_schema_files(filenames, jobs=args.jobs, cache=cache,
+                                               defs_paths=defs_paths, reporter=reporter,
+                                               all_errors=args.all_errors)
+        if cache:
+            with phase("cache_save"):
+                cache.save()
+        if reporter:
+            reporter.close()
+            sys.exit(0 if invalid == 0 else 1)
+
+        print("-" * 40)
+        color = Colors.GREEN if invalid == 0 else Colors.RED
+        print(f"{color}{len(filenames)} schema file(s) checked: {valid} valid, {invalid} invalid{Colors.RESET}")
 
-    # Exit with appropriate status code
-    sys.exit(0 if success else 1)
+        # Exit with appropriate status code
+        sys.exit(0 if invalid == 0 else 1)
 
 
 if __name__ == "__main__":
@@ -6,11 +6,24 @@ Tests if the tool definition is accepted by OpenAI's function calling system.
 This is a real "battle test" - if OpenAI API accepts it, it's valid!
 """
 
+import argparse
+import contextlib
 import json
+import re
 import sys
 import os
+import time
 from pathlib import Path
 
+from async_validation import (DEFAULT_CHUNK_SIZE, DEFAULT_CONCURRENCY, rejection_message,
+                              validate_tools_concurrently)
+from mcp_catalog import convert_mcp_to_openai_tool, extract_mcp_tools, iter_mcp_tools
+from openai_rules import check_openai_tools
+from report_formats import add_format_arguments, create_reporter, issue, make_record
+from phase_timing import add_instrumentation_arguments, instrumented, phase, timed_iter
+from schema_refs import RefResolver, SchemaRegistry
+from verdict_cache import DEFAULT_VERDICT_CACHE_PATH, DEFAULT_VERDICT_TTL_DAYS, ToolVerdictCache
+
 # Try to load .env file from script directory
 try:
     from dotenv import load_dotenv
@@ -22,12 +35,11 @@ except ImportError:
     # python-dotenv not installed, will use system environment variables only
     pass
 
+# The openai library is only needed for live validation (not for --offline)
 try:
-    from openai import OpenAI
+    from openai import APIStatusError, AsyncOpenAI, OpenAI
 except ImportError:
-    print("Error: openai library not found.")
-    print("Install it with: pip install openai")
-    sys.exit(1)
+    OpenAI = AsyncOpenAI = None
 
 # Try to import colorama for Windows color support
 try:
@@ -37,6 +49,13 @@ try:
 except ImportError:
     HAS_COLORAMA = False
 
+# Locations of per-tool issues ("tools[3].inputSchema") and of JSON syntax errors
+TOOL_INDEX_PATTERN = re.compile(r"tools\[(\d+)\]")
+LINE_COLUMN_PATTERN = re.compile(r"^Line (\d+), Column (\d+)$")
+# Model used for validation requests (the cheapest model is enough to check tool schemas)
+DEFAULT_MODEL = "gpt-4o-mini"
+
+
 # ANSI color codes
 class Colors:
     if HAS_COLORAMA:
@@ -55,85 +74,210 @@ class Colors:
         BOLD = '\033[1m'
 
 
-def get_openai_client():
-    """Get OpenAI client with API key from environment or .env file."""
+def get_openai_client(base_url=None, use_async=False):
+    """
+    Get OpenAI client with API key from environment or .env file.
+
+    Args:
+        base_url: Optional OpenAI-compatible endpoint (e.g. a local stand-in server)
+        use_async: Return an AsyncOpenAI client; retries are left to async_validation
+    """
+    if OpenAI is None:
+        print("Error: openai library not found.", file=sys.stderr)
+        print("Install it with: pip install openai", file=sys.stderr)
+        print("Or check the tools offline with: --offline", file=sys.stderr)
+        sys.exit(1)
     api_key = os.getenv('OPENAI_API_KEY')
     if not api_key:
         script_dir = Path(__file__).parent
-        print(f"{Colors.RED}Error: OPENAI_API_KEY not found.{Colors.RESET}")
-        print(f"\nOption 1: Create a .env file in the script directory:")
-        print(f"  Location: {script_dir}/.env")
-        print(f"  Content:  OPENAI_API_KEY=sk-your-api-key-here")
-        print(f"\nOption 2: Set environment variable:")
-        print(f"  Linux/Mac: export OPENAI_API_KEY='sk-your-api-key-here'")
-        print(f"  Windows:   set OPENAI_API_KEY=sk-your-api-key-here")
+        print(f"{Colors.RED}Error: OPENAI_API_KEY not found.{Colors.RESET}", file=sys.stderr)
+        print(f"\nOption 1: Create a .env file in the script directory:", file=sys.stderr)
+        print(f"  Location: {script_dir}/.env", file=sys.stderr)
+        print(f"  Content:  OPENAI_API_KEY=sk-your-api-key-here", file=sys.stderr)
+        print(f"\nOption 2: Set environment variable:", file=sys.stderr)
+        print(f"  Linux/Mac: export OPENAI_API_KEY='sk-your-api-key-here'", file=sys.stderr)
+        print(f"  Windows:   set OPENAI_API_KEY=sk-your-api-key-here", file=sys.stderr)
         sys.exit(1)
-    return OpenAI(api_key=api_key)
+    if use_async:
+        return AsyncOpenAI(api_key=api_key, base_url=base_url, max_retries=0)
+    return OpenAI(api_key=api_key, base_url=base_url)
 
 
-def convert_mcp_to_openai_tool(mcp_tool):
+def check_tool_refs(index, mcp_tool, validation_results, resolver):
     """
-    Convert MCP tool definition to OpenAI function calling format.
+    Check offline that every $ref in a tool's inputSchema resolves.
+
+    Dangling refs are recorded as errors in validation_results.
 
     Args:
-        mcp_tool: MCP tool definition from the JSON
+        index: Position of the tool in the catalog
+        mcp_tool: MCP tool definition
+        validation_results: Validation result dictionary to extend
+        resolver: RefResolver shared across the catalog
 
     Returns:
-        OpenAI tool definition
+        True if all refs resolve, False otherwise
     """
-    return {
-        "type": "function",
-        "function": {
-            "name": mcp_tool.get("name", "unknown"),
-            "description": mcp_tool.get("description", ""),
-            "parameters": mcp_tool.get("inputSchema", {})
-        }
-    }
+    schema = mcp_tool.get("inputSchema") if isinstance(mcp_tool, dict) else None
+    if not isinstance(schema, dict):
+        return True
+    ok = True
+    for issue in resolver.check(schema):
+        ok = False
+        validation_results["errors"].append({
+            "severity": "error",
+            "location": f"tools[{index}].inputSchema{issue['pointer']}",
+            "message": f"Tool '{mcp_tool.get('name', f'tool_{index}')}': {issue['message']}",
+            "suggestion": "Add the missing definition to the tool's $defs or fix the $ref path"
+        })
+    return ok
+
+
+def submit_tools(client, tools_list, model=DEFAULT_MODEL):
+    """
+    Send tools to the API in a single request.
+
+    Args:
+        client: OpenAI client
+        tools_list: Tools in OpenAI function-calling format
+        model: Model to validate against
+
+    Returns:
+        None if the tools were accepted, otherwise the API's rejection message
 
+    Raises:
+        Any non-rejection error (authentication, network, rate limit, server error)
+    """
+    try:
+        client.chat.completions.create(
+            model=model,
+            messages=[
+                {
+                    "role": "user",
+                    "content": "Hello"
+                }
+            ],
+            tools=tools_list,
+            tool_choice="none"  # Don't actually call the tools
+        )
+        return None
+    except APIStatusError as e:
+        message = rejection_message(e)
+        if message is None:
+            raise
+        return message
+
+
+def bisect_rejected_tools(client, tools_list, error_message, model=DEFAULT_MODEL):
+    """
+    Isolate the tool(s) that make the API reject a batch.
+
+    The batch is split in halves and each half is re-submitted; only rejected
+    halves are split further, so k bad tools out of n take O(k log n) requests.
+    When both halves of a rejected group pass on their own, the group is
+    reported as failing together (e.g. duplicate names or too many tools).
 
-def validate_with_openai(json_content, filename):
+    Args:
+        client: OpenAI client
+        tools_list: Tools in OpenAI function-calling format (already rejected as a whole)
+        error_message: Rejection message of the whole batch
+        model: Model to validate against
+
+    Returns:
+        Tuple of (list of (tool positions, rejection message), number of requests made)
+    """
+    rejections = []
+    requests = 0
+    pending = [(list(range(len(tools_list))), error_message)]
+
+    while pending:
+        positions, message = pending.pop()
+        if len(positions) == 1:
+            rejections.append((positions, message))
+            continue
+        middle = len(positions) // 2
+        any_rejected = False
+        for half in (positions[:middle], positions[middle:]):
+            requests += 1
+            half_error = submit_tools(client, [tools_list[i] for i in half], model)
+            if half_error is not None:
+                any_rejected = True
+                pending.append((half, half_error))
+        if not any_rejected:
+            rejections.append((positions, message))
+
+    rejections.sort()
+    return rejections, requests
+
+
+def validate_with_openai(json_content, filename, registry=None):
     """
     Validate MCP tool JSON by actually injecting it into OpenAI API.
 
     Args:
         json_content: The parsed JSON content
         filename: Name of the file being validated
+        registry: Optional SchemaRegistry of shared $defs for resolving $refs
 
     Returns:
         Validation result dictionary
     """
-    client = get_openai_client()
+    return validate_tools_with_openai(extract_mcp_tools(json_content), filename, registry)
 
+
+def validate_tools_with_openai(mcp_tools, filename, registry=None, bisect=False, base_url=None,
+                               concurrency=None, chunk_size=DEFAULT_CHUNK_SIZE, rate=None,
+                               cache=None):
+    """
+    Validate MCP tool definitions by actually injecting them into OpenAI API.
+
+    The tools are consumed in a single pass, so mcp_tools may be a stream
+    such as mcp_catalog.iter_mcp_tools; only the converted tools are kept.
+
+    Args:
+        mcp_tools: Iterable of MCP tool definitions
+        filename: Name of the file being validated
+        registry: Optional SchemaRegistry of shared $defs for resolving $refs
+        bisect: On rejection, bisect the catalog to find the offending tool(s)
+        base_url: Optional OpenAI-compatible endpoint
+        concurrency: If set, validate chunks of chunk_size tools with up to this many
+            concurrent requests instead of sending the catalog in one request
+        chunk_size: Tools per request in concurrent mode
+        rate: Maximum requests per second in concurrent mode (None for no limit)
+        cache: Optional ToolVerdictCache; tools with a cached verdict are not re-submitted
+
+    Returns:
+        Validation result dictionary
+    """
     validation_results = {
         "isValid": True,
         "errors": [],
         "warnings": [],
         "info": [],
-        "summary": ""
+        "summary": "",
+        "tools": []
     }
 
     try:
-        # Extract tools from MCP JSON
         tools_list = []
+        tool_indices = []
+        tool_names = []
+        best_practice_warnings = []
+        refs_ok = True
+        resolver = RefResolver(registry)
 
-        # Check if it's wrapped in a result object (like the example)
-        if "result" in json_content and "tools" in json_content["result"]:
-            mcp_tools = json_content["result"]["tools"]
-        elif "tools" in json_content:
-            mcp_tools = json_content["tools"]
-        elif isinstance(json_content, list):
-            mcp_tools = json_content
-        else:
-            # Assume single tool
-            mcp_tools = [json_content]
-
-        print(f"{Colors.BLUE}🔍 Injecting {len(mcp_tools)} tool(s) into OpenAI API...{Colors.RESET}")
+        print(f"{Colors.BLUE}🔍 Injecting tool(s) into OpenAI API...{Colors.RESET}")
 
         # Convert each MCP tool to OpenAI format
         for i, mcp_tool in enumerate(mcp_tools):
+            validation_results["tools"].append(
+                mcp_tool.get("name", f"tool_{i}") if isinstance(mcp_tool, dict) else f"tool_{i}")
             try:
-                openai_tool = convert_mcp_to_openai_tool(mcp_tool)
+                with phase("convert"):
+                    openai_tool = convert_mcp_to_openai_tool(mcp_tool)
                 tools_list.append(openai_tool)
+                tool_indices.append(i)
+                tool_names.append(openai_tool['function']['name'])
                 print(f"{Colors.BLUE}  ├─ Tool {i+1}: {openai_tool['function']['name']}{Colors.RESET}")
             except Exception as e:
                 validation_results["isValid"] = False
@@ -143,6 +287,20 @@ def validate_with_openai(json_content, filename):
                     "message": f"Failed to convert MCP tool to OpenAI format: {str(e)}",
                     "suggestion": "Check that the tool has required fields: name, description, inputSchema"
                 })
+                continue
+
+            with phase("resolve_refs"):
+                refs_ok = check_tool_refs(i, mcp_tool, validation_results, resolver) and refs_ok
+
+            # Check for missing descriptions or other best practices
+            if not mcp_tool.get("description"):
+                tool_name = mcp_tool.get("name", f"tool_{i}")
+                best_practice_warnings.append({
+                    "severity": "warning",
+                    "location": f"tools[{i}].description",
+                    "message": f"Tool '{tool_name}' is missing a description",
+                    "suggestion": "Add a description to help the AI understand when to use this tool"
+                })
 
         if not tools_list:
             validation_results["isValid"] = False
@@ -154,20 +312,79 @@ def validate_with_openai(json_content, filename):
             })
             return validation_results
 
-        # Try to make a test API call with the tools to validate them
-        print(f"{Colors.BLUE}  └─ Testing with OpenAI API...{Colors.RESET}")
+        # Dangling refs are rejected by the API anyway - don't pay for the round-trip
+        if not refs_ok:
+            validation_results["isValid"] = False
+            validation_results["summary"] = "Validation failed - unresolved $ref(s) in inputSchema"
+            return validation_results
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",  # Use cheaper model for validation
-            messages=[
-                {
-                    "role": "user",
-                    "content": "Hello"
-                }
-            ],
-            tools=tools_list,
-            tool_choice="none"  # Don't actually call the tools
-        )
+        # Reuse cached per-tool verdicts; only new or changed tools are submitted
+        pending = list(range(len(tools_list)))
+        cached_rejections = []
+        if cache is not None:
+            pending = []
+            with phase("cache_lookup"):
+                for p, openai_tool in enumerate(tools_list):
+                    entry = cache.get(cache.key_for(openai_tool, DEFAULT_MODEL, base_url))
+                    if entry is None:
+                        pending.append(p)
+                    elif not entry["accepted"]:
+                        cached_rejections.append(([p], entry["message"]))
+            cached = len(tools_list) - len(pending)
+            if cached:
+                print(f"{Colors.BLUE}  ├─ {cached} tool verdict(s) reused from cache{Colors.RESET}")
+                validation_results["info"].append({
+                    "severity": "info",
+                    "message": f"{cached} of {len(tools_list)} tool verdict(s) reused from cache"
+                })
+
+        rejections = []
+        if pending:
+            submitted = [tools_list[p] for p in pending]
+
+            # Try to make a test API call with the tools to validate them
+            print(f"{Colors.BLUE}  └─ Testing {len(submitted)} tool(s) with OpenAI API...{Colors.RESET}")
+            with phase("client_setup"):
+                client = get_openai_client(base_url, use_async=concurrency is not None)
+
+            with phase("api"):
+                if concurrency is not None:
+                    rejections, message = run_concurrent_validation(client, submitted, concurrency,
+                                                                    chunk_size, rate, bisect)
+                    validation_results["info"].append({"severity": "info", "message": message})
+                elif bisect:
+                    error_message = submit_tools(client, submitted)
+                    if error_message is not None:
+                        rejections, message = run_bisection(client, submitted, error_message)
+                        validation_results["info"].append({"severity": "info", "message": message})
+                else:
+                    response = client.chat.completions.create(
+                        model=DEFAULT_MODEL,  # Use cheaper model for validation
+                        messages=[
+                            {
+                                "role": "user",
+                                "content": "Hello"
+                            }
+                        ],
+                        tools=submitted,
+                        tool_choice="none"  # Don't actually call the tools
+                    )
+
+            # Map positions in the submitted subset back to the catalog
+            rejections = [([pending[i] for i in positions], message)
+                          for positions, message in rejections]
+            if cache is not None:
+                with phase("cache_store"):
+                    store_verdicts(cache, tools_list, tool_names, pending, rejections, base_url)
+        else:
+            print(f"{Colors.BLUE}  └─ All tool verdicts cached, no API call needed{Colors.RESET}")
+
+        rejections = sorted(cached_rejections + rejections)
+        if rejections:
+            record_rejections(rejections, tool_indices, tool_names, validation_results)
+            validation_results["summary"] = (f"Validation failed - OpenAI API rejected "
+                                             f"{len(rejections)} tool(s)/group(s)")
+            return validation_results
 
         # If we got here, the tools are valid!
         validation_results["isValid"] = True
@@ -176,19 +393,19 @@ def validate_with_openai(json_content, filename):
             "severity": "info",
             "message": f"All {len(tools_list)} tool definition(s) accepted by OpenAI API"
         })
+        validation_results["warnings"].extend(best_practice_warnings)
 
-        # Check for missing descriptions or other best practices
-        for i, mcp_tool in enumerate(mcp_tools):
-            tool_name = mcp_tool.get("name", f"tool_{i}")
-
-            if not mcp_tool.get("description"):
-                validation_results["warnings"].append({
-                    "severity": "warning",
-                    "location": f"tools[{i}].description",
-                    "message": f"Tool '{tool_name}' is missing a description",
-                    "suggestion": "Add a description to help the AI understand when to use this tool"
-                })
+        return validation_results
 
+    except json.JSONDecodeError as e:
+        validation_results["isValid"] = False
+        validation_results["errors"].append({
+            "severity": "error",
+            "location": f"Line {e.lineno}, Column {e.colno}",
+            "message": f"Invalid JSON format in '{filename}': {e.msg}",
+            "suggestion": "Fix the JSON syntax of the tools/list dump"
+        })
+        validation_results["summary"] = "Validation failed - the file is not valid JSON"
         return validation_results
 
     except Exception as e:
@@ -218,6 +435,80 @@ def validate_with_openai(json_content, filename):
         return validation_results
 
 
+def record_rejections(rejections, tool_indices, tool_names, validation_results):
+    """Record one error per rejected tool (or group of tools rejected together)."""
+    validation_results["isValid"] = False
+    for positions, message in rejections:
+        names = ", ".join(f"'{tool_names[p]}'" for p in positions)
+        if len(positions) == 1:
+            location = f"tools[{tool_indices[positions[0]]}].inputSchema"
+            text = f"OpenAI API rejected tool {names}: {message}"
+            suggestion = "Check that inputSchema follows JSON Schema Draft 7 specification"
+        else:
+            location = ", ".join(f"tools[{tool_indices[p]}]" for p in positions)
+            text = f"OpenAI API rejects tools {names} only when sent together: {message}"
+            suggestion = "Check for duplicate names or per-request limits across these tools"
+        print(f"{Colors.RED}     ✗ {location}: {names}{Colors.RESET}")
+        validation_results["errors"].append({
+            "severity": "error",
+            "location": location,
+            "message": text,
+            "suggestion": suggestion
+        })
+
+
+def run_bisection(client, tools_list, error_message):
+    """
+    Bisect a rejected batch down to the offending tool(s).
+
+    Returns:
+        Tuple of (list of (tool positions, rejection message), info message)
+    """
+    print(f"{Colors.ORANGE}  └─ Batch rejected, bisecting {len(tools_list)} tool(s)...{Colors.RESET}")
+    rejections, requests = bisect_rejected_tools(client, tools_list, error_message)
+    message = f"Bisection used {requests + 1} API request(s) for {len(tools_list)} tool(s)"
+    return rejections, message
+
+
+def run_concurrent_validation(client, tools_list, concurrency, chunk_size, rate, bisect):
+    """
+    Validate chunks of tools concurrently.
+
+    Returns:
+        Tuple of (list of (tool positions, rejection message), info message)
+    """
+    start = time.perf_counter()
+    rejections, validator = validate_tools_concurrently(
+        client, tools_list, DEFAULT_MODEL, chunk_size=chunk_size, concurrency=concurrency,
+        rate=rate, bisect=bisect)
+    elapsed = time.perf_counter() - start
+    message = (f"{validator.requests} API request(s) ({validator.retries} retried) for "
+               f"{len(tools_list)} tool(s) in {elapsed:.2f}s, chunk size {chunk_size}, "
+               f"concurrency {concurrency}")
+    return rejections, message
+
+
+def store_verdicts(cache, tools_list, tool_names, submitted, rejections, base_url=None):
+    """
+    Cache the verdicts that are known per tool.
+
+    Tools outside every rejection were accepted; tools rejected on their own are
+    cached as rejected. Members of groups rejected only together are left out,
+    since their verdict depends on the rest of the request. Verdicts are keyed by
+    the endpoint (base_url) that gave them.
+    """
+    rejected = set()
+    for positions, message in rejections:
+        rejected.update(positions)
+        if len(positions) == 1:
+            p = positions[0]
+            cache.put(cache.key_for(tools_list[p], DEFAULT_MODEL, base_url), tool_names[p], False,
+                      message)
+    for p in submitted:
+        if p not in rejected:
+            cache.put(cache.key_for(tools_list[p], DEFAULT_MODEL, base_url), tool_names[p], True)
+
+
 def print_validation_results(result, filename):
     """Print validation results in a colorized, readable format."""
     if not result:
@@ -279,68 +570,248 @@ def print_validation_results(result, filename):
     return is_valid
 
 
-def validate_mcp_tool_file(filename):
+def validate_tools_offline(mcp_tools, filename, registry=None, strict=False):
+    """
+    Validate MCP tool definitions against the OpenAI function-calling rules
+    without any network access.
+
+    Args:
+        mcp_tools: Iterable of MCP tool definitions
+        filename: Name of the file being validated
+        registry: Optional SchemaRegistry of shared $defs for resolving $refs
+        strict: Also enforce the Structured Outputs (strict: true) constraints
+
+    Returns:
+        Validation result dictionary
+    """
+    print(f"{Colors.BLUE}🔍 Checking tool(s) offline against OpenAI function-calling rules...{Colors.RESET}")
+    try:
+        openai_tools = []
+        for mcp_tool in mcp_tools:
+            with phase("convert"):
+                # Entries that aren't tool objects are passed through and reported per tool
+                openai_tools.append(convert_mcp_to_openai_tool(mcp_tool)
+                                    if isinstance(mcp_tool, dict) else mcp_tool)
+    except json.JSONDecodeError as e:
+        return {
+            "isValid": False,
+            "errors": [{
+                "severity": "error",
+                "location": f"Line {e.lineno}, Column {e.colno}",
+                "message": f"Invalid JSON format in '{filename}': {e.msg}",
+                "suggestion": "Fix the JSON syntax of the tools/list dump"
+            }],
+            "warnings": [],
+            "info": [],
+            "summary": "Validation failed - the file is not valid JSON"
+        }
+    with phase("offline_rules"):
+        return check_openai_tools(openai_tools, strict=strict, registry=registry)
+
+
+def validate_mcp_tool_file(filename, registry=None, offline=False, strict=False, bisect=False,
+                           base_url=None, concurrency=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                           rate=None, cache=None, reporter=None):
     """
     Validate an MCP tool JSON file.
 
     Args:
         filename: Path to the MCP tool JSON file
+        registry: Optional SchemaRegistry of shared $defs for resolving $refs
+        offline: Check the static function-calling rules instead of calling the API
+        strict: With offline, also enforce the strict-mode constraints
+        bisect: On rejection, bisect the catalog to find the offending tool(s)
+        base_url: Optional OpenAI-compatible endpoint
+        concurrency: If set, validate chunks of tools concurrently with this many requests
+        chunk_size: Tools per request in concurrent mode
+        rate: Maximum requests per second in concurrent mode
+        cache: Optional ToolVerdictCache of per-tool API verdicts
+        reporter: Optional report_formats.Reporter; one structured record per tool is
+            sent to it instead of printing the decorated report
 
     Returns:
         True if valid, False otherwise
     """
+    options = dict(registry=registry, offline=offline, strict=strict, bisect=bisect,
+                   base_url=base_url, concurrency=concurrency, chunk_size=chunk_size,
+                   rate=rate, cache=cache)
+    if reporter is None:
+        result = validate_tool_file_result(filename, **options)
+        if result:
+            return print_validation_results(result, filename)
+        else:
+            return False
+
+    if not Path(filename).exists():
+        reporter.record(make_record(filename, False, [issue("File not found")]))
+        return False
+    # Progress output is suppressed; the records carry the results
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+        result = validate_tool_file_result(filename, **options)
+    if not result:
+        reporter.record(make_record(filename, False, [issue("Error reading file")]))
+        return False
+    for record in result_records(result, filename):
+        reporter.record(record)
+    return result["isValid"]
+
+
+def validate_tool_file_result(filename, registry=None, offline=False, strict=False, bisect=False,
+                              base_url=None, concurrency=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                              rate=None, cache=None):
+    """
+    Validate an MCP tool JSON file (see validate_mcp_tool_file for the arguments).
+
+    Returns:
+        Validation result dictionary, or None if the file can't be read
+    """
     file_path = Path(filename)
 
     # Check if file exists
     if not file_path.exists():
         print(f"{Colors.RED}Error: File '{filename}' not found.{Colors.RESET}")
-        return False
+        return None
 
-    # Read and parse the JSON file
+    print(f"{Colors.BLUE}Validating MCP Tool JSON: {filename}{Colors.RESET}")
+
+    # Stream the tools so only one raw tool definition is decoded at a time
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            json_content = json.load(f)
-    except json.JSONDecodeError as e:
-        print(f"{Colors.RED}Error: Invalid JSON format in '{filename}'{Colors.RESET}")
-        print(f"  Line {e.lineno}, Column {e.colno}: {e.msg}")
-        return False
-    except Exception as e:
+            mcp_tools = timed_iter(iter_mcp_tools(f), "json_load")
+            if offline:
+                return validate_tools_offline(mcp_tools, filename, registry, strict)
+            return validate_tools_with_openai(mcp_tools, filename, registry,
+                                              bisect=bisect, base_url=base_url,
+                                              concurrency=concurrency,
+                                              chunk_size=chunk_size, rate=rate,
+                                              cache=cache)
+    except OSError as e:
         print(f"{Colors.RED}Error reading file: {e}{Colors.RESET}")
-        return False
+        return None
 
-    print(f"{Colors.BLUE}Validating MCP Tool JSON: {filename}{Colors.RESET}")
 
-    # Validate using OpenAI
-    result = validate_with_openai(json_content, filename)
+def result_records(result, filename):
+    """
+    Split a validation result dictionary into one structured record per tool.
 
-    if result:
-        return print_validation_results(result, filename)
-    else:
-        return False
+    Errors and warnings are attributed to tools through the `tools[i]` prefixes of
+    their locations; issues that belong to no tool (invalid JSON, API failures,
+    catalog-wide limits) go into an extra record for the file itself.
+
+    Yields:
+        Structured records (see report_formats)
+    """
+    names = result.get("tools") or []
+    per_tool = [([], []) for _ in names]
+    file_errors = []
+    file_warnings = []
+    for key, index in (("errors", 0), ("warnings", 1)):
+        for item in result.get(key, []):
+            location = item.get("location") or ""
+            entry = issue(item["message"], location=location or None,
+                          suggestion=item.get("suggestion"))
+            position = LINE_COLUMN_PATTERN.match(location)
+            if position:
+                entry = issue(item["message"], line=int(position.group(1)),
+                              column=int(position.group(2)), suggestion=item.get("suggestion"))
+            tools = [int(i) for i in TOOL_INDEX_PATTERN.findall(location)]
+            tools = [i for i in tools if i < len(names)]
+            if not tools:
+                (file_errors, file_warnings)[index].append(entry)
+            for i in tools:
+                per_tool[i][index].append(entry)
+
+    for name, (errors, warnings) in zip(names, per_tool):
+        yield make_record(filename, not errors, errors, warnings, name=name)
+    if file_errors or file_warnings or not names:
+        if not names and not file_errors and not result.get("isValid"):
+            file_errors.append(issue(result.get("summary") or "Validation failed"))
+        yield make_record(filename, not file_errors, file_errors, file_warnings)
 
 
 def main():
     """Main function to handle command line arguments and user input."""
-    filename = None
-
-    # Check if filename was provided as command line argument
-    if len(sys.argv) > 1:
-        filename = sys.argv[1]
-    else:
-        # Prompt user for filename
-        print(f"{Colors.BOLD}MCP Tool JSON Validator (OpenAI-powered){Colors.RESET}")
-        print("-" * 50)
-        filename = input("Enter the MCP tool JSON filename: ").strip()
-
-    if not filename:
-        print(f"{Colors.RED}Error: No filename provided.{Colors.RESET}")
-        sys.exit(1)
-
-    # Validate the MCP tool JSON
-    success = validate_mcp_tool_file(filename)
-
-    # Exit with appropriate status code
-    sys.exit(0 if success else 1)
+    parser = argparse.ArgumentParser(description="Validate MCP tool JSON with the OpenAI API.")
+    parser.add_argument("filename", nargs="?", help="MCP tool JSON file (tools/list dump)")
+    parser.add_argument("--defs", action="append", default=[], metavar="PATH",
+                        help="schema, tools/list dump or directory with shared $defs used to "
+                             "resolve $refs offline (repeatable)")
+    parser.add_argument("--offline", action="store_true",
+                        help="check the tools against the function-calling rules locally, "
+                             "without calling the OpenAI API")
+    parser.add_argument("--strict", action="store_true",
+                        help="with --offline, also enforce the strict mode (Structured Outputs) "
+                             "constraints")
+    parser.add_argument("--bisect", action="store_true",
+                        help="when the API rejects the batch, bisect it to isolate the "
+                             "offending tool(s)")
+    parser.add_argument("--base-url", default=None,
+                        help="OpenAI-compatible API endpoint, e.g. a local stand-in server "
+                             "(default: the OpenAI API or $OPENAI_BASE_URL)")
+    parser.add_argument("-c", "--concurrency", type=int, nargs="?", const=DEFAULT_CONCURRENCY,
+                        default=None, metavar="N",
+                        help="validate the catalog in chunks with up to N concurrent requests "
+                             f"(default N: {DEFAULT_CONCURRENCY}); retries 429/5xx with backoff")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, metavar="N",
+                        help=f"tools per request with --concurrency (default: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--rate", type=float, default=None, metavar="RPS",
+                        help="with --concurrency, limit requests per second (default: no limit)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="submit every tool, ignoring and not updating the verdict cache")
+    parser.add_argument("--cache-file", default=str(DEFAULT_VERDICT_CACHE_PATH), metavar="PATH",
+                        help="per-tool verdict cache location (default: %(default)s)")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_VERDICT_TTL_DAYS, metavar="DAYS",
+                        help="re-submit tools whose cached verdict is older than DAYS "
+                             "(default: %(default)s)")
+    parser.add_argument("--invalidate", action="append", default=None, metavar="NAME",
+                        help="drop the cached verdicts of tool NAME (repeatable), then exit "
+                             "unless a file is given")
+    parser.add_argument("--clear-cache", action="store_true",
+                        help="drop all cached verdicts, then exit unless a file is given")
+    add_format_arguments(parser)
+    add_instrumentation_arguments(parser)
+    args = parser.parse_args()
+
+    with instrumented(args, "validate_mcp_openai"):
+        cache = None
+        if not args.no_cache:
+            cache = ToolVerdictCache(args.cache_file, ttl=args.cache_ttl * 86400)
+            if args.clear_cache or args.invalidate:
+                removed = cache.invalidate(None if args.clear_cache else args.invalidate)
+                cache.save()
+                print(f"Removed {removed} cached verdict(s) from {args.cache_file}")
+                if not args.filename:
+                    sys.exit(0)
+
+        filename = args.filename
+        if not filename:
+            # Prompt user for filename
+            print(f"{Colors.BOLD}MCP Tool JSON Validator (OpenAI-powered){Colors.RESET}")
+            print("-" * 50)
+            filename = input("Enter the MCP tool JSON filename: ").strip()
+
+        if not filename:
+            print(f"{Colors.RED}Error: No filename provided.{Colors.RESET}")
+            sys.exit(1)
+
+        with phase("load_defs"):
+            registry = SchemaRegistry.from_paths(args.defs) if args.defs else None
+
+        # Validate the MCP tool JSON
+        reporter = create_reporter(args, "validate_mcp_openai")
+        success = validate_mcp_tool_file(filename, registry, offline=args.offline, strict=args.strict,
+                                         bisect=args.bisect, base_url=args.base_url,
+                                         concurrency=args.concurrency, chunk_size=args.chunk_size,
+                                         rate=args.rate, cache=None if args.offline else cache,
+                                         reporter=reporter)
+        if reporter is not None:
+            reporter.close()
+        if cache is not None:
+            with phase("cache_save"):
+                cache.save()
+
+        # Exit with appropriate status code
+        sys.exit(0 if success else 1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+MCP Tool Call Argument Validator
+Validates recorded tool-call arguments against each tool's inputSchema.
+
+The tool catalog is read from a tools/list dump (like mcpTool.json). One validator
+is compiled per tool up front and reused for every record of the JSONL stream, so
+large production traffic logs can be replayed in a single streaming pass.
+
+Each JSONL record may be any of:
+    {"name": "Assets_Modify", "arguments": {...}}
+    {"method": "tools/call", "params": {"name": "Assets_Modify", "arguments": {...}}}
+    {"function": {"name": "Assets_Modify", "arguments": "{...}"}}
+
+Usage:
+    python validate_tool_calls.py mcpTool.json calls.jsonl
+    cat calls.jsonl | python validate_tool_calls.py mcpTool.json -
+    python validate_tool_calls.py mcpTool.json calls.jsonl --defs shared-defs.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+from mcp_catalog import load_mcp_tools
+from schema_refs import RefResolver, SchemaRegistry
+from validate_json_schema import Colors, get_validator_for_schema
+
+# Lines handed to a worker process at a time in parallel mode
+CHUNK_SIZE = 5000
+
+
+def compile_tool_validators(mcp_tools, registry=None):
+    """
+    Compile one validator per tool inputSchema.
+
+    Local `$ref`s such as `#/$defs/AIGD.AssetObjectRef` resolve against the
+    tool's own inputSchema, which is the validator's root resource; definitions
+    it lacks fall back to the shared `$defs` of the registry, and refs to other
+    documents resolve against the registry's documents. Nothing is fetched over
+    the network.
+
+    Args:
+        mcp_tools: List of MCP tool definitions
+        registry: Optional SchemaRegistry of shared $defs for resolving $refs
+
+    Returns:
+        Dictionary mapping tool name to a ready-to-use validator instance
+
+    Raises:
+        ValueError: if a tool's inputSchema has a $ref that can't be resolved offline
+    """
+    registry = registry or SchemaRegistry()
+    resolver = RefResolver(registry)
+    ref_registry = registry.to_referencing()
+    options = {} if ref_registry is None else {"registry": ref_registry}
+    validators = {}
+    for mcp_tool in mcp_tools:
+        name = mcp_tool.get("name", "unknown")
+        schema = registry.with_shared_defs(mcp_tool.get("inputSchema") or {})
+        validator_class = get_validator_for_schema(schema)
+        validator_class.check_schema(schema)
+        ref_issues = resolver.check(schema) if isinstance(schema, dict) else []
+        if ref_issues:
+            raise ValueError(f"tool '{name}' at {ref_issues[0]['pointer']}: "
+                             f"{ref_issues[0]['message']}")
+        validators[name] = validator_class(schema, **options)
+    return validators
+
+
+def parse_tool_call(record):
+    """
+    Extract (tool name, arguments) from a recorded tool call.
+
+    Args:
+        record: Parsed JSONL record
+
+    Returns:
+        Tuple of (name, arguments)
+
+    Raises:
+        ValueError, AttributeError or TypeError for a malformed record, including
+        one without a string name
+    """
+    if "params" in record:
+        record = record["params"]
+    elif "function" in record:
+        record = record["function"]
+
+    arguments = record.get("arguments", {})
+    if isinstance(arguments, str):
+        # OpenAI-style calls carry the arguments as a JSON string
+        arguments = json.loads(arguments) if arguments else {}
+    name = record.get("name")
+    if not isinstance(name, str):
+        raise TypeError(f"tool name must be a string, not {type(name).__name__}")
+    return name, arguments
+
+
+def validate_tool_calls(validators, lines, show_failures=10, first_lineno=1):
+    """
+    Validate a stream of JSONL tool-call records.
+
+    Args:
+        validators: Dictionary from compile_tool_validators
+        lines: Iterable of JSONL lines
+        show_failures: Number of failing records to describe in detail
+        first_lineno: Line number of the first line, used in failure details
+
+    Returns:
+        Statistics dictionary
+    """
+    calls = Counter()
+    failures = Counter()
+    unknown = Counter()
+    malformed = 0
+    details = []
+
+    for lineno, line in enumerate(lines, first_lineno):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            name, arguments = parse_tool_call(json.loads(line))
+        except (ValueError, AttributeError, TypeError):
+            malformed += 1
+            continue
+
+        validator = validators.get(name)
+        if validator is None:
+            unknown[name] += 1
+            continue
+
+        calls[name] += 1
+        # is_valid is the fast path; errors are only collected for failing records
+        if validator.is_valid(arguments):
+            continue
+
+        failures[name] += 1
+        if len(details) < show_failures:
+            error = next(validator.iter_errors(arguments))
+            location = "/".join(str(part) for part in error.absolute_path) or "(root)"
+            details.append(f"line {lineno}: {name} @ {location}: {error.message}")
+
+    return {
+        "calls": calls,
+        "failures": failures,
+        "unknown": unknown,
+        "malformed": malformed,
+        "details": details,
+    }
+
+
+def merge_statistics(total, stats, show_failures):
+    """Merge the statistics of one chunk into the running total."""
+    total["calls"].update(stats["calls"])
+    total["failures"].update(stats["failures"])
+    total["unknown"].update(stats["unknown"])
+    total["malformed"] += stats["malformed"]
+    room = show_failures - len(total["details"])
+    if room > 0:
+        total["details"].extend(stats["details"][:room])
+
+
+# Validators compiled once per worker process by _init_worker
+_worker_validators = None
+
+
+def _init_worker(mcp_tools, registry):
+    global _worker_validators
+    _worker_validators = compile_tool_validators(mcp_tools, registry)
+
+
+def _validate_chunk(first_lineno, lines, show_failures):
+    return validate_tool_calls(_worker_validators, lines, show_failures, first_lineno)
+
+
+def validate_tool_calls_parallel(mcp_tools, lines, jobs, show_failures=10, chunk_size=CHUNK_SIZE,
+                                registry=None):
+    """
+    Validate a stream of JSONL tool-call records on a process pool.
+
+    Every worker compiles the validators once; the stream is fed to the pool in
+    chunks with a bounded number of chunks in flight, so memory stays flat no
+    matter how long the stream is.
+
+    Args:
+        mcp_tools: List of MCP tool definitions
+        lines: Iterable of JSONL lines
+        jobs: Number of worker processes
+        show_failures: Number of failing records to describe in detail
+        chunk_size: Number of lines per chunk
+        registry: Optional SchemaRegistry of shared $defs for resolving $refs
+
+    Returns:
+        Statistics dictionary
+    """
+    total = {"calls": Counter(), "failures": Counter(), "unknown": Counter(),
+             "malformed": 0, "details": []}
+    in_flight = deque()
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(mcp_tools, registry)) as executor:
+        lineno = 1
+        for chunk in iter(lambda: list(islice(lines, chunk_size)), []):
+            in_flight.append(executor.submit(_validate_chunk, lineno, chunk, show_failures))
+            lineno += len(chunk)
+            if len(in_flight) >= jobs * 2:
+                merge_statistics(total, in_flight.popleft().result(), show_failures)
+        while in_flight:
+            merge_statistics(total, in_flight.popleft().result(), show_failures)
+
+    return total
+
+
+def print_statistics(stats, elapsed):
+    """Print per-tool failure counts and overall throughput."""
+    calls = stats["calls"]
+    failures = stats["failures"]
+    total = sum(calls.values())
+    failed = sum(failures.values())
+
+    for detail in stats["details"]:
+        print(f"{Colors.RED}✗ {detail}{Colors.RESET}")
+
+    print("-" * 70)
+    print(f"{'Tool':<48} {'Calls':>10} {'Failed':>10}")
+    for name, count in calls.most_common():
+        color = Colors.RED if failures[name] else Colors.GREEN
+        print(f"{color}{name:<48} {count:>10} {failures[name]:>10}{Colors.RESET}")
+    for name, count in stats["unknown"].most_common():
+        print(f"{Colors.ORANGE}{str(name) + ' (unknown tool)':<48} {count:>10} {'-':>10}{Colors.RESET}")
+    print("-" * 70)
+
+    rate = total / elapsed if elapsed > 0 else float("inf")
+    print(f"Validated {total} call(s) in {elapsed:.3f}s ({rate:,.0f} calls/s)")
+    print(f"Failed: {failed}, unknown tool: {sum(stats['unknown'].values())}, "
+          f"malformed records: {stats['malformed']}")
+
+
+def main():
+    """Main function to handle command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Validate recorded MCP tool-call arguments against each tool's inputSchema.")
+    parser.add_argument("catalog", help="tools/list dump with the tool definitions")
+    parser.add_argument("calls", help="JSONL file with recorded tool calls, or '-' for stdin")
+    parser.add_argument("--show-failures", type=int, default=10,
+                        help="number of failing records to print in detail (default: %(default)s)")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="number of worker processes; 0 uses the CPU count (default: %(default)s)")
+    parser.add_argument("--defs", action="append", default=[], metavar="PATH",
+                        help="schema, tools/list dump or directory with shared $defs used to "
+                             "resolve $refs offline (repeatable)")
+    args = parser.parse_args()
+
+    try:
+        mcp_tools = list(load_mcp_tools(args.catalog))
+    except (OSError, ValueError) as e:
+        print(f"{Colors.RED}Error reading tool catalog '{args.catalog}': {e}{Colors.RESET}")
+        sys.exit(1)
+
+    try:
+        registry = SchemaRegistry.from_paths(args.defs) if args.defs else None
+    except (OSError, ValueError) as e:
+        print(f"{Colors.RED}Error reading shared $defs: {e}{Colors.RESET}")
+        sys.exit(1)
+
+    try:
+        validators = compile_tool_validators(mcp_tools, registry)
+    except Exception as e:
+        print(f"{Colors.RED}Error compiling inputSchema validators: {e}{Colors.RESET}")
+        sys.exit(1)
+    print(f"Compiled {len(validators)} tool validator(s) from {args.catalog}")
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    def run(lines):
+        if jobs == 1:
+            return validate_tool_calls(validators, lines, args.show_failures)
+        return validate_tool_calls_parallel(mcp_tools, lines, jobs, args.show_failures,
+                                            registry=registry)
+
+    if args.calls != "-" and not Path(args.calls).exists():
+        print(f"{Colors.RED}Error: File '{args.calls}' not found.{Colors.RESET}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    if args.calls == "-":
+        stats = run(sys.stdin)
+    else:
+        with open(args.calls, 'r', encoding='utf-8') as f:
+            stats = run(f)
+    elapsed = time.perf_counter() - start
+
+    print_statistics(stats, elapsed)
+
+    failed = sum(stats["failures"].values()) + sum(stats["unknown"].values()) + stats["malformed"]
+    sys.exit(0 if failed == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Tool Verdict Cache
+On-disk cache of per-tool OpenAI API verdicts for validate_mcp_openai.py. Entries are keyed
+by the SHA-256 of the canonicalized OpenAI-format tool plus the model name and the API
+endpoint, so only new or changed tools need to be re-submitted, and verdicts of a local
+stand-in server or proxy never pass for verdicts of the OpenAI API. Entries expire after
+a configurable age and can be invalidated by tool name or cleared entirely.
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+
+DEFAULT_VERDICT_CACHE_PATH = Path(__file__).parent / '.cache' / 'validate_mcp_openai.json'
+DEFAULT_VERDICT_CACHE_SIZE = 20000
+DEFAULT_VERDICT_TTL_DAYS = 7.0
+VERDICT_CACHE_FORMAT_VERSION = 2
+# Endpoint the openai client talks to without base_url or OPENAI_BASE_URL
+DEFAULT_OPENAI_ENDPOINT = "https://api.openai.com/v1"
+
+
+def canonical_tool_json(openai_tool):
+    """Canonical JSON text of an OpenAI-format tool (sorted keys, no whitespace)."""
+    return json.dumps(openai_tool, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+
+def normalize_endpoint(base_url=None):
+    """
+    Normalized API endpoint for cache keys.
+
+    Args:
+        base_url: Endpoint given to the client; None means the one the openai
+            client picks itself (OPENAI_BASE_URL, else the OpenAI API)
+
+    Returns:
+        The endpoint URL with lowercase scheme and host and no trailing slash
+    """
+    base_url = base_url or os.environ.get("OPENAI_BASE_URL") or DEFAULT_OPENAI_ENDPOINT
+    parts = urlsplit(base_url.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'),
+                       parts.query, ''))
+
+
+class ToolVerdictCache:
+    """
+    On-disk cache of API verdicts per tool.
+
+    Only verdicts that are known per tool are stored: tools accepted as part of
+    an accepted request, and tools rejected on their own. Entries older than
+    ttl seconds are ignored and dropped; the least recently used entries are
+    evicted once max_entries is exceeded.
+    """
+
+    def __init__(self, path=DEFAULT_VERDICT_CACHE_PATH, ttl=DEFAULT_VERDICT_TTL_DAYS * 86400,
+                 max_entries=DEFAULT_VERDICT_CACHE_SIZE):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.dirty = False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == VERDICT_CACHE_FORMAT_VERSION:
+                self.entries = OrderedDict(data.get('entries', {}))
+        except (OSError, ValueError, AttributeError):
+            # Missing or corrupt cache - start from scratch
+            self.entries = OrderedDict()
+        self.prune_expired()
+
+    @staticmethod
+    def key_for(openai_tool, model, base_url=None):
+        """Build the cache key for an OpenAI-format tool validated against model at base_url."""
+        digest = hashlib.sha256(canonical_tool_json(openai_tool).encode('utf-8')).hexdigest()
+        return f"{digest}:{model}:{normalize_endpoint(base_url)}"
+
+    def is_expired(self, entry, now=None):
+        if self.ttl is None:
+            return False
+        return (now or time.time()) - entry.get("time", 0) > self.ttl
+
+    def prune_expired(self):
+        now = time.time()
+        expired = [key for key, entry in self.entries.items() if self.is_expired(entry, now)]
+        for key in expired:
+            del self.entries[key]
+        if expired:
+            self.dirty = True
+        return len(expired)
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if self.is_expired(entry):
+            del self.entries[key]
+            self.dirty = True
+            return None
+        # Recency alone doesn't justify rewriting the file; it is saved with the next change
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key, name, accepted, message=None):
+        self.entries[key] = {"name": name, "accepted": accepted, "message": message,
+                             "time": time.time()}
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self.dirty = True
+
+    def invalidate(self, names=None):
+        """
+        Drop cached verdicts.
+
+        Args:
+            names: Tool names to drop; None drops every entry
+
+        Returns:
+            Number of entries removed
+        """
+        if names is None:
+            removed = len(self.entries)
+            self.entries.clear()
+        else:
+            names = set(names)
+            keys = [key for key, entry in self.entries.items() if entry.get("name") in names]
+            for key in keys:
+                del self.entries[key]
+            removed = len(keys)
+        if removed:
+            self.dirty = True
+        return removed
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": VERDICT_CACHE_FORMAT_VERSION, "entries": self.entries}, f)
+        os.replace(tmp_path, self.path)
+        self.dirty = False